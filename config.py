@@ -9,27 +9,100 @@ Priority:
 Notes:
 - We do NOT set settings=None just because streamlit is importable.
 - .env path is pinned to this file's directory to avoid CWD issues.
+- Settings is a plain frozen dataclass read from os.environ; importing this
+  module is cheap and .env is only read when `settings` is first accessed.
+- Parsed .env values are cached in .env.cache.json, keyed by the .env mtime.
+- The st.secrets snapshot is kept in memory, keyed by the secrets.toml mtimes.
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
+import json
 import os
-from pydantic_settings import BaseSettings, SettingsConfigDict
+import sys
 
 BASE_DIR = Path(__file__).resolve().parent
+ENV_FILE = BASE_DIR / ".env"
+# Parsed .env values, stamped with the .env mtime (skips dotenv parsing on warm starts)
+ENV_CACHE_FILE = BASE_DIR / ".env.cache.json"
 
-from dotenv import load_dotenv
-load_dotenv(BASE_DIR / ".env", override=True) # override=True eski değerleri temizler
+# mtime of the .env that was last applied to os.environ (None = never loaded)
+_env_mtime_ns: Optional[int] = None
 
+# Files Streamlit reads st.secrets from (project-level first, then global)
+SECRETS_FILES = (
+    Path.cwd() / ".streamlit" / "secrets.toml",
+    Path.home() / ".streamlit" / "secrets.toml",
+)
+# (mtimes of SECRETS_FILES, plain-dict snapshot of st.secrets)
+_secrets_cache: Optional[Tuple[tuple, Dict[str, object]]] = None
 
 
+def _read_env_cache(mtime_ns: int) -> Optional[Dict[str, str]]:
+    """Return cached .env values if the cache matches the given .env mtime."""
+    try:
+        with open(ENV_CACHE_FILE, encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("mtime_ns") != mtime_ns:
+        return None
+    values = cached.get("values")
+    return values if isinstance(values, dict) else None
+
+
+def _write_env_cache(mtime_ns: int, values: Dict[str, str]) -> None:
+    """Persist parsed .env values; silently skipped on read-only deployments."""
+    tmp_path = ENV_CACHE_FILE.with_name(ENV_CACHE_FILE.name + ".tmp")
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"mtime_ns": mtime_ns, "values": values}, f)
+        os.replace(tmp_path, ENV_CACHE_FILE)
+    except OSError:
+        pass
+
+
+def _maybe_load_dotenv() -> None:
+    """Apply BASE_DIR/.env to os.environ unless this exact .env was already applied."""
+    global _env_mtime_ns
+    try:
+        mtime_ns = ENV_FILE.stat().st_mtime_ns
+    except OSError:
+        return  # no .env file: rely on the OS environment only
+    if mtime_ns == _env_mtime_ns:
+        return
+
+    values = _read_env_cache(mtime_ns)
+    if values is None:
+        from dotenv import dotenv_values
+        values = {k: v for k, v in dotenv_values(ENV_FILE, encoding="utf-8").items() if v is not None}
+        _write_env_cache(mtime_ns, values)
+
+    # Same as load_dotenv(override=True): .env values replace existing ones.
+    # Values already present (e.g. inherited by uvicorn's reload worker) are not rewritten.
+    environ = os.environ
+    for key, value in values.items():
+        if environ.get(key) != value:
+            environ[key] = value
+    _env_mtime_ns = mtime_ns
+
+
+def _in_streamlit() -> bool:
+    """Cheap check for the Streamlit runtime (no import, no exceptions)."""
+    return "streamlit.runtime" in sys.modules or bool(os.environ.get("STREAMLIT_SERVER_PORT"))
 
 
 def _get_streamlit_secrets():
     """Return st.secrets if available, else None (no crash outside Streamlit)."""
+    # Only pay for the (heavy) streamlit import when we are clearly running under it
+    if not _in_streamlit():
+        return None
     try:
         import streamlit as st
         try:
@@ -42,8 +115,56 @@ def _get_streamlit_secrets():
         return None
 
 
+def _secrets_mtimes() -> tuple:
+    mtimes = []
+    for path in SECRETS_FILES:
+        try:
+            mtimes.append(path.stat().st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+
+def _get_secrets_snapshot() -> Optional[Dict[str, object]]:
+    """Plain-dict copy of st.secrets, rebuilt only when a secrets.toml changes."""
+    global _secrets_cache
+    mtimes = _secrets_mtimes()
+    if _secrets_cache is not None and _secrets_cache[0] == mtimes:
+        return _secrets_cache[1]
+
+    secrets = _get_streamlit_secrets()
+    if not secrets:
+        return None
 
-class Settings(BaseSettings):
+    # Snapshot the Secrets proxy once; every lookup afterwards is a plain dict hit
+    try:
+        snapshot = dict(secrets)
+    except Exception:
+        snapshot = {}
+        for key in secrets:
+            try:
+                snapshot[key] = secrets[key]
+            except Exception:
+                continue
+    _secrets_cache = (mtimes, snapshot)
+    return snapshot
+
+
+# (field, env / secrets key, required, default) - required fields first
+_SETTINGS_FIELDS = (
+    ("google_api_key", "GOOGLE_API_KEY", True, None),
+    ("google_cse_id", "GOOGLE_CSE_ID", True, None),
+    ("google_gemini_api_key", "GOOGLE_GEMINI_API_KEY", False, None),
+    ("host", "HOST", False, "0.0.0.0"),
+    ("port", "PORT", False, 8000),
+    ("max_concurrency_trendyol", "MAX_CONCURRENCY_TRENDYOL", False, 10),
+    ("max_concurrency_hepsiburada", "MAX_CONCURRENCY_HEPSIBURADA", False, 3),
+    ("html_cache_ttl", "HTML_CACHE_TTL", False, 0),
+)
+
+
+@dataclass(frozen=True)
+class Settings:
     # Required
     google_api_key: str
     google_cse_id: str
@@ -55,59 +176,73 @@ class Settings(BaseSettings):
     host: str = "0.0.0.0"
     port: int = 8000
 
-    model_config = SettingsConfigDict(
-        env_file=BASE_DIR / ".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-    )
+    # Scraper concurrency (simultaneous requests per marketplace)
+    max_concurrency_trendyol: int = 10
+    max_concurrency_hepsiburada: int = 3
 
-    @classmethod
-    def from_streamlit_secrets(cls) -> Optional["Settings"]:
-        secrets = _get_streamlit_secrets()
-        if not secrets:
-            return None
+    # Raw HTML disk cache lifetime in seconds (0 = disabled; meant for dev reruns)
+    html_cache_ttl: int = 0
 
-        def get_value(key: str, default: str = "") -> str:
+    def __post_init__(self):
+        # Single conversion point for int fields (env and secrets both pass raw strings)
+        for field, _, _, default in _SETTINGS_FIELDS:
+            if not isinstance(default, int):
+                continue
             try:
-                if key in secrets:
-                    val = secrets[key]
-                    return str(val).strip() if val else default
-            except Exception:
-                pass
-            return default
+                value = int(getattr(self, field))
+            except (ValueError, TypeError):
+                value = default
+            object.__setattr__(self, field, value)
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        # One snapshot of the environment; field reads below are plain dict lookups
+        environ = dict(os.environ)
+        missing = [key for _, key, required, _ in _SETTINGS_FIELDS if required and key not in environ]
+        if missing:
+            raise ValueError(f"Missing required setting(s): {', '.join(missing)}")
 
-        google_api_key = get_value("GOOGLE_API_KEY", "")
-        google_cse_id = get_value("GOOGLE_CSE_ID", "")
+        return cls(**{field: environ.get(key, default) for field, key, _, default in _SETTINGS_FIELDS})
 
-        if not google_api_key or not google_cse_id:
+    @classmethod
+    def from_streamlit_secrets(cls) -> Optional["Settings"]:
+        snapshot = _get_secrets_snapshot()
+        if not snapshot:
             return None
 
-        gemini_key = get_value("GOOGLE_GEMINI_API_KEY", "") or None
-        host = get_value("HOST", "0.0.0.0") or "0.0.0.0"
-        try:
-            port = int(get_value("PORT", "8000") or 8000)
-        except (ValueError, TypeError):
-            port = 8000
+        values = {}
+        for field, key, required, default in _SETTINGS_FIELDS:
+            val = snapshot.get(key)
+            val = str(val).strip() if val else ""
+            if not val and required:
+                return None  # required keys come first: fail before optional lookups
+            values[field] = val or default
 
-        return cls(
-            google_api_key=google_api_key,
-            google_cse_id=google_cse_id,
-            google_gemini_api_key=gemini_key,
-            host=host,
-            port=port,
-        )
+        return cls(**values)
 
 
+@lru_cache(maxsize=1)
 def load_settings() -> Settings:
-    # 1) Streamlit secrets (if available)
-    s = Settings.from_streamlit_secrets()
-    if s:
-        return s
+    _maybe_load_dotenv()
 
-    # 2) .env / OS env via pydantic-settings
-    return Settings()
+    # 1) Streamlit secrets (only when running under Streamlit)
+    if _in_streamlit():
+        s = Settings.from_streamlit_secrets()
+        if s:
+            return s
+
+    # 2) .env / OS env (.env was applied to os.environ above)
+    return Settings.from_env()
+
+
+def __getattr__(name: str):
+    # Global settings instance: built on first access, then cached as a module global
+    if name == "settings":
+        s = load_settings()
+        globals()["settings"] = s
+        return s
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-# Global settings instance
-settings = load_settings()
+def __dir__():
+    return sorted(set(globals()) | {"settings"})
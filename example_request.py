@@ -4,11 +4,30 @@ Example script demonstrating how to use the Google Search Redirect API.
 This script shows how to make a request to the /search-and-redirect endpoint
 and handle the redirect response.
 """
-import requests
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
+# `requests` is imported on first use so importing this module stays cheap
+_requests = None
+# Shared session so repeated calls to the same server reuse the TCP connection
+_SESSION = None
+# Guards session creation when the first calls arrive concurrently from worker threads
+_SESSION_LOCK = threading.Lock()
 
-def example_request(product_name: str, marketplace: str, base_url: str = "http://localhost:8000"):
+
+def _get_session():
+    """Import requests and create the shared session on first call."""
+    global _requests, _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                import requests as _requests
+                _SESSION = _requests.Session()
+    return _SESSION
+
+
+def example_request(product_name: str, marketplace: str, base_url: str = "http://localhost:8000", verbose: bool = False):
     """
     Make a request to the search-and-redirect endpoint.
     
@@ -16,6 +35,7 @@ def example_request(product_name: str, marketplace: str, base_url: str = "http:/
         product_name: Name of the product to search for
         marketplace: Marketplace name (e.g., "Trendyol")
         base_url: Base URL of the API server
+        verbose: Print request/response details (the __main__ demo enables it)
     
     Returns:
         The redirect URL (Location header)
@@ -26,62 +46,67 @@ def example_request(product_name: str, marketplace: str, base_url: str = "http:/
         "marketplace": marketplace
     }
     
-    print(f"Searching for: '{product_name}' on '{marketplace}'")
-    print(f"Request URL: {endpoint}")
-    print(f"Parameters: {params}\n")
+    # Output is collected and written once, so concurrent calls don't interleave
+    report = []
+    if verbose:
+        report += [
+            f"Searching for: '{product_name}' on '{marketplace}'",
+            f"Request URL: {endpoint}",
+            f"Parameters: {params}\n",
+        ]
     
+    session = _get_session()
     try:
         # Don't follow redirects automatically - we want to see the redirect response
-        response = requests.get(endpoint, params=params, allow_redirects=False, timeout=10)
+        response = session.get(endpoint, params=params, allow_redirects=False, timeout=10)
         
-        if response.status_code == 302:
+        if response.status_code in (302, 307):
             redirect_url = response.headers.get('Location')
-            print(f"✅ Success! Redirect URL: {redirect_url}")
+            if verbose:
+                report.append(f"✅ Success! Redirect URL: {redirect_url}")
             return redirect_url
         else:
-            print(f"❌ Error: Status code {response.status_code}")
-            print(f"Response: {response.text}")
+            if verbose:
+                report += [f"❌ Error: Status code {response.status_code}", f"Response: {response.text}"]
             return None
             
-    except requests.exceptions.ConnectionError:
-        print("❌ Error: Could not connect to the server.")
-        print("Make sure the server is running: python main.py")
+    except _requests.exceptions.ConnectionError:
+        if verbose:
+            report += ["❌ Error: Could not connect to the server.", "Make sure the server is running: python main.py"]
         return None
-    except requests.exceptions.Timeout:
-        print("❌ Error: Request timed out")
+    except _requests.exceptions.Timeout:
+        if verbose:
+            report.append("❌ Error: Request timed out")
         return None
     except Exception as e:
-        print(f"❌ Error: {str(e)}")
+        if verbose:
+            report.append(f"❌ Error: {str(e)}")
         return None
+    finally:
+        if report:
+            sys.stdout.write("\n".join(report) + "\n")
 
 
 if __name__ == "__main__":
-    # Example 1: Canon Powershot G7X Mark III on Trendyol
+    examples = [
+        ("Canon Powershot G7X Mark III", "Trendyol"),  # Example 1
+        ("iPhone 15 Pro", "Amazon"),  # Example 2
+    ]
+    
+    # You can also provide custom arguments via command line
+    if len(sys.argv) == 3:
+        examples.append((sys.argv[1], sys.argv[2]))
+    
     print("=" * 60)
-    print("Example 1: Canon Powershot G7X Mark III on Trendyol")
+    print(f"Running {len(examples)} example requests concurrently")
     print("=" * 60)
-    example_request(
-        product_name="Canon Powershot G7X Mark III",
-        marketplace="Trendyol"
-    )
+    
+    # The requests are independent, so overlap their network waits
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        redirect_urls = list(executor.map(lambda args: example_request(*args, verbose=True), examples))
     
     print("\n" + "=" * 60)
-    print("Example 2: iPhone 15 Pro on Amazon")
+    print("Summary")
     print("=" * 60)
-    example_request(
-        product_name="iPhone 15 Pro",
-        marketplace="Amazon"
-    )
-    
-    # You can also provide custom arguments via command line
-    if len(sys.argv) == 3:
-        print("\n" + "=" * 60)
-        print(f"Custom Request: {sys.argv[1]} on {sys.argv[2]}")
-        print("=" * 60)
-        example_request(
-            product_name=sys.argv[1],
-            marketplace=sys.argv[2]
-        )
-
-
-
+    for (product_name, marketplace), redirect_url in zip(examples, redirect_urls):
+        print(f"{product_name} on {marketplace}: {redirect_url or 'failed'}")
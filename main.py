@@ -2,38 +2,212 @@
 FastAPI backend for Google Custom Search API integration.
 Provides an endpoint to search for products and redirect to the top result.
 """
-from fastapi import FastAPI, HTTPException, Query
-from fastapi.responses import RedirectResponse, HTMLResponse, JSONResponse
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import RedirectResponse, HTMLResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 import httpx
-from typing import Optional, List, Dict
+import orjson
+from typing import Optional, List, Dict, Tuple
+import hashlib
 import logging
-import pandas as pd
 import os
 import asyncio
-from urllib.parse import urlparse, parse_qs, unquote
+import random
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from urllib.parse import urlparse, parse_qs, unquote, quote
 
-from config import settings
+from openpyxl import load_workbook
+
+import config
+
+# HTTP/2 needs the optional h2 package; fall back to HTTP/1.1 keep-alive without it
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create one shared HTTP client for the app's lifetime (connection reuse across requests)."""
+    # Caps in-flight Google CSE calls from Excel batches (avoids 429 bursts on large sheets)
+    app.state.google_semaphore = asyncio.Semaphore(GOOGLE_MAX_CONCURRENCY)
+    # HTTP/2: concurrent Excel-row lookups multiplex over one TLS connection to googleapis.com
+    app.state.http = httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=100, max_connections=200)
+    )
+    try:
+        yield
+    finally:
+        await app.state.http.aclose()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Google Search Redirect API",
     description="Search Google using Custom Search API and redirect to top result",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Google Custom Search API endpoint
 GOOGLE_SEARCH_URL = "https://www.googleapis.com/customsearch/v1"
+# Max concurrent Google CSE requests issued by /process-excel
+GOOGLE_MAX_CONCURRENCY = 10
+# How long a top link is reused (server-side cache and browser/CDN Cache-Control)
+SEARCH_CACHE_TTL = 1800
+# Transient Google API statuses that are worth retrying
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
 
 
-@app.get("/", response_class=HTMLResponse)
-async def root():
-    """Simple HTML frontend for testing."""
-    return """
+class QueryCache:
+    """Small in-memory TTL cache with LRU eviction for Google CSE top links."""
+
+    def __init__(self, max_size: int = 1024, ttl: float = 1800.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+    def get(self, key: tuple) -> Optional[str]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: tuple, value: str) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+
+async def _get_with_retry(client: httpx.AsyncClient, url: str, attempts: int = 3) -> httpx.Response:
+    """
+    GET with jittered exponential backoff on transport errors and transient statuses.
+    
+    The last response (or exception) is returned/raised unchanged after the final attempt.
+    """
+    for attempt in range(attempts):
+        try:
+            response = await client.get(url)
+        except httpx.TransportError:
+            if attempt == attempts - 1:
+                raise
+            delay = 0.2 * 2 ** attempt + random.random() * 0.1
+        else:
+            if response.status_code not in RETRY_STATUS_CODES or attempt == attempts - 1:
+                return response
+            delay = 0.2 * 2 ** attempt + random.random() * 0.1
+            retry_after = response.headers.get("Retry-After")
+            if response.status_code == 429 and retry_after and retry_after.isdigit():
+                delay = min(float(retry_after), 10.0)
+        logger.warning(f"Google API request failed (attempt {attempt + 1}/{attempts}), retrying in {delay:.2f}s")
+        await asyncio.sleep(delay)
+
+
+@lru_cache(maxsize=1)
+def _google_search_prefix() -> str:
+    """Encoded CSE URL up to `q=`, read from settings once (on first search, not at import)."""
+    return (
+        f"{GOOGLE_SEARCH_URL}?key={quote(config.settings.google_api_key, safe='')}"
+        f"&cx={quote(config.settings.google_cse_id, safe='')}"
+        "&num=1&q="  # We only need the top result
+    )
+
+
+def _extract_url_param(redirect_url: str) -> Optional[str]:
+    """
+    Return the still-encoded `url=` query value of a google.com/url redirect (None if absent).
+    
+    A plain string scan covers the usual shape; urlparse/parse_qs is only the fallback.
+    """
+    idx = redirect_url.find("?url=")
+    if idx < 0:
+        idx = redirect_url.find("&url=")
+    if idx >= 0:
+        end = redirect_url.find("&", idx + 5)
+        return redirect_url[idx + 5:end if end >= 0 else None]
+    
+    params = parse_qs(urlparse(redirect_url).query)
+    if 'url' in params:
+        return params['url'][0]
+    return None
+
+
+def _unwrap_google_redirect(link: str) -> str:
+    """Google redirect URL'lerinden (google.com/url?...&url=...) gerçek URL'i çıkarır."""
+    if "google.com/url" not in link.lower():
+        return link
+    try:
+        real_url = _extract_url_param(link)
+        if real_url is not None:
+            # Çift encode edilmiş URL'leri decode et ("%25" = encode edilmiş "%", yalnızca o zaman iki tur)
+            if '%25' in real_url:
+                decoded_url = unquote(unquote(real_url))
+            elif '%' in real_url:
+                decoded_url = unquote(real_url)
+            else:
+                decoded_url = real_url
+            logger.info(f"Google redirect URL'den gerçek URL çıkarıldı: {decoded_url[:100]}...")
+            return decoded_url
+    except Exception as e:
+        logger.warning(f"Redirect URL parse hatası: {e}")
+    return link
+
+
+# Top links per (product, marketplace); get/set never await, so no lock is needed
+_search_cache = QueryCache(ttl=SEARCH_CACHE_TTL)
+
+
+async def _google_top_link(
+    client: httpx.AsyncClient, product_name: str, marketplace: str
+) -> Tuple[Optional[str], Optional[httpx.Response]]:
+    """
+    Look up the top Google CSE link for a product on a marketplace.
+    
+    Single place for caching (30 minutes), retries and google.com/url unwrapping used by
+    both endpoints.
+    
+    Returns:
+        (link, None) on success, (None, None) when there are no results and
+        (None, response) for an HTTP error status; transport errors propagate.
+    """
+    key = (product_name.lower().strip(), marketplace.lower().strip())
+    cached = _search_cache.get(key)
+    if cached is not None:
+        return cached, None
+    
+    url = _google_search_prefix() + quote(f"{product_name} {marketplace}", safe="")
+    response = await _get_with_retry(client, url)
+    if response.status_code >= 400:
+        return None, response
+    data = orjson.loads(response.content)
+    
+    if "items" not in data or len(data["items"]) == 0:
+        return None, None
+    
+    link = _unwrap_google_redirect(data["items"][0]["link"])
+    _search_cache.set(key, link)
+    return link, None
+
+
+# Static test page, built once at import instead of on every GET /
+_ROOT_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -149,6 +323,19 @@ async def root():
     </body>
     </html>
     """
+_ROOT_BYTES = _ROOT_HTML.encode("utf-8")
+_ROOT_ETAG = f'"{hashlib.md5(_ROOT_BYTES).hexdigest()}"'
+_ROOT_RESPONSE = HTMLResponse(content=_ROOT_BYTES, headers={"ETag": _ROOT_ETAG})
+_ROOT_NOT_MODIFIED = Response(status_code=304, headers={"ETag": _ROOT_ETAG})
+
+
+@app.get("/", response_class=HTMLResponse)
+async def root(request: Request):
+    """Simple HTML frontend for testing."""
+    # Repeat visitors revalidate with If-None-Match and get an empty 304
+    if request.headers.get("if-none-match") == _ROOT_ETAG:
+        return _ROOT_NOT_MODIFIED
+    return _ROOT_RESPONSE
 
 
 @app.get("/search-and-redirect")
@@ -164,7 +351,7 @@ async def search_and_redirect(
         marketplace: The marketplace name (e.g., "Trendyol")
     
     Returns:
-        HTTP 302 redirect to the top Google search result
+        HTTP 307 redirect to the top Google search result (cacheable for 30 minutes)
         
     Raises:
         HTTPException: If search fails or no results found
@@ -176,60 +363,35 @@ async def search_and_redirect(
         
         logger.info(f"Searching Google for: '{search_query}'")
         
-        # Prepare API request parameters
-        params = {
-            "key": settings.google_api_key,
-            "cx": settings.google_cse_id,
-            "q": search_query,
-            "num": 1  # We only need the top result
-        }
+        # Make request to Google Custom Search API (or serve it from the cache)
+        redirect_url, error_response = await _google_top_link(app.state.http, product_name, marketplace)
         
-        # Make request to Google Custom Search API
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(GOOGLE_SEARCH_URL, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Check if we have search results
-            if "items" not in data or len(data["items"]) == 0:
-                logger.warning(f"No search results found for: '{search_query}'")
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"No search results found for '{product_name}' on {marketplace}"
-                )
-            
-            # Extract the top result URL
-            top_result = data["items"][0]
-            redirect_url = top_result["link"]
-            
-            # Google redirect URL'lerinden gerçek URL'i çıkar
-            if "google.com/url" in redirect_url.lower():
-                try:
-                    parsed = urlparse(redirect_url)
-                    params = parse_qs(parsed.query)
-                    if 'url' in params:
-                        real_url = params['url'][0]
-                        # Çift encode edilmiş URL'leri decode et
-                        decoded_url = unquote(real_url)
-                        if '%' in decoded_url:
-                            decoded_url = unquote(decoded_url)
-                        redirect_url = decoded_url
-                        logger.info(f"Google redirect URL'den gerçek URL çıkarıldı: {redirect_url[:100]}...")
-                except Exception as e:
-                    logger.warning(f"Redirect URL parse hatası: {e}")
-            
-            logger.info(f"Redirecting to: {redirect_url}")
-            
-            # Return HTTP 302 redirect
-            return RedirectResponse(url=redirect_url, status_code=302)
-            
-    except httpx.HTTPStatusError as e:
-        logger.error(f"Google API error: {e.response.status_code} - {e.response.text}")
-        raise HTTPException(
-            status_code=502,
-            detail=f"Google API error: {e.response.status_code}"
+        if error_response is not None:
+            logger.error(f"Google API error: {error_response.status_code} - {error_response.text}")
+            raise HTTPException(
+                status_code=502,
+                detail=f"Google API error: {error_response.status_code}"
+            )
+        
+        # Check if we have search results
+        if redirect_url is None:
+            logger.warning(f"No search results found for: '{search_query}'")
+            raise HTTPException(
+                status_code=404,
+                detail=f"No search results found for '{product_name}' on {marketplace}"
+            )
+        
+        logger.info(f"Redirecting to: {redirect_url}")
+        
+        # Return HTTP 307 redirect; browsers/CDNs may reuse it for the same query string
+        return RedirectResponse(
+            url=redirect_url,
+            status_code=307,
+            headers={"Cache-Control": f"public, max-age={SEARCH_CACHE_TTL}"}
         )
+            
+    except HTTPException:
+        raise
     except httpx.TimeoutException:
         logger.error("Request to Google API timed out")
         raise HTTPException(
@@ -250,7 +412,41 @@ async def search_and_redirect(
         )
 
 
-@app.get("/process-excel")
+# Okunmuş ürün listeleri: (mutlak yol, mtime_ns, boyut) -> ürünler; dosya değişince anahtar değişir
+_xlsx_cache: Dict[tuple, List[str]] = {}
+_XLSX_CACHE_MAX_SIZE = 16
+
+
+def _load_products_from_xlsx(excel_file: str) -> List[str]:
+    """Excel dosyasının ilk sütunundaki (Product Name) boş olmayan ürün isimlerini döndürür."""
+    st = os.stat(excel_file)
+    key = (os.path.abspath(excel_file), st.st_mtime_ns, st.st_size)
+    cached = _xlsx_cache.get(key)
+    if cached is not None:
+        return cached
+    
+    # read_only: satırlar akış olarak okunur, tüm sayfa belleğe alınmaz
+    wb = load_workbook(excel_file, read_only=True, data_only=True)
+    try:
+        # İlk sütunu al (Product Name), başlık satırını atla
+        products = []
+        for (value,) in wb.active.iter_rows(min_row=2, min_col=1, max_col=1, values_only=True):
+            # Boş olmayan değerleri al
+            if value is not None:
+                product_name = str(value).strip()
+                if product_name:
+                    products.append(product_name)
+    finally:
+        wb.close()
+    
+    if len(_xlsx_cache) >= _XLSX_CACHE_MAX_SIZE:
+        # En eski kaydı at
+        _xlsx_cache.pop(next(iter(_xlsx_cache)), None)
+    _xlsx_cache[key] = products
+    return products
+
+
+@app.get("/process-excel", response_class=ORJSONResponse)
 async def process_excel_endpoint(
     marketplace: str = Query(..., description="Marketplace name (e.g., Trendyol)"),
     excel_file: str = Query(default="file.xlsx", description="Excel file path")
@@ -276,16 +472,8 @@ async def process_excel_endpoint(
         
         # Excel dosyasını oku
         try:
-            df = pd.read_excel(excel_file, engine='openpyxl')
-            # İlk sütunu al (Product Name)
-            first_column = df.iloc[:, 0]
-            # Boş olmayan değerleri al
-            products = []
-            for value in first_column:
-                if pd.notna(value):
-                    product_name = str(value).strip()
-                    if product_name:
-                        products.append(product_name)
+            # Dosya okuma bloklayıcı: event loop'u meşgul etmemek için thread'de çalıştır
+            products = await asyncio.to_thread(_load_products_from_xlsx, excel_file)
         except Exception as e:
             raise HTTPException(
                 status_code=400,
@@ -303,55 +491,39 @@ async def process_excel_endpoint(
         # Her ürün için arama yap (async)
         async def search_single_product(product_name: str):
             """Tek bir ürün için arama yapar"""
+            # try yalnızca ağ çağrısını sarar; "sonuç yok" ve HTTP hata durumları açık kontrollerle ele alınır
             try:
-                search_query = f"{product_name} {marketplace}"
-                params = {
-                    "key": settings.google_api_key,
-                    "cx": settings.google_cse_id,
-                    "q": search_query,
-                    "num": 1
-                }
-                
-                async with httpx.AsyncClient(timeout=10.0) as client:
-                    response = await client.get(GOOGLE_SEARCH_URL, params=params)
-                    response.raise_for_status()
-                    data = response.json()
-                    
-                    if "items" not in data or len(data["items"]) == 0:
-                        return {
-                            "product_name": product_name,
-                            "marketplace": marketplace,
-                            "url": None,
-                            "success": False,
-                            "error": "No search results found"
-                        }
-                    
-                    top_result = data["items"][0]
-                    return {
-                        "product_name": product_name,
-                        "marketplace": marketplace,
-                        "url": top_result["link"],
-                        "success": True,
-                        "error": None
-                    }
+                async with app.state.google_semaphore:
+                    link, error_response = await _google_top_link(app.state.http, product_name, marketplace)
             except Exception as e:
-                return {
-                    "product_name": product_name,
-                    "marketplace": marketplace,
-                    "url": None,
-                    "success": False,
-                    "error": str(e)
-                }
+                link, error = None, str(e)
+            else:
+                if error_response is not None:
+                    error = f"Google API error: {error_response.status_code}"
+                elif link is None:
+                    error = "No search results found"
+                else:
+                    error = None
+            
+            return {
+                "product_name": product_name,
+                "marketplace": marketplace,
+                "url": link,
+                "success": error is None,
+                "error": error
+            }
         
-        # Tüm ürünleri paralel olarak işle
-        tasks = [search_single_product(product) for product in products]
-        results = await asyncio.gather(*tasks)
+        # Tüm ürünleri paralel olarak işle (tekrarlanan ürünler için tek arama)
+        unique_products = list(dict.fromkeys(products))
+        tasks = [search_single_product(product) for product in unique_products]
+        by_name = dict(zip(unique_products, await asyncio.gather(*tasks)))
+        results = [by_name[product] for product in products]
         
         # Özet bilgiler
         successful = sum(1 for r in results if r["success"])
         failed = len(results) - successful
         
-        return JSONResponse({
+        return ORJSONResponse({
             "status": "completed",
             "total_products": len(products),
             "successful": successful,
@@ -369,7 +541,7 @@ async def process_excel_endpoint(
         )
 
 
-@app.get("/health")
+@app.get("/health", response_class=ORJSONResponse)
 async def health_check():
     """Health check endpoint."""
     return {
@@ -379,11 +551,15 @@ async def health_check():
 
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
     uvicorn.run(
         "main:app",
-        host=settings.host,
-        port=settings.port,
-        reload=True
+        host=config.settings.host,
+        port=config.settings.port,
+        reload=True,
+        # uvicorn[standard] ships both; uvloop has no Windows build
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools"
     )
 
@@ -9,14 +9,27 @@ import asyncio
 import logging
 from typing import List, Dict, Tuple, Optional
 import os
-import json
+import orjson
 import re
 import random
 import platform
+import time
+import functools
+import atexit
+import gzip
+import hashlib
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import quote, urlparse, parse_qs, unquote
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from difflib import SequenceMatcher
-from config import settings
+try:
+    # C++ uygulaması: difflib.SequenceMatcher'dan kat kat hızlı (yüklü değilse difflib kullanılır)
+    from rapidfuzz.fuzz import ratio as _rapidfuzz_ratio
+except ImportError:
+    _rapidfuzz_ratio = None
+import config
 
 # Selenium için import'lar (Hepsiburada için gerekli - JavaScript yüklenmesi için)
 try:
@@ -33,6 +46,29 @@ except ImportError:
     logger = logging.getLogger(__name__)
     logger.warning("⚠️  Selenium yüklü değil. Hepsiburada için JavaScript yüklenmesi gerekiyor.")
 
+# HTML parser: lxml (C eklentisi, html.parser'dan birkaç kat hızlı) yüklüyse onu kullan
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+    logger = logging.getLogger(__name__)
+    logger.warning("⚠️  lxml yüklü değil, yavaş html.parser kullanılacak. Yüklemek için: pip install lxml")
+
+# HTTP/2 (opsiyonel): httpx h2 paketi olmadan http2=True ile client oluşturamaz, yoksa HTTP/1.1'e düş
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Playwright (opsiyonel): native asyncio API ile Hepsiburada sayfalarını executor olmadan yükler
+try:
+    from playwright.async_api import async_playwright
+    USE_PLAYWRIGHT = True
+except ImportError:
+    USE_PLAYWRIGHT = False
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,  # INFO seviyesinde loglar (WARNING ve ERROR da gösterilir)
@@ -40,15 +76,77 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Selenium için global driver pool (performans için)
-_selenium_driver_pool = None
-_selenium_lock = asyncio.Lock()
+# Selenium için driver pool (performans için): birden fazla Chrome paralel sayfa yükleyebilir
+SELENIUM_POOL_SIZE = 3
+_selenium_drivers = []  # oluşturulan tüm driver'lar (kapatma için)
+_selenium_idle_drivers = queue.Queue()  # boşta bekleyen driver'lar
+_selenium_pool_lock = threading.Lock()
+# Selenium işleri için pool boyutunda ayrı thread pool (varsayılan executor'ı doldurmasın)
+_selenium_executor = ThreadPoolExecutor(max_workers=SELENIUM_POOL_SIZE, thread_name_prefix="selenium")
+
+# Selenium sayfalarında engellenen kaynaklar (sayfa yükleme süresini kısaltır)
+SELENIUM_BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.webp", "*.gif", "*.svg",
+    "*.woff2", "*.woff", "*.ttf", "*.css",
+    "*/analytics/*", "*/gtm/*", "*doubleclick*", "*google-analytics*",
+]
 
-def get_selenium_driver():
-    """Selenium WebDriver oluşturur veya pool'dan alır"""
-    global _selenium_driver_pool
+def acquire_selenium_driver(timeout: float = 60.0):
+    """
+    Pool'dan boşta bir Selenium WebDriver alır; pool dolmadıysa yenisini oluşturur.
+    Executor thread'inden çağrılır. Kullanım sonrası release_selenium_driver ile geri verilmeli.
+    """
+    if not USE_SELENIUM:
+        return None
+    try:
+        return _selenium_idle_drivers.get_nowait()
+    except queue.Empty:
+        pass
+    
+    with _selenium_pool_lock:
+        can_create = len(_selenium_drivers) < SELENIUM_POOL_SIZE
+        if can_create:
+            _selenium_drivers.append(None)  # slot'u ayır, driver lock dışında oluşturulur
+    
+    if can_create:
+        driver = _create_selenium_driver()
+        with _selenium_pool_lock:
+            _selenium_drivers.remove(None)
+            if driver:
+                _selenium_drivers.append(driver)
+        return driver
     
-    if _selenium_driver_pool is None and USE_SELENIUM:
+    # Pool dolu: başka bir işin driver'ı geri vermesini bekle
+    try:
+        return _selenium_idle_drivers.get(timeout=timeout)
+    except queue.Empty:
+        logger.warning(f"Selenium: {timeout}s içinde boşta driver bulunamadı")
+        return None
+
+def release_selenium_driver(driver):
+    """
+    Driver'ı cookie'lerini temizleyip yeniden kullanılmak üzere pool'a geri verir.
+    Yanıt vermeyen (çökmüş) driver pool'dan çıkarılır; yerine ihtiyaç olduğunda yenisi oluşturulur.
+    """
+    if driver is None:
+        return
+    try:
+        driver.delete_all_cookies()
+    except Exception as e:
+        logger.debug(f"Selenium: driver yanıt vermiyor, pool'dan çıkarılıyor: {str(e)[:50]}")
+        with _selenium_pool_lock:
+            if driver in _selenium_drivers:
+                _selenium_drivers.remove(driver)
+        try:
+            driver.quit()
+        except:
+            pass
+        return
+    _selenium_idle_drivers.put(driver)
+
+def _create_selenium_driver():
+    """Yeni bir Selenium WebDriver oluşturur (başarısız olursa None)"""
+    if USE_SELENIUM:
         try:
             # Streamlit Cloud ortamını algıla
             is_streamlit_cloud = False
@@ -103,6 +201,12 @@ def get_selenium_driver():
             chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
             chrome_options.add_experimental_option('useAutomationExtension', False)
             chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+            # Resim ve bildirimleri kapat, DOMContentLoaded sonrası driver.get dönsün (fiyat için yeterli)
+            chrome_options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.notifications": 2,
+            })
+            chrome_options.page_load_strategy = "eager"
             
             # Service ayarları - Streamlit Cloud için özel path'ler dene
             service = None
@@ -175,7 +279,13 @@ def get_selenium_driver():
                 '''
             })
             
-            _selenium_driver_pool = driver
+            # Fiyatla ilgisi olmayan kaynakları (resim, font, CSS, tracking) hiç indirme
+            try:
+                driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': SELENIUM_BLOCKED_URLS})
+                driver.execute_cdp_cmd('Network.enable', {})
+            except Exception as e:
+                logger.debug(f"Selenium: Kaynak engelleme ayarlanamadı: {e}")
+            
             logger.info("✅ Selenium WebDriver oluşturuldu")
             
             # Streamlit Cloud'ta başarı mesajını Streamlit'e de göster
@@ -185,6 +295,8 @@ def get_selenium_driver():
                     st.success("✅ Selenium WebDriver başarıyla başlatıldı!")
                 except:
                     pass
+            
+            return driver
                     
         except Exception as e:
             error_msg = f"⚠️  Selenium WebDriver oluşturulamadı: {e}"
@@ -199,19 +311,287 @@ def get_selenium_driver():
             
             return None
     
-    return _selenium_driver_pool
+    return None
 
 def close_selenium_driver():
-    """Selenium WebDriver'ı kapatır"""
-    global _selenium_driver_pool
-    if _selenium_driver_pool:
+    """Pool'daki tüm Selenium WebDriver'ları kapatır"""
+    with _selenium_pool_lock:
+        drivers = [d for d in _selenium_drivers if d is not None]
+        _selenium_drivers[:] = [d for d in _selenium_drivers if d is None]
+    while True:
+        try:
+            _selenium_idle_drivers.get_nowait()
+        except queue.Empty:
+            break
+    for driver in drivers:
         try:
-            _selenium_driver_pool.quit()
-            _selenium_driver_pool = None
+            driver.quit()
             logger.info("✅ Selenium WebDriver kapatıldı")
         except:
             pass
 
+# Streamlit gibi close_selenium_driver'ı çağırmayan süreçlerde Chrome process'leri açık kalmasın
+atexit.register(close_selenium_driver)
+
+# Paylaşılan httpx client (bağlantı ve TLS oturumu yeniden kullanımı için)
+_http_client = None
+_http_client_loop = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """Çalışan event loop için paylaşılan httpx.AsyncClient'ı döndürür (yoksa oluşturur)"""
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    # Streamlit her çalıştırmada yeni bir event loop açar; başka loop'a bağlı client kullanılamaz
+    if _http_client is None or _http_client_loop is not loop or _http_client.is_closed:
+        # HTTP/2: aynı host'a giden eşzamanlı istekler tek TLS bağlantısında çoğullanır
+        _http_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=100)
+        )
+        _http_client_loop = loop
+    return _http_client
+
+async def close_http_client():
+    """Paylaşılan httpx client'ı kapatır"""
+    global _http_client, _http_client_loop
+    if _http_client is not None and _http_client_loop is asyncio.get_running_loop():
+        try:
+            await _http_client.aclose()
+            logger.info("✅ HTTP client kapatıldı")
+        except:
+            pass
+    _http_client = None
+    _http_client_loop = None
+
+# Paylaşılan Playwright tarayıcısı (event loop başına bir Chromium, sayfa başına yeni context)
+_playwright = None
+_playwright_browser = None
+_playwright_loop = None
+_playwright_launch_failed = False
+# Başlatma kilidi: eşzamanlı ilk çağrılar ayrı Chromium'lar başlatıp birbirini ezmesin
+# (Lock event loop'a bağlı olduğundan semaphore'lar gibi loop başına oluşturulur)
+_playwright_lock = None
+_playwright_lock_loop = None
+
+# Playwright sayfalarında engellenen kaynaklar
+PLAYWRIGHT_BLOCKED_ROUTE = "**/*.{png,jpg,jpeg,webp,gif,svg,css,woff,woff2,ttf}"
+
+def _get_playwright_lock() -> asyncio.Lock:
+    """Çalışan event loop için Playwright başlatma kilidini döndürür"""
+    global _playwright_lock, _playwright_lock_loop
+    loop = asyncio.get_running_loop()
+    if _playwright_lock is None or _playwright_lock_loop is not loop:
+        _playwright_lock = asyncio.Lock()
+        _playwright_lock_loop = loop
+    return _playwright_lock
+
+def _playwright_browser_ready(loop) -> bool:
+    """Paylaşılan Chromium bu loop'a ait ve bağlı mı"""
+    return _playwright_browser is not None and _playwright_loop is loop and _playwright_browser.is_connected()
+
+async def get_playwright_browser():
+    """Çalışan event loop için paylaşılan Chromium'u döndürür (başlatılamazsa None)"""
+    if not USE_PLAYWRIGHT or _playwright_launch_failed:
+        return None
+    loop = asyncio.get_running_loop()
+    if _playwright_browser_ready(loop):
+        return _playwright_browser
+    async with _get_playwright_lock():
+        # Kilidi beklerken başka bir çağrı tarayıcıyı başlatmış (veya başlatamamış) olabilir
+        if _playwright_launch_failed:
+            return None
+        if not _playwright_browser_ready(loop):
+            await _launch_playwright_browser(loop)
+        return _playwright_browser
+
+async def _launch_playwright_browser(loop):
+    """Eski instance'ı durdurup yeni Playwright + Chromium başlatır (kilit altında çağrılır)"""
+    global _playwright, _playwright_browser, _playwright_loop, _playwright_launch_failed
+    # Önceki loop'un (veya bağlantısı kopan) Playwright instance'ı durdurulur; driver process'i açık kalmasın
+    if _playwright is not None:
+        try:
+            await _playwright.stop()
+        except Exception:
+            pass
+        _playwright = None
+        _playwright_browser = None
+    try:
+        _playwright = await async_playwright().start()
+        _playwright_browser = await _playwright.chromium.launch(headless=True, args=["--no-sandbox"])
+        _playwright_loop = loop
+        logger.info("✅ Playwright Chromium başlatıldı")
+    except Exception as e:
+        # Tarayıcı kurulu değilse (playwright install chromium) her URL'de tekrar denememek için işaretle
+        logger.warning(f"⚠️  Playwright başlatılamadı, Selenium kullanılacak: {e}")
+        _playwright_launch_failed = True
+        if _playwright is not None:
+            try:
+                await _playwright.stop()
+            except Exception:
+                pass
+            _playwright = None
+
+async def close_playwright_browser():
+    """Paylaşılan Playwright tarayıcısını kapatır"""
+    global _playwright, _playwright_browser, _playwright_loop
+    if _playwright_browser is not None and _playwright_loop is asyncio.get_running_loop():
+        try:
+            await _playwright_browser.close()
+            await _playwright.stop()
+            logger.info("✅ Playwright tarayıcısı kapatıldı")
+        except:
+            pass
+    _playwright = None
+    _playwright_browser = None
+    _playwright_loop = None
+
+# Site başına eşzamanlı scrape sınırı (429 / bağlantı tükenmesini önlemek için)
+# Semaphore'lar event loop'a bağlı olduğundan client gibi loop başına oluşturulur
+_scrape_semaphores: Dict[str, asyncio.Semaphore] = {}
+_scrape_semaphores_loop = None
+
+def get_scrape_semaphore(site: str) -> asyncio.Semaphore:
+    """Çalışan event loop için site ('trendyol' / 'hepsiburada') semaphore'unu döndürür"""
+    global _scrape_semaphores, _scrape_semaphores_loop
+    loop = asyncio.get_running_loop()
+    if _scrape_semaphores_loop is not loop:
+        _scrape_semaphores = {}
+        _scrape_semaphores_loop = loop
+    semaphore = _scrape_semaphores.get(site)
+    if semaphore is None:
+        limit = getattr(config.settings, f"max_concurrency_{site}")
+        semaphore = _scrape_semaphores[site] = asyncio.Semaphore(max(1, limit))
+    return semaphore
+
+# Ham HTML için disk cache'i (geliştirme / tekrar çalıştırmalar için; HTML_CACHE_TTL > 0 ise açık)
+# Dosyalar URL'in sha1'i ile adlandırılır ve gzip ile sıkıştırılır, TTL dosya mtime'ına göre kontrol edilir
+HTML_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".htmlcache")
+
+def _html_cache_file(url: str) -> str:
+    return os.path.join(HTML_CACHE_DIR, hashlib.sha1(url.encode('utf-8')).hexdigest() + ".html.gz")
+
+def read_html_cache(url: str) -> Optional[str]:
+    """URL için TTL süresi dolmamış cache'lenmiş HTML'i döndürür (cache kapalıysa veya yoksa None)"""
+    ttl = config.settings.html_cache_ttl
+    if ttl <= 0:
+        return None
+    path = _html_cache_file(url)
+    try:
+        if time.time() - os.path.getmtime(path) > ttl:
+            return None
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            return f.read()
+    except (OSError, EOFError):
+        return None
+
+def write_html_cache(url: str, html: str):
+    """HTML'i disk cache'ine yazar (cache kapalıysa hiçbir şey yapmaz)"""
+    if config.settings.html_cache_ttl <= 0:
+        return
+    path = _html_cache_file(url)
+    tmp_path = path + ".tmp"
+    try:
+        os.makedirs(HTML_CACHE_DIR, exist_ok=True)
+        with gzip.open(tmp_path, 'wt', encoding='utf-8', compresslevel=6) as f:
+            f.write(html)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug(f"HTML cache yazılamadı: {e}")
+
+class RateLimiter:
+    """
+    Domain başına istek hızı sınırlayıcı: istekleri period / rate aralıklarla sıraya dizer.
+    Sabit sleep yerine düzenli bir istek temposu sağlar (bot algılama / 429 riskini azaltır).
+    Loop'a bağlı bir primitive kullanmadığı için modül seviyesinde paylaşılabilir.
+    """
+    
+    def __init__(self, rate: float, period: float = 1.0):
+        self.base_interval = self.interval = period / rate
+        self.success_rate = 1.0  # hareketli (EWMA) başarı oranı
+        self._next_slot = 0.0
+    
+    def record(self, success: bool):
+        """İstek sonucunu kaydeder; başarı oranı %50'nin altındaysa tempo yavaşlar, düzelince geri hızlanır"""
+        self.success_rate = 0.8 * self.success_rate + 0.2 * (1.0 if success else 0.0)
+        if self.success_rate < 0.5:
+            self.interval = min(self.interval * 2, self.base_interval * 16)
+        elif self.interval > self.base_interval:
+            self.interval = max(self.base_interval, self.interval / 2)
+    
+    async def __aenter__(self):
+        now = time.monotonic()
+        wait = self._next_slot - now
+        self._next_slot = max(now, self._next_slot) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+# Trendyol: saniyede en fazla 5 istek
+_TRENDYOL_THROTTLE = RateLimiter(rate=5, period=1.0)
+
+# Retry bekleme süreleri (saniye)
+RETRY_MAX_DELAY = 10.0
+RETRY_STATUS_CODES = (429, 503)
+
+def _retry_delay(attempt: int, error: Exception = None) -> float:
+    """
+    Sonraki deneme öncesi bekleme: 429/503 yanıtında Retry-After'a uyulur,
+    aksi halde exponential backoff + jitter (en fazla RETRY_MAX_DELAY).
+    """
+    if isinstance(error, httpx.HTTPStatusError) and error.response.status_code in RETRY_STATUS_CODES:
+        retry_after = error.response.headers.get('Retry-After', '').strip()
+        if retry_after.isdigit():
+            return min(float(retry_after), RETRY_MAX_DELAY)
+    return min(2 ** attempt + random.random(), RETRY_MAX_DELAY)
+
+# Başarılı fiyat sonuçları için bellek içi TTL + LRU cache: (fonksiyon, url, argümanlar) -> (kayıt zamanı, sonuç)
+PRICE_CACHE_TTL = 3600
+PRICE_CACHE_MAXSIZE = 1024
+_price_cache: Dict[Tuple, Tuple[float, Dict]] = {}
+# Devam eden çekimler: aynı anahtar için eşzamanlı çağrılar tek bir isteği paylaşır
+_price_inflight: Dict[Tuple, asyncio.Task] = {}
+
+def ttl_cache(seconds: float = PRICE_CACHE_TTL, maxsize: int = PRICE_CACHE_MAXSIZE):
+    """
+    Async fiyat çekme fonksiyonlarının başarılı sonuçlarını (fonksiyon, URL, diğer argümanlar)
+    anahtarıyla `seconds` süresince saklar; böylece farklı extractor'lar veya farklı proxy ile
+    yapılan çağrılar birbirinin sonucunu almaz. Cache en fazla `maxsize` kayıt tutar (en eski
+    kullanılan atılır); aynı anahtar için devam eden bir çekim varsa yeni çağrı onun sonucunu bekler.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(url: str, *args, **kwargs):
+            key = (func.__qualname__, url, args, frozenset(kwargs.items()))
+            cached = _price_cache.pop(key, None)
+            if cached is not None and time.monotonic() - cached[0] < seconds:
+                _price_cache[key] = cached  # LRU: en yeni kullanılan olarak sona taşı
+                logger.debug(f"Fiyat cache'ten alındı: {url[:80]}")
+                return dict(cached[1])
+            
+            task = _price_inflight.get(key)
+            if task is None or task.get_loop() is not asyncio.get_running_loop():
+                task = asyncio.ensure_future(func(url, *args, **kwargs))
+                _price_inflight[key] = task
+                task.add_done_callback(
+                    lambda t: _price_inflight.pop(key, None) if _price_inflight.get(key) is t else None
+                )
+            else:
+                logger.debug(f"Aynı URL için devam eden çekim bekleniyor: {url[:80]}")
+            result = await asyncio.shield(task)
+            
+            # Sadece başarılı sonuçlar saklanır; başarısızlar bir sonraki çağrıda tekrar denenir
+            if result.get('success'):
+                _price_cache[key] = (time.monotonic(), dict(result))
+                while len(_price_cache) > maxsize:
+                    _price_cache.pop(next(iter(_price_cache)))
+            return dict(result)
+        return wrapper
+    return decorator
+
 # Bot koruması için curl_cffi veya cloudscraper kullan
 USE_CURL_CFFI = False
 USE_CLOUDSCRAPER = False
@@ -250,6 +630,35 @@ except Exception as e:
         USE_CLOUDSCRAPER = False
         USE_CURL_CFFI = False
 
+# curl_cffi session'ları ve cloudscraper instance'ları proxy başına tekrar kullanılır
+# (TLS oturumu ve Cloudflare cookie'leri korunur). Session'lar thread-safe olmadığı için
+# her executor thread'i kendi kopyasını tutar.
+_bot_sessions = threading.local()
+
+
+def _get_bot_session(proxy: Optional[str] = None):
+    """Çağıran thread için proxy'ye ait curl_cffi session'ını veya cloudscraper'ı döndürür"""
+    sessions = getattr(_bot_sessions, 'by_proxy', None)
+    if sessions is None:
+        sessions = _bot_sessions.by_proxy = {}
+    session = sessions.get(proxy or '')
+    if session is None:
+        # Proxy desteği
+        proxies = {'http': proxy, 'https': proxy} if proxy else None
+        if USE_CURL_CFFI and curl_requests is not None:
+            # Güncel bir browser taklidi
+            session = curl_requests.Session(impersonate='chrome110', proxies=proxies)
+        else:
+            scraper_kwargs = {
+                'browser': {'browser': 'chrome', 'platform': 'darwin', 'desktop': True}
+            }
+            if proxies:
+                scraper_kwargs['proxies'] = proxies
+            session = cloudscraper.create_scraper(**scraper_kwargs)
+        sessions[proxy or ''] = session
+    return session
+
+
 # Google Custom Search API endpoint
 GOOGLE_SEARCH_URL = "https://www.googleapis.com/customsearch/v1"
 
@@ -257,6 +666,496 @@ GOOGLE_SEARCH_URL = "https://www.googleapis.com/customsearch/v1"
 EXCEL_FILE = "file.xlsx"
 
 
+# Fiyat çıkarmada kullanılan regex'ler (her çağrıda yeniden derlenmesin diye modül seviyesinde)
+_NON_PRICE_CHARS_RE = re.compile(r'[^\d.,]')  # rakam, nokta ve virgül dışındaki karakterler
+_NON_NUMERIC_RE = re.compile(r'[^\d.]')  # rakam ve nokta dışındaki karakterler
+_PRICE_ATTR_RE = re.compile(r'.*price.*', re.I)
+_PRC_ATTR_RE = re.compile(r'.*prc.*', re.I)
+
+# Fiyat anahtarı içermeyen script'ler (analytics, tracking) regex'e hiç sokulmaz.
+# 'rice' / 'RICE': price, Price (sellingPrice, finalPrice...) ve PRICE'ı kapsar
+_PRICE_ANCHORS = ('rice', 'RICE')
+_AMAZON_PRICE_ANCHORS = _PRICE_ANCHORS + ('mount', 'MOUNT')  # Amazon'da "amount" anahtarı da aranıyor
+
+
+def _collect_scripts(soup) -> Tuple[list, list]:
+    """Sayfadaki script tag'lerini tek geçişte toplar: (tüm script'ler, JSON-LD script'leri)"""
+    all_scripts = soup.find_all('script')
+    jsonld_scripts = [script for script in all_scripts if script.get('type') == 'application/ld+json']
+    return all_scripts, jsonld_scripts
+
+
+def _match_selectors(soup, selectors: Tuple[str, ...], group: str) -> List[Tuple[str, list]]:
+    """
+    Selector'ları tek bir gruplu `select` çağrısıyla (tek DOM geçişi) uygular ve
+    öncelik sırasına göre (selector, eşleşen elementler) listesi döndürür.
+    Her selector'ın elementleri sayfa sırasını korur; eşleşmeyen selector'lar atlanır.
+    """
+    hits = soup.select(group)
+    matches = []
+    for selector in selectors:
+        elements = [el for el in hits if el.css.match(selector)]
+        if elements:
+            matches.append((selector, elements))
+    return matches
+
+
+def _has_price_anchor(text: str, anchors: Tuple[str, ...] = _PRICE_ANCHORS) -> bool:
+    """Script metni fiyat pattern'lerinin anahtar kelimelerinden birini içeriyor mu (ucuz substring kontrolü)"""
+    return any(anchor in text for anchor in anchors)
+
+
+# Ondalıklı JavaScript değeri, örn: "price":12499.25 (Trendyol ve Amazon)
+_JS_DECIMAL_RE = re.compile(r'\d+[.,]\d+')
+# Daha spesifik (Türk formatlı) JavaScript değeri, örn: "price":"12.499,25"
+_TY_JS_STRICT_RE = re.compile(r'\d{1,3}(?:\.\d{3})*(?:,\d{2})?')
+
+
+# Türk formatlı sayı normalizasyonu tek translate geçişiyle: binlik '.' silinir, ondalık ',' -> '.'
+_TR_DECIMAL_TRANS = str.maketrans({'.': None, ',': '.'})
+# Sadece rakamlar: '.' ve ',' ayırıcıları silinir
+_DROP_SEPARATORS_TRANS = str.maketrans('', '', '.,')
+
+
+def _parse_js_decimal_price(raw: str) -> float:
+    """_JS_DECIMAL_RE eşleşmesini ('12499.25' / '12499,25', tek ayırıcı) float'a çevirir"""
+    return float(raw.replace(',', '.'))
+
+
+def _parse_tr_price(raw: str) -> float:
+    """Türk formatlı fiyatı float'a çevirir: 12.499,25 -> 12499.25"""
+    return float(raw.translate(_TR_DECIMAL_TRANS))
+
+
+# Trendyol: temizlenmiş HTML fiyat metni pattern'leri
+_TY_HTML_PRICE_PATTERNS = [
+    re.compile(r'(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)'),  # 12.499,25
+    re.compile(r'(\d{1,3}(?:\.\d{3})+)'),  # 12.499
+    re.compile(r'(\d+,\d{2})'),  # 12499,25
+    re.compile(r'(\d+\.\d{2})'),  # 12499.25
+    re.compile(r'(\d+)'),  # 12499
+]
+# Trendyol'un yaygın fiyat class'ları ve data attribute'ları
+_TY_PRICE_SELECTORS = [
+    {'class': 'pr-new-br'},  # En yaygın Trendyol fiyat class'ı
+    {'class': 'pr-bx-w-dscntd'},
+    {'class': 'prc-org'},
+    {'class': 'prc-dsc'},
+    {'class': 'product-price-container'},
+    {'class': _PRICE_ATTR_RE},
+    {'class': _PRC_ATTR_RE},
+    {'data-test': _PRICE_ATTR_RE},
+    {'id': _PRICE_ATTR_RE},
+    {'data-testid': _PRICE_ATTR_RE},
+]
+
+# Hepsiburada / Teknosa: gevşek "...price:" pattern'i (tırnaksız ve *Price anahtarlarını da yakalar);
+# tırnaklı anahtarların hiçbiri geçerli fiyat vermezse son çare olarak kullanılır
+_JS_PRICE_KEY_RE = re.compile(r'price["\']?\s*:\s*["\']?(\d[\d.,]*)', re.IGNORECASE)
+_JS_LOOSE_PRICE_RES = (_JS_PRICE_KEY_RE,)
+
+
+def _js_price_keys(*keys: str) -> Tuple[re.Pattern, Dict[str, int]]:
+    """
+    Tırnaklı fiyat anahtarları için tek birleşik pattern ve anahtar -> öncelik sırası döndürür.
+    Pattern (anahtar, ham değer) yakalar; öncelik, anahtarların verildiği sıradır.
+    """
+    pattern = re.compile(r'"(' + '|'.join(keys) + r')"\s*:\s*"?(\d[\d.,]*)', re.IGNORECASE)
+    return pattern, {key.lower(): rank for rank, key in enumerate(keys)}
+
+
+# Hepsiburada: tırnaklı JavaScript fiyat anahtarları (öncelik sırasıyla)
+_HB_JS_PRICE_KEYS = _js_price_keys(
+    'price', 'finalPrice', 'salePrice', 'discountedPrice', 'currentPrice', 'offeringPrice', 'listPrice',
+)
+# Trendyol: tırnaklı JavaScript fiyat anahtarları (öncelik sırasıyla)
+_TY_JS_PRICE_KEYS = _js_price_keys(
+    'price', 'sellingPrice', 'discountedPrice', 'finalPrice', 'salePrice', 'currentPrice',
+)
+# Teknosa: tırnaklı JavaScript fiyat anahtarları (öncelik sırasıyla)
+_TK_JS_PRICE_KEYS = _js_price_keys(
+    'price', 'finalPrice', 'salePrice', 'discountedPrice', 'currentPrice', 'productPrice', 'sellingPrice',
+)
+
+
+def _parse_tr_number(raw: str) -> float:
+    """
+    JS'ten gelen fiyat değerini float'a çevirir:
+    12.499,25 -> 12499.25, 12499,25 -> 12499.25, 1.299.900 -> 1299900, 12499.25 -> 12499.25
+    """
+    price_str = raw.rstrip('.,')
+    if '.' in price_str and ',' in price_str:
+        # Format: 12.499,25 -> 12499.25
+        price_str = price_str.translate(_TR_DECIMAL_TRANS)
+    elif ',' in price_str:
+        # Format: 12499,25 -> 12499.25
+        price_str = price_str.replace(',', '.')
+    elif price_str.count('.') > 1:
+        # Format: 1.299.900 -> 1299900
+        price_str = price_str.replace('.', '')
+    return float(price_str)
+
+
+def _classify_js_price(raw: str) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Ham JS değerini (ondalıklı fiyat, tam sayı fiyat) olarak sınıflandırır; makul aralık
+    (1 - 1.000.000) dışındaki veya parse edilemeyen değerler için (None, None) döner.
+    """
+    price_str = raw.rstrip('.,')
+    try:
+        price_val = _parse_tr_number(price_str)
+    except ValueError:
+        return None, None
+    if not 1 <= price_val <= 1000000:
+        return None, None
+    if '.' in price_str or ',' in price_str:
+        return price_val, None
+    return None, price_val
+
+
+def _rank_script_js_prices(script_text: str, price_keys, loose_res, classify) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Tek bir script'te (fiyat, yedek fiyat) arar. Tırnaklı anahtarlar arasında önceliği en yüksek
+    anahtarın sayfadaki ilk geçerli değeri kazanır; hiçbiri yoksa gevşek pattern'lerin
+    (sırasıyla) sayfa sırasındaki ilk geçerli değeri kullanılır.
+    """
+    key_re, key_ranks = price_keys
+    no_rank = len(key_ranks)
+    price, price_rank = None, no_rank
+    fallback, fallback_rank = None, no_rank
+    for match in key_re.finditer(script_text):
+        rank = key_ranks[match.group(1).lower()]
+        if rank >= price_rank and rank >= fallback_rank:
+            continue
+        price_val, fallback_val = classify(match.group(2))
+        if price_val is not None and rank < price_rank:
+            price, price_rank = price_val, rank
+            if rank == 0:
+                break
+        if fallback_val is not None and rank < fallback_rank:
+            fallback, fallback_rank = fallback_val, rank
+    if price is not None:
+        return price, fallback
+    
+    for loose_re in loose_res:
+        for match in loose_re.finditer(script_text):
+            price_val, fallback_val = classify(match.group(1))
+            if price_val is not None:
+                return price_val, fallback
+            if fallback is None:
+                fallback = fallback_val
+    return None, fallback
+
+
+def _scan_ranked_js_prices(script_texts, price_keys, loose_res=_JS_LOOSE_PRICE_RES,
+                           classify=_classify_js_price) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Script'leri sırayla tarar ve (fiyat, yedek fiyat) döndürür: fiyat bulunan ilk script'in
+    en öncelikli anahtarı kazanır. Yedek fiyat (örn: tam sayı "price":12499) sadece hiçbir
+    script'te fiyat yoksa kullanılmak üzere, yedek değer taşıyan ilk script'ten alınır.
+    """
+    fallback = None
+    for script_text in script_texts:
+        price, script_fallback = _rank_script_js_prices(script_text, price_keys, loose_res, classify)
+        if price is not None:
+            return price, fallback
+        if fallback is None:
+            fallback = script_fallback
+    return None, fallback
+
+
+_HAS_DIGIT_RE = re.compile(r'\d')
+# Metinde para birimi işareti var mı (lower() kopyası oluşturmadan, büyük/küçük harf duyarsız)
+_CURRENCY_MARK_RE = re.compile(r'tl|₺', re.IGNORECASE)
+_AMZ_CURRENCY_MARK_RE = re.compile(r'tl|₺|\$', re.IGNORECASE)
+
+
+def _is_valid_price_text(text: str) -> bool:
+    """
+    Selector'dan gelen metnin fiyat olup olmadığını kontrol eder: rakam/nokta/virgül
+    dışındaki karakterler atıldıktan sonra en az 3 karakter kalmalı, en az bir rakam
+    içermeli ve virgül/noktayla başlamamalı.
+    """
+    if not text:
+        return False
+    cleaned = _NON_PRICE_CHARS_RE.sub('', text)
+    if len(cleaned) < 3 or cleaned[0] in ',.':
+        return False
+    return _HAS_DIGIT_RE.search(cleaned) is not None
+
+
+# Hepsiburada (Selenium): çerez popup'ı kabul butonları
+_HB_SELENIUM_COOKIE_SELECTORS = (
+    "button[id*='cookie']",
+    "button[class*='cookie']",
+    "a[class*='cookie']",
+    ".cookie-accept",
+    "#onetrust-accept-btn-handler",
+)
+# Hepsiburada (Selenium): fiyat selector'ları (kullanıcının kodundan - öncelikli)
+_HB_SELENIUM_PRICE_SELECTORS = (
+    "[data-test-id='price-current-price']",
+    "span[data-test-id='price-current-price']",
+    "div[data-test-id='price-current-price']",
+    "[data-test-id='price']",
+    "span[class*='price'][class*='current']",
+    "div[class*='price'][class*='current']",
+    "span[class*='current-price']",
+    "div[class*='current-price']",
+)
+# Hepsiburada (Selenium): spesifik selector'lar bulamazsa denenen genel fiyat selector'ları
+_HB_SELENIUM_GENERAL_PRICE_SELECTORS = (
+    "span[class*='price']",
+    "div[class*='price']",
+    ".price",
+    ".product-price",
+)
+# Teknosa: HTML fiyat selector'ları
+_TK_PRICE_SELECTORS = (
+    '[data-testid*="price"]',
+    '.price',
+    '.product-price',
+    '.prc',
+    '.current-price',
+    '.sale-price',
+    'span[class*="price"]',
+    'div[class*="price"]',
+    '[class*="product-price"]',
+    '[class*="price-current"]',
+)
+_TK_PRICE_SELECTOR_GROUP = ', '.join(_TK_PRICE_SELECTORS)
+# Teknosa: sayfa sadece script, meta ve fiyat taşıyan span/div tag'leriyle parse edilir
+# (eşleşen tag'in alt ağacı korunur; navigasyon, footer, stil vb. ağaca hiç eklenmez)
+_TK_SOUP_STRAINER = SoupStrainer(['script', 'meta', 'span', 'div'])
+# Amazon: fiyat selector'ları (öncelik sırasına göre)
+_AMZ_PRICE_SELECTORS = (
+    '#priceblock_ourprice',  # Normal fiyat
+    '#priceblock_dealprice',  # İndirimli fiyat
+    '#priceblock_saleprice',  # Satış fiyatı
+    'span.a-price-whole',  # Tam fiyat kısmı (örn: "1.234")
+    'span.a-price[data-a-color="base"] span.a-offscreen',  # Gizli fiyat
+    '.a-price .a-offscreen',  # Genel gizli fiyat
+    'span[data-asin-price]',  # Data attribute
+)
+_AMZ_PRICE_SELECTOR_GROUP = ', '.join(_AMZ_PRICE_SELECTORS)
+# Amazon: genel fiyat selector'ları
+_AMZ_GENERAL_PRICE_SELECTORS = (
+    '.a-price',
+    '.a-color-price',
+    '[class*="price"]',
+    '[id*="price"]',
+)
+_AMZ_GENERAL_PRICE_SELECTOR_GROUP = ', '.join(_AMZ_GENERAL_PRICE_SELECTORS)
+# Hepsiburada: spesifik data-test-id fiyat selector'ı (tek DOM geçişi; span/div varyantları
+# bu selector'ın alt kümesi). Eşleşmeler içinde 'price-current-price' öncelikli.
+_HB_SPECIFIC_PRICE_SELECTOR = "[data-test-id='price-current-price'], [data-test-id='price']"
+# Hepsiburada: genel fiyat selector'ları (CSS string veya find_all argümanları);
+# CSS selector'lar virgülle birleştirilip tek soup.select çağrısında çalıştırılır
+_HB_GENERAL_PRICE_SELECTORS = [
+    "span[class*='price'][class*='current'], div[class*='price'][class*='current'], "
+    "span[class*='current-price'], div[class*='current-price']",
+    {'id': 'offering-price'},
+    {'class': 'product-price'},
+    {'class': 'price'},
+    {'class': 'price-value'},
+    {'class': 'priceNew'},
+    {'class': _PRICE_ATTR_RE},
+    {'data-test': _PRICE_ATTR_RE},
+    {'id': _PRICE_ATTR_RE},
+]
+# Son çare regex taramasında kullanılacak en fazla sayfa metni (karakter)
+PAGE_TEXT_LIMIT = 200_000
+# Sayfa metninde TL fiyatı (örn: 1.234,56 TL veya 1234 TL veya 1.234,56₺)
+_TL_PRICE_PATTERNS = [
+    re.compile(r'(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)\s*(?:TL|₺|tl)'),
+    re.compile(r'(?:TL|₺|tl)\s*(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)'),
+    re.compile(r'(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)\s*₺'),
+]
+
+
+# Amazon: tırnaklı JavaScript fiyat anahtarları (öncelik sırasıyla); bulunamazsa sırasıyla
+# data-asin-price attribute'u ve gevşek "...price:" / "...priceAmount:" pattern'i denenir
+_AMZ_JS_PRICE_KEYS = _js_price_keys(
+    'price', 'priceAmount', 'displayPrice', 'finalPrice', 'salePrice', 'currentPrice', 'amount',
+)
+_AMZ_JS_LOOSE_PRICE_RES = (
+    re.compile(r'data-asin-price=["\'](\d+[.,]\d+)["\']', re.IGNORECASE),
+    re.compile(r'price(?:amount)?["\']?\s*:\s*["\']?(\d[\d.,]*)', re.IGNORECASE),
+)
+
+
+def _classify_ty_js_price(raw: str) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Trendyol için ham JS değerini (ondalıklı fiyat, Türk formatlı fiyat) olarak yorumlar:
+    ondalıklı kısım (örn: 12499.25) Yöntem 0'da, Türk formatlı değer (örn: 12.499,25) Yöntem 3'te kullanılır.
+    """
+    price_val = None
+    decimal_match = _JS_DECIMAL_RE.match(raw)
+    if decimal_match:
+        try:
+            price_val = _parse_js_decimal_price(decimal_match.group(0))
+        except ValueError:
+            pass
+        if price_val is not None and not 1 <= price_val <= 1000000:  # Makul fiyat aralığı
+            price_val = None
+    try:
+        strict_val = _parse_tr_price(_TY_JS_STRICT_RE.match(raw).group(0))
+    except ValueError:
+        strict_val = None
+    if strict_val is not None and not 1 <= strict_val <= 1000000:
+        strict_val = None
+    return price_val, strict_val
+
+
+def _classify_js_decimal_price(raw: str) -> Tuple[Optional[float], Optional[float]]:
+    """Ham JS değerinin ondalıklı kısmını (örn: 1299.90 / 1299,90) fiyat olarak döndürür; yedek fiyat yok"""
+    match = _JS_DECIMAL_RE.match(raw)
+    if not match:
+        return None, None
+    try:
+        price_val = _parse_tr_number(match.group(0))
+    except ValueError:
+        return None, None
+    if 1 <= price_val <= 1000000:
+        return price_val, None
+    return None, None
+# Türk formatlı sayı (örn: 12.499,25 / 12.499 / 999)
+_TR_NUMBER_RE = re.compile(r'(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)')
+
+# Yapısal veri blokları: ham HTML üzerinde BeautifulSoup'a gerek kalmadan aranır
+# Teknosa: fiyat data attribute'ları (öncelik sırasıyla) ve ham HTML'de arama pattern'leri
+_TK_PRICE_ATTRS = ['data-product-price', 'data-price-with-discount', 'data-price-without-discount']
+# Sadece gerçek tag attribute'ları: '<tag ... attr=' şeklinde (script/metin içindeki geçişler atlanır)
+_TK_PRICE_ATTR_RES = [
+    (attr, re.compile(r'<[a-z][^<>]*\s' + attr + r'\s*=\s*(?:["\']([^"\']*)["\']|([^\s"\'>]+))', re.IGNORECASE))
+    for attr in _TK_PRICE_ATTRS
+]
+
+
+def _price_from_teknosa_attrs(html: str) -> Optional[Tuple[float, str]]:
+    """
+    Teknosa'nın fiyat data attribute'larını ham HTML üzerinde regex ile arar
+    (BeautifulSoup parse'ından önce ucuz kontrol). Bulunursa (fiyat, attribute) döner.
+    """
+    # Script gövdelerindeki tag benzeri string'ler (örn: "<i data-product-price=..>") attribute sayılmaz
+    html = _SCRIPT_BODY_RE.sub('', html)
+    for attr, pattern in _TK_PRICE_ATTR_RES:
+        # İlk eşleşme boş/geçersiz olabilir (örn: data-product-price=""), sonrakilere de bakılır
+        for match in pattern.finditer(html):
+            try:
+                price_val = float(match.group(1) if match.group(1) is not None else match.group(2))
+            except ValueError:
+                continue
+            if 1 <= price_val <= 1000000:
+                return price_val, attr
+    return None
+
+
+_SCRIPT_BODY_RE = re.compile(r'<script\b[^>]*>(.*?)</script\s*>', re.S | re.I)
+
+
+def _raw_price_scripts(html: str) -> List[str]:
+    """Ham HTML'deki fiyat anahtarı içeren script gövdelerini BeautifulSoup'a gerek kalmadan toplar"""
+    return [body for body in _SCRIPT_BODY_RE.findall(html) if body and _has_price_anchor(body)]
+
+
+_JSON_LD_RE = re.compile(r'<script[^>]+application/ld\+json[^>]*>(.*?)</script>', re.S | re.I)
+_NEXT_DATA_RE = re.compile(r'id=["\']__NEXT_DATA__["\'][^>]*>(\{.*?\})</script>', re.S)
+# __NEXT_DATA__ içinde fiyat taşıyan anahtarlar (öncelik sırasıyla)
+_NEXT_DATA_PRICE_KEYS = ('sellingPrice', 'discountedPrice', 'price')
+
+
+def _price_from_json_ld(html: str) -> Optional[Tuple[float, str, Optional[str]]]:
+    """JSON-LD (schema.org Product) bloklarından (price, currency, title) döndürür"""
+    for block in _JSON_LD_RE.findall(html):
+        if '"offers"' not in block:
+            continue
+        try:
+            data = orjson.loads(block)
+        except ValueError:
+            continue
+        for item in (data if isinstance(data, list) else [data]):
+            if not isinstance(item, dict) or 'offers' not in item:
+                continue
+            offers = item['offers']
+            if isinstance(offers, list):
+                offers = offers[0] if offers else None
+            if not isinstance(offers, dict) or 'price' not in offers:
+                continue
+            try:
+                price = float(offers['price'])
+            except (TypeError, ValueError):
+                continue
+            return price, offers.get('priceCurrency', 'TRY'), item.get('name')
+    return None
+
+
+def _find_price_in_json(obj, depth: int = 0) -> Optional[float]:
+    """İç içe JSON'da ilk geçerli fiyat anahtarının değerini bulur"""
+    if depth > 12:
+        return None
+    if isinstance(obj, dict):
+        for key in _NEXT_DATA_PRICE_KEYS:
+            value = obj.get(key)
+            if isinstance(value, dict):
+                value = value.get('value')
+            if isinstance(value, (int, float)) and not isinstance(value, bool) and 1 <= value <= 1000000:
+                return float(value)
+        children = obj.values()
+    elif isinstance(obj, list):
+        children = obj
+    else:
+        return None
+    for child in children:
+        if isinstance(child, (dict, list)):
+            price = _find_price_in_json(child, depth + 1)
+            if price is not None:
+                return price
+    return None
+
+
+def _price_from_next_data(html: str) -> Optional[float]:
+    """Next.js __NEXT_DATA__ JSON'undan fiyatı döndürür"""
+    match = _NEXT_DATA_RE.search(html)
+    if not match:
+        return None
+    try:
+        data = orjson.loads(match.group(1))
+    except ValueError:
+        return None
+    return _find_price_in_json(data)
+
+
+async def _stream_html_until_json_ld(client: httpx.AsyncClient, url: str, headers: Dict, timeout: float) -> Tuple[str, Optional[Tuple]]:
+    """
+    Sayfayı stream ederek indirir; JSON-LD fiyatı gövdenin başında bulunursa bağlantı kapatılır
+    ve kalanı indirilmez. Returns: (html, _price_from_json_ld sonucu veya None)
+    """
+    structured = None
+    body = bytearray()
+    # Son tamamlanan </script>'in bittiği offset: sadece bundan sonra tamamlanan bloklar taranır
+    parsed_upto = 0
+    async with client.stream('GET', url, headers=headers, timeout=timeout) as response:
+        response.raise_for_status()
+        encoding = response.encoding or 'utf-8'
+        async for chunk in response.aiter_bytes():
+            scan_from = max(parsed_upto, len(body) - 8)
+            body += chunk
+            # Yeni bir </script> geldiyse, yeni tamamlanan bölümde JSON-LD varsa fiyatı şimdiden dene
+            script_end = body.rfind(b'</script>', scan_from)
+            if script_end == -1:
+                continue
+            script_end += len(b'</script>')
+            segment = body[parsed_upto:script_end]
+            parsed_upto = script_end
+            if b'ld+json' in segment:
+                structured = _price_from_json_ld(segment.decode(encoding, errors='ignore'))
+                if structured:
+                    break
+    return body.decode(encoding, errors='replace'), structured
+
+
+@ttl_cache()
 async def extract_price_from_trendyol(url: str, max_retries: int = 2) -> Dict[str, any]:
     """
     Trendyol URL'inden fiyat bilgisini çeker. Retry mekanizması ile.
@@ -277,154 +1176,118 @@ async def extract_price_from_trendyol(url: str, max_retries: int = 2) -> Dict[st
         'Upgrade-Insecure-Requests': '1',
     }
     
+    retry_delay = None  # son hatadan hesaplanan bekleme (Retry-After / backoff)
     for attempt in range(max_retries + 1):
         try:
-            # Rate limiting için bekleme
+            # Retry'ler arasında bekleme: Retry-After veya exponential backoff (jitter ile)
             if attempt > 0:
-                await asyncio.sleep(1.0)  # Retry'ler arasında daha uzun bekleme
-            else:
-                await asyncio.sleep(0.3)
+                await asyncio.sleep(retry_delay if retry_delay is not None else _retry_delay(attempt))
+                retry_delay = None
             
             # Timeout'u artır (son denemede daha uzun)
             timeout_duration = 25.0 if attempt == max_retries else 15.0
             
-            async with httpx.AsyncClient(timeout=timeout_duration, headers=headers, follow_redirects=True, limits=httpx.Limits(max_keepalive_connections=3, max_connections=5)) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.text, 'html.parser')
-                price = None
-                currency = 'TRY'
-                title = None
-                
-                # Başlık çekme (fiyat bulunduğunda kullanılacak)
-                # Yöntem 1: h1 tag'inden
-                h1_tag = soup.find('h1')
-                if h1_tag:
-                    title = h1_tag.get_text(strip=True)
-                
-                # Yöntem 2: JSON-LD'den
-                if not title:
-                    scripts = soup.find_all('script', type='application/ld+json')
-                    for script in scripts:
-                        try:
-                            if script.string:
-                                data = json.loads(script.string)
-                                if isinstance(data, dict) and 'name' in data:
-                                    title = data['name']
-                                    break
-                        except:
-                            continue
-                
-                # Yöntem 3: Meta tag'lerden
-                if not title:
-                    meta_title = soup.find('meta', property='og:title')
-                    if meta_title:
-                        title = meta_title.get('content', '').strip()
-                
-                # Yöntem 4: Title tag'inden
-                if not title:
-                    title_tag = soup.find('title')
-                    if title_tag:
-                        title = title_tag.get_text(strip=True)
-                
-                # Yöntem 0: Tüm script tag'lerinde window.__INITIAL_STATE__ veya benzeri global değişkenlerde ara
-                all_scripts = soup.find_all('script')
-                for script in all_scripts:
-                    if not script.string:
-                        continue
-                    script_text = script.string
-                    
-                    # Trendyol özel: window.__PRODUCT_DETAIL_APP_INITIAL_STATE__ veya benzeri
-                    patterns_js = [
-                        r'window\.__PRODUCT_DETAIL_APP_INITIAL_STATE__\s*=\s*({[^}]*"price"[^}]*})',
-                        r'"price"\s*:\s*"?(\d+[.,]\d+)"?',
-                        r'"sellingPrice"\s*:\s*"?(\d+[.,]\d+)"?',
-                        r'"discountedPrice"\s*:\s*"?(\d+[.,]\d+)"?',
-                        r'"finalPrice"\s*:\s*"?(\d+[.,]\d+)"?',
-                        r'"currentPrice"\s*:\s*"?(\d+[.,]\d+)"?',
-                        r'price["\']?\s*:\s*["\']?(\d+[.,]\d+)',
-                        r'sellingPrice["\']?\s*:\s*["\']?(\d+[.,]\d+)',
-                        r'discountedPrice["\']?\s*:\s*["\']?(\d+[.,]\d+)',
-                    ]
-                    for pattern in patterns_js:
-                        matches = re.finditer(pattern, script_text, re.IGNORECASE)
-                        for match in matches:
-                            try:
-                                price_str = match.group(1).replace(',', '.').replace('.', '', match.group(1).count('.') - 1) if '.' in match.group(1) else match.group(1).replace(',', '.')
-                                # Binlik ayırıcıları kaldır
-                                if '.' in price_str and ',' in price_str:
-                                    # Format: 12.499,25 -> 12499.25
-                                    price_str = price_str.replace('.', '').replace(',', '.')
-                                elif ',' in price_str:
-                                    # Format: 12499,25 -> 12499.25
-                                    price_str = price_str.replace(',', '.')
-                                price_val = float(price_str)
-                                if 1 <= price_val <= 1000000:  # Makul fiyat aralığı
-                                    price = price_val
-                                    logger.debug(f"Trendyol: JavaScript'ten fiyat bulundu: {price}")
-                                    return {
-                                        'price': price,
-                                        'currency': 'TRY',
-                                        'title': title,
-                                        'success': True,
-                                        'error': None
-                                    }
-                            except (ValueError, IndexError):
-                                continue
+            structured = None
+            html = read_html_cache(url)
+            if html is None:
+                client = get_http_client()
+                # Rate limiting: sabit bekleme yerine domain başına istek temposu
+                # Sayfa stream edilir: JSON-LD fiyatı gövdenin başında bulunursa kalanı indirilmez
+                async with get_scrape_semaphore('trendyol'), _TRENDYOL_THROTTLE:
+                    html, structured = await _stream_html_until_json_ld(client, url, headers, timeout_duration)
+                _TRENDYOL_THROTTLE.record(True)
+                if structured is None:
+                    # Sadece tam indirilen sayfalar cache'lenir
+                    write_html_cache(url, html)
+            
+            # Önce yapısal veri: JSON-LD offers veya __NEXT_DATA__ (bulunursa HTML hiç parse edilmez)
+            if structured is None:
+                structured = _price_from_json_ld(html)
+            if structured:
+                price, currency, title = structured
+                logger.debug(f"Trendyol: JSON-LD'den fiyat bulundu: {price}")
+                return {
+                    'price': price,
+                    'currency': currency,
+                    'title': title,
+                    'success': True,
+                    'error': None
+                }
+            price = _price_from_next_data(html)
+            if price is not None:
+                logger.debug(f"Trendyol: __NEXT_DATA__'dan fiyat bulundu: {price}")
+                return {
+                    'price': price,
+                    'currency': 'TRY',
+                    'title': None,
+                    'success': True,
+                    'error': None
+                }
+            
+            soup = BeautifulSoup(html, HTML_PARSER)
+            price = None
+            currency = 'TRY'
+            title = None
+            
+            # Script tag'leri tek geçişte toplanır (başlık ve fiyat yöntemleri aynı listeleri kullanır)
+            all_scripts, jsonld_scripts = _collect_scripts(soup)
             
-                # Yöntem 1: Script tag'lerinden JSON-LD veya product data
-                scripts = soup.find_all('script', type='application/ld+json')
-            for script in scripts:
-                try:
-                    if script.string:
-                        data = json.loads(script.string)
-                        if isinstance(data, dict):
-                            # Schema.org Product formatı
-                            if 'offers' in data:
-                                offers = data['offers']
-                                if isinstance(offers, dict):
-                                    if 'price' in offers:
-                                        price = float(offers['price'])
-                                        currency = offers.get('priceCurrency', 'TRY')
-                                        return {
-                                            'price': price,
-                                            'currency': currency,
-                                            'title': title,
-                                            'success': True,
-                                            'error': None
-                                        }
-                                elif isinstance(offers, list) and len(offers) > 0:
-                                    if 'price' in offers[0]:
-                                        price = float(offers[0]['price'])
-                                        currency = offers[0].get('priceCurrency', 'TRY')
-                                        return {
-                                            'price': price,
-                                            'currency': currency,
-                                            'title': title,
-                                            'success': True,
-                                            'error': None
-                                        }
-                except (json.JSONDecodeError, ValueError, KeyError):
-                    continue
+            # Başlık çekme (fiyat bulunduğunda kullanılacak)
+            # Yöntem 1: h1 tag'inden
+            h1_tag = soup.find('h1')
+            if h1_tag:
+                title = h1_tag.get_text(strip=True)
             
-            # Yöntem 2: HTML içinde fiyat class'larını ara (daha kapsamlı)
-            # Trendyol'un yaygın fiyat class'ları ve data attribute'ları
-            price_selectors = [
-                {'class': 'pr-new-br'},  # En yaygın Trendyol fiyat class'ı
-                {'class': 'pr-bx-w-dscntd'},
-                {'class': 'prc-org'},
-                {'class': 'prc-dsc'},
-                {'class': 'product-price-container'},
-                {'class': re.compile(r'.*price.*', re.I)},
-                {'class': re.compile(r'.*prc.*', re.I)},
-                {'data-test': re.compile(r'.*price.*', re.I)},
-                {'id': re.compile(r'.*price.*', re.I)},
-                {'data-testid': re.compile(r'.*price.*', re.I)},
+            # Yöntem 2: JSON-LD'den
+            if not title:
+                scripts = jsonld_scripts
+                for script in scripts:
+                    try:
+                        # "name" anahtarı içermeyen JSON-LD blokları parse edilmez
+                        if script.string and '"name"' in script.string:
+                            # orjson str alt sınıflarını (bs4 NavigableString) kabul etmez
+                            data = orjson.loads(str(script.string))
+                            if isinstance(data, dict) and 'name' in data:
+                                title = data['name']
+                                break
+                    except:
+                        continue
+            
+            # Yöntem 3: Meta tag'lerden
+            if not title:
+                meta_title = soup.find('meta', property='og:title')
+                if meta_title:
+                    title = meta_title.get('content', '').strip()
+            
+            # Yöntem 4: Title tag'inden
+            if not title:
+                title_tag = soup.find('title')
+                if title_tag:
+                    title = title_tag.get_text(strip=True)
+            
+            # Yöntem 0: Tüm script tag'lerinde window.__INITIAL_STATE__ veya benzeri global değişkenlerde ara
+            # Her script bir kez taranır; tırnaklı anahtarlar öncelik sırasıyla, gevşek "...price:"
+            # pattern'i son çare olarak kullanılır. Türk formatlı değer aynı geçişte Yöntem 3 için saklanır
+            script_texts = [
+                script.string for script in all_scripts
+                if script.string and _has_price_anchor(script.string)
             ]
+            price, js_fallback_price = _scan_ranked_js_prices(
+                script_texts, _TY_JS_PRICE_KEYS, classify=_classify_ty_js_price
+            )
+            if price is not None:
+                logger.debug(f"Trendyol: JavaScript'ten fiyat bulundu: {price}")
+                return {
+                    'price': price,
+                    'currency': 'TRY',
+                    'title': title,
+                    'success': True,
+                    'error': None
+                }
             
+            # Yöntem 2: HTML içinde fiyat class'larını ara (daha kapsamlı)
             # Tüm fiyat elementlerini bul (sadece ilkini değil)
-            for selector in price_selectors:
+            for selector in _TY_PRICE_SELECTORS:
                 try:
                     price_elements = soup.find_all(**selector)
                     for price_element in price_elements:
@@ -439,26 +1302,17 @@ async def extract_price_from_trendyol(url: str, max_retries: int = 2) -> Dict[st
                         # Sadece rakamları al (nokta ve virgül ile)
                         # Türk Lirası formatı: 1.234,56 veya 1234,56 veya 12.499 TL
                         # Önce noktaları kaldır (binlik ayırıcı), virgülü noktaya çevir
-                        price_text_clean = price_text.replace('TL', '').replace('₺', '').strip()
                         # Türk formatı: 12.499,25 -> 12499.25
-                        price_text_clean = price_text_clean.replace('.', '').replace(',', '.')
-                        # Sadece rakam ve nokta bırak
-                        price_text_clean = re.sub(r'[^\d.]', '', price_text_clean)
+                        price_text_clean = price_text.translate(_TR_DECIMAL_TRANS)
+                        # Sadece rakam ve nokta bırak (TL, ₺ ve boşluklar da burada atılır)
+                        price_text_clean = _NON_NUMERIC_RE.sub('', price_text_clean)
                         
                         # Fiyat pattern'lerini ara (virgüllü veya noktalı)
-                        price_patterns = [
-                            r'(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)',  # 12.499,25
-                            r'(\d{1,3}(?:\.\d{3})+)',  # 12.499
-                            r'(\d+,\d{2})',  # 12499,25
-                            r'(\d+\.\d{2})',  # 12499.25
-                            r'(\d+)',  # 12499
-                        ]
-                        
-                        for pattern in price_patterns:
-                            price_match = re.search(pattern, price_text_clean)
+                        for pattern in _TY_HTML_PRICE_PATTERNS:
+                            price_match = pattern.search(price_text_clean)
                             if price_match:
                                 try:
-                                    price_str = price_match.group(1).replace('.', '').replace(',', '.')
+                                    price_str = price_match.group(1).translate(_TR_DECIMAL_TRANS)
                                     price_val = float(price_str)
                                     # Geçerli fiyat aralığı kontrolü
                                     if 1 <= price_val <= 1000000:
@@ -477,62 +1331,30 @@ async def extract_price_from_trendyol(url: str, max_retries: int = 2) -> Dict[st
                     continue
             
             # Yöntem 3: JavaScript içinde daha detaylı fiyat ara (tekrar, ama daha kapsamlı)
-            for script in all_scripts:
-                if not script.string:
-                    continue
-                script_text = script.string
-                
-                # Daha spesifik pattern'ler
-                patterns = [
-                    r'"price"\s*:\s*"?(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)"?,',  # "price":"12.499,25",
-                    r'"sellingPrice"\s*:\s*"?(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)"?,',
-                    r'"discountedPrice"\s*:\s*"?(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)"?,',
-                    r'"finalPrice"\s*:\s*"?(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)"?,',
-                    r'"salePrice"\s*:\s*"?(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)"?,',
-                    r'"currentPrice"\s*:\s*"?(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)"?,',
-                    r'price["\']?\s*:\s*["\']?(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)["\']?',
-                    r'sellingPrice["\']?\s*:\s*["\']?(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)["\']?',
-                ]
-                for pattern in patterns:
-                    matches = re.finditer(pattern, script_text, re.IGNORECASE)
-                    for match in matches:
-                        try:
-                            price_str = match.group(1).replace('.', '').replace(',', '.')
-                            price_val = float(price_str)
-                            if 1 <= price_val <= 1000000:
-                                logger.debug(f"Trendyol: JS pattern'den fiyat bulundu: {price_val}")
-                                return {
-                                    'price': price_val,
-                                    'currency': 'TRY',
-                                    'success': True,
-                                    'error': None
-                                }
-                        except (ValueError, IndexError):
-                            continue
-                
-                # Fiyat bulunamadıysa retry yap
-                if price is None:
-                    if attempt < max_retries:
-                        logger.warning(f"Fiyat bulunamadı (deneme {attempt + 1}/{max_retries + 1}), tekrar denenecek...")
-                        continue
-                    else:
-                        return {
-                            'price': None,
-                            'currency': None,
-                            'success': False,
-                            'error': 'Price not found on page'
-                        }
-                else:
-                    # Fiyat bulundu, başarılı dönüş
+            if script_texts:
+                # Daha spesifik pattern (Yöntem 0 taramasında bulunan Türk formatlı değer)
+                if js_fallback_price is not None:
+                    logger.debug(f"Trendyol: JS pattern'den fiyat bulundu: {js_fallback_price}")
                     return {
-                        'price': price,
-                        'currency': currency,
-                        'title': title,
+                        'price': js_fallback_price,
+                        'currency': 'TRY',
                         'success': True,
                         'error': None
                     }
+                
+                # Fiyat bulunamadıysa retry yap
+                if attempt < max_retries:
+                    logger.warning(f"Fiyat bulunamadı (deneme {attempt + 1}/{max_retries + 1}), tekrar denenecek...")
+                    continue
+                return {
+                    'price': None,
+                    'currency': None,
+                    'success': False,
+                    'error': 'Price not found on page'
+                }
                     
         except httpx.TimeoutException:
+            _TRENDYOL_THROTTLE.record(False)
             if attempt < max_retries:
                 logger.warning(f"Timeout (deneme {attempt + 1}/{max_retries + 1}), tekrar denenecek...")
                 continue
@@ -544,8 +1366,11 @@ async def extract_price_from_trendyol(url: str, max_retries: int = 2) -> Dict[st
                     'error': 'Request timeout after retries'
                 }
         except Exception as e:
+            if isinstance(e, httpx.HTTPStatusError) and e.response.status_code in RETRY_STATUS_CODES:
+                _TRENDYOL_THROTTLE.record(False)
             if attempt < max_retries:
-                logger.warning(f"Hata (deneme {attempt + 1}/{max_retries + 1}): {str(e)[:50]}, tekrar denenecek...")
+                retry_delay = _retry_delay(attempt + 1, e)
+                logger.warning(f"Hata (deneme {attempt + 1}/{max_retries + 1}): {str(e)[:50]}, {retry_delay:.1f}s sonra tekrar denenecek...")
                 continue
             else:
                 logger.warning(f"Fiyat çekme hatası: {str(e)}")
@@ -565,6 +1390,58 @@ async def extract_price_from_trendyol(url: str, max_retries: int = 2) -> Dict[st
     }
 
 
+# Hepsiburada fiyat selector'ları (öncelik sırasıyla)
+_HB_PLAYWRIGHT_PRICE_SELECTORS = [
+    "[data-test-id='price-current-price']",
+    "[data-test-id='price']",
+    "span[class*='price'][class*='current']",
+    "div[class*='price'][class*='current']",
+    "span[class*='current-price']",
+    "div[class*='current-price']",
+]
+
+def _parse_tl_price(text: str) -> Optional[float]:
+    """'12.499,25 TL' gibi bir fiyat metnini float'a çevirir (geçersizse None)"""
+    cleaned = _NON_PRICE_CHARS_RE.sub('', text or '')
+    if len(cleaned) < 3 or cleaned.startswith(',') or cleaned.startswith('.'):
+        return None
+    return extract_price(cleaned)
+
+async def _extract_price_hepsiburada_playwright(url: str) -> Tuple[Optional[float], Optional[str]]:
+    """Hepsiburada fiyatını Playwright ile çeker. Returns: (price, error)"""
+    browser = await get_playwright_browser()
+    if browser is None:
+        return None, "Playwright tarayıcısı başlatılamadı"
+    
+    context = await browser.new_context(
+        user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        locale='tr-TR',
+    )
+    try:
+        await context.route(PLAYWRIGHT_BLOCKED_ROUTE, lambda route: route.abort())
+        page = await context.new_page()
+        await page.goto(url, wait_until="domcontentloaded", timeout=15000)
+        try:
+            await page.wait_for_selector(_HB_PLAYWRIGHT_PRICE_SELECTORS[0], timeout=8000)
+        except Exception:
+            pass  # fiyat başka bir selector'da olabilir
+        
+        for selector in _HB_PLAYWRIGHT_PRICE_SELECTORS:
+            for text in await page.locator(selector).all_text_contents():
+                price_val = _parse_tl_price(text)
+                if price_val is not None:
+                    return price_val, None
+        return None, "Fiyat bulunamadı"
+    except Exception as e:
+        return None, f"Playwright hatası: {str(e)[:50]}"
+    finally:
+        try:
+            await context.close()
+        except:
+            pass
+
+
+@ttl_cache()
 async def extract_price_from_hepsiburada(url: str, max_retries: int = 0) -> Dict[str, any]:
     """
     Hepsiburada URL'inden fiyat bilgisini çeker. 
@@ -578,7 +1455,21 @@ async def extract_price_from_hepsiburada(url: str, max_retries: int = 0) -> Dict
     Returns:
         Dict containing: price, currency, success, error
     """
-    # Önce Selenium ile dene (JavaScript yüklenmesi için)
+    # Önce Playwright ile dene (native async, executor gerektirmez)
+    if USE_PLAYWRIGHT:
+        async with get_scrape_semaphore('hepsiburada'):
+            price, error = await _extract_price_hepsiburada_playwright(url)
+        if price:
+            logger.debug(f"Hepsiburada: Playwright ile fiyat bulundu: {price}")
+            return {
+                'price': price,
+                'currency': 'TRY',
+                'success': True,
+                'error': None
+            }
+        logger.warning(f"Hepsiburada: Playwright ile fiyat bulunamadı: {error}")
+    
+    # Sonra Selenium ile dene (JavaScript yüklenmesi için)
     if USE_SELENIUM:
         try:
             # Selenium'u async wrapper ile kullan
@@ -586,7 +1477,7 @@ async def extract_price_from_hepsiburada(url: str, max_retries: int = 0) -> Dict
             
             def selenium_extract():
                 """Selenium ile fiyat çeken sync fonksiyon"""
-                driver = get_selenium_driver()
+                driver = acquire_selenium_driver()
                 if not driver:
                     error_msg = "Selenium driver oluşturulamadı, geçiliyor..."
                     logger.warning(f"Hepsiburada: {error_msg}")
@@ -638,14 +1529,7 @@ async def extract_price_from_hepsiburada(url: str, max_retries: int = 0) -> Dict
                     
                     # Popup'ları kapat
                     try:
-                        cookie_selectors = [
-                            "button[id*='cookie']",
-                            "button[class*='cookie']",
-                            "a[class*='cookie']",
-                            ".cookie-accept",
-                            "#onetrust-accept-btn-handler",
-                        ]
-                        for selector in cookie_selectors:
+                        for selector in _HB_SELENIUM_COOKIE_SELECTORS:
                             try:
                                 cookie_btn = driver.find_elements(By.CSS_SELECTOR, selector)
                                 if cookie_btn and cookie_btn[0].is_displayed():
@@ -664,96 +1548,31 @@ async def extract_price_from_hepsiburada(url: str, max_retries: int = 0) -> Dict
                     time.sleep(scroll_wait)
                     logger.debug("Hepsiburada: Scroll yapıldı, fiyat aranıyor...")
                     
-                    # Fiyat geçerliliği kontrolü (kullanıcının kodundan)
-                    def fiyat_gecerli_mi(text):
-                        """Fiyatın geçerli olup olmadığını kontrol et"""
-                        if not text or len(text.strip()) < 3:
-                            return False
-                        
-                        # Sadece sayı, nokta, virgül ve TL/₺ içermeli
-                        cleaned = re.sub(r'[^\d.,]', '', text)
-                        if not cleaned or len(cleaned) < 3:  # En az 3 karakter olmalı (örn: 100)
-                            return False
-                        
-                        # Sadece virgül veya nokta içeriyorsa geçersiz (örn: ",12" veya ".12")
-                        if cleaned.replace(',', '').replace('.', '') == '':
-                            return False
-                        
-                        # En az bir rakam olmalı
-                        if not any(char.isdigit() for char in cleaned):
-                            return False
-                        
-                        # Fiyat formatını kontrol et (örn: 1.234,56 veya 1234,56 veya 1234)
-                        # Eğer sadece virgülle başlıyorsa geçersiz
-                        if cleaned.startswith(',') or cleaned.startswith('.'):
-                            return False
-                        
-                        return True
-                    
-                    # Fiyat selector'ları (kullanıcının kodundan - öncelikli)
-                    fiyat_selectors = [
-                        "[data-test-id='price-current-price']",
-                        "span[data-test-id='price-current-price']",
-                        "div[data-test-id='price-current-price']",
-                        "[data-test-id='price']",
-                        "span[class*='price'][class*='current']",
-                        "div[class*='price'][class*='current']",
-                        "span[class*='current-price']",
-                        "div[class*='current-price']",
-                    ]
-                    
                     # Önce spesifik fiyat seçicilerini dene
-                    for selector in fiyat_selectors:
+                    for selector in _HB_SELENIUM_PRICE_SELECTORS:
                         try:
                             fiyat_elements = driver.find_elements(By.CSS_SELECTOR, selector)
                             for elem in fiyat_elements:
                                 text = elem.text.strip()
-                                if fiyat_gecerli_mi(text):
-                                    # Fiyatı temizle ve standardize et
-                                    price_cleaned = text.replace('TL', '').replace('₺', '').strip()
-                                    if '.' in price_cleaned and ',' in price_cleaned:
-                                        # Format: 12.499,25 -> 12499.25
-                                        price_cleaned = price_cleaned.replace('.', '').replace(',', '.')
-                                    elif ',' in price_cleaned:
-                                        # Format: 12499,25 -> 12499.25
-                                        price_cleaned = price_cleaned.replace(',', '.')
-                                    price_cleaned = re.sub(r'[^\d.]', '', price_cleaned)
-                                    try:
-                                        price_val = float(price_cleaned)
-                                        if 1 <= price_val <= 1000000:
-                                            return price_val, None
-                                    except:
-                                        continue
+                                if _is_valid_price_text(text):
+                                    price_val = extract_price(text)
+                                    if price_val is not None:
+                                        return price_val, None
                         except:
                             continue
                     
                     # Eğer hala bulunamadıysa genel seçicileri dene
-                    genel_fiyat_selectors = [
-                        "span[class*='price']",
-                        "div[class*='price']",
-                        ".price",
-                        ".product-price",
-                    ]
-                    for selector in genel_fiyat_selectors:
+                    for selector in _HB_SELENIUM_GENERAL_PRICE_SELECTORS:
                         try:
                             fiyat_elements = driver.find_elements(By.CSS_SELECTOR, selector)
                             for elem in fiyat_elements:
                                 text = elem.text.strip()
                                 # TL veya ₺ içeriyorsa ve geçerliyse
-                                if ('tl' in text.lower() or '₺' in text) and len(text) < 50:
-                                    if fiyat_gecerli_mi(text):
-                                        price_cleaned = text.replace('TL', '').replace('₺', '').strip()
-                                        if '.' in price_cleaned and ',' in price_cleaned:
-                                            price_cleaned = price_cleaned.replace('.', '').replace(',', '.')
-                                        elif ',' in price_cleaned:
-                                            price_cleaned = price_cleaned.replace(',', '.')
-                                        price_cleaned = re.sub(r'[^\d.]', '', price_cleaned)
-                                        try:
-                                            price_val = float(price_cleaned)
-                                            if 1 <= price_val <= 1000000:
-                                                return price_val, None
-                                        except:
-                                            continue
+                                if len(text) < 50 and _CURRENCY_MARK_RE.search(text):
+                                    if _is_valid_price_text(text):
+                                        price_val = extract_price(text)
+                                        if price_val is not None:
+                                            return price_val, None
                         except:
                             continue
                     
@@ -761,33 +1580,30 @@ async def extract_price_from_hepsiburada(url: str, max_retries: int = 0) -> Dict
                     try:
                         page_text = driver.page_source
                         # Fiyat desenini ara (örn: 1.234,56 TL veya 1234 TL veya 1.234,56₺)
-                        price_patterns = [
-                            r'(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)\s*(?:TL|₺|tl)',
-                            r'(?:TL|₺|tl)\s*(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)',
-                            r'(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)\s*₺',
-                        ]
-                        for pattern in price_patterns:
-                            matches = re.findall(pattern, page_text)
+                        for pattern in _TL_PRICE_PATTERNS:
+                            matches = pattern.findall(page_text)
                             if matches:
                                 # Geçerli fiyatları filtrele (en az 3 rakam içermeli)
                                 valid_prices = []
                                 for m in matches:
-                                    digits_only = m.replace('.', '').replace(',', '')
+                                    digits_only = m.translate(_DROP_SEPARATORS_TRANS)
                                     if len(digits_only) >= 3 and not m.startswith(',') and not m.startswith('.'):
                                         valid_prices.append(m)
                                 
                                 if valid_prices:
                                     # En büyük sayıyı al (genelde fiyat en büyük sayıdır)
                                     def get_numeric_value(price_str):
-                                        return float(price_str.replace('.', '').replace(',', '.'))
+                                        return float(price_str.translate(_TR_DECIMAL_TRANS))
                                     
-                                    try:
-                                        valid_prices.sort(key=get_numeric_value, reverse=True)
-                                        price_val = get_numeric_value(valid_prices[0])
-                                        if 1 <= price_val <= 1000000:
-                                            return price_val, None
-                                    except:
-                                        price_val = get_numeric_value(valid_prices[0])
+                                    # Her değer bir kez çevrilir; sıralama yerine tek geçişte max
+                                    parsed_prices = []
+                                    for m in valid_prices:
+                                        try:
+                                            parsed_prices.append(get_numeric_value(m))
+                                        except ValueError:
+                                            continue
+                                    if parsed_prices:
+                                        price_val = max(parsed_prices)
                                         if 1 <= price_val <= 1000000:
                                             return price_val, None
                     except Exception as e:
@@ -803,6 +1619,8 @@ async def extract_price_from_hepsiburada(url: str, max_retries: int = 0) -> Dict
                         return None, f"Sayfa yükleme timeout ({wait_timeout}s)"
                     logger.warning(f"Hepsiburada: Selenium hatası: {error_msg[:100]}")
                     return None, f"Hata: {error_msg[:50]}"
+                finally:
+                    release_selenium_driver(driver)
             
             # Selenium'u async executor'da çalıştır - Streamlit Cloud'ta daha uzun timeout
             is_streamlit_env = False
@@ -814,10 +1632,11 @@ async def extract_price_from_hepsiburada(url: str, max_retries: int = 0) -> Dict
             
             executor_timeout = 90 if is_streamlit_env else 40  # Streamlit Cloud'ta 90 saniye
             try:
-                price, error = await asyncio.wait_for(
-                    loop.run_in_executor(None, selenium_extract),
-                    timeout=executor_timeout
-                )
+                async with get_scrape_semaphore('hepsiburada'):
+                    price, error = await asyncio.wait_for(
+                        loop.run_in_executor(_selenium_executor, selenium_extract),
+                        timeout=executor_timeout
+                    )
             except asyncio.TimeoutError:
                 logger.warning(f"Hepsiburada: Executor timeout ({executor_timeout}s), geçiliyor...")
                 price, error = None, f"Executor timeout ({executor_timeout}s)"
@@ -864,325 +1683,162 @@ async def extract_price_from_hepsiburada(url: str, max_retries: int = 0) -> Dict
     try:
         timeout_duration = 15.0  # Timeout'u azalt (hızlı geçiş için)
         
-        async with httpx.AsyncClient(
-            timeout=timeout_duration, 
-            headers=headers, 
-            follow_redirects=True, 
-            limits=httpx.Limits(max_keepalive_connections=1, max_connections=2)
-        ) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            price = None
-            currency = 'TRY'
-            
-            # Yöntem 0: Tüm script tag'lerinde JavaScript global değişkenlerinde ara (Trendyol gibi)
-            all_scripts = soup.find_all('script')
-            for script in all_scripts:
-                if not script.string:
-                    continue
-                script_text = script.string
-                
-                # Hepsiburada özel pattern'ler
-                patterns_js = [
-                    r'"price"\s*:\s*"?(\d+[.,]\d+)"?',
-                    r'"finalPrice"\s*:\s*"?(\d+[.,]\d+)"?',
-                    r'"salePrice"\s*:\s*"?(\d+[.,]\d+)"?',
-                    r'"discountedPrice"\s*:\s*"?(\d+[.,]\d+)"?',
-                    r'"currentPrice"\s*:\s*"?(\d+[.,]\d+)"?',
-                    r'"offeringPrice"\s*:\s*"?(\d+[.,]\d+)"?',
-                    r'"listPrice"\s*:\s*"?(\d+[.,]\d+)"?',
-                    r'price["\']?\s*:\s*["\']?(\d+[.,]\d+)',
-                    r'finalPrice["\']?\s*:\s*["\']?(\d+[.,]\d+)',
-                    r'offeringPrice["\']?\s*:\s*["\']?(\d+[.,]\d+)',
-                ]
-                for pattern in patterns_js:
-                    matches = re.finditer(pattern, script_text, re.IGNORECASE)
-                    for match in matches:
-                        try:
-                            price_str = match.group(1)
-                            # Binlik ayırıcıları kaldır
-                            if '.' in price_str and ',' in price_str:
-                                # Format: 12.499,25 -> 12499.25
-                                price_str = price_str.replace('.', '').replace(',', '.')
-                            elif ',' in price_str:
-                                # Format: 12499,25 -> 12499.25
-                                price_str = price_str.replace(',', '.')
-                            price_val = float(price_str)
-                            if 1 <= price_val <= 1000000:
-                                price = price_val
-                                logger.debug(f"Hepsiburada: JavaScript'ten fiyat bulundu: {price}")
-                                return {
-                                    'price': price,
-                                    'currency': 'TRY',
-                                    'success': True,
-                                    'error': None
-                                }
-                        except (ValueError, IndexError):
-                            continue
-            
-            # Yöntem 1: Script tag'lerinden JSON-LD veya product data
-            scripts = soup.find_all('script', type='application/ld+json')
-            for script in scripts:
-                try:
-                    if script.string:
-                        data = json.loads(script.string)
-                        if isinstance(data, dict):
-                            # Schema.org Product formatı
-                            if 'offers' in data:
-                                offers = data['offers']
-                                if isinstance(offers, dict):
-                                    if 'price' in offers:
-                                        price = float(offers['price'])
-                                        currency = offers.get('priceCurrency', 'TRY')
-                                        logger.debug(f"Hepsiburada: JSON-LD'den fiyat bulundu: {price}")
-                                        return {
-                                            'price': price,
-                                            'currency': currency,
-                                            'title': title,
-                                            'success': True,
-                                            'error': None
-                                        }
-                                elif isinstance(offers, list) and len(offers) > 0:
-                                    if 'price' in offers[0]:
-                                        price = float(offers[0]['price'])
-                                        currency = offers[0].get('priceCurrency', 'TRY')
-                                        logger.debug(f"Hepsiburada: JSON-LD listesinden fiyat bulundu: {price}")
-                                        return {
-                                            'price': price,
-                                            'currency': currency,
-                                            'title': title,
-                                            'success': True,
-                                            'error': None
-                                        }
-                except (json.JSONDecodeError, ValueError, KeyError):
-                    continue
-            
-            # Yöntem 2: HTML selector'ları (Selenium kodundan gelen selector'lar - öncelikli)
-            # Önce spesifik data-test-id selector'larını dene (Hepsiburada'nın kullandığı)
-            specific_price_selectors = [
-                "[data-test-id='price-current-price']",
-                "span[data-test-id='price-current-price']",
-                "div[data-test-id='price-current-price']",
-                "[data-test-id='price']",
-                "span[data-test-id='price']",
-                "div[data-test-id='price']",
-            ]
-            
-            # Fiyat geçerliliği kontrolü (Selenium kodundan)
-            def is_valid_price(text):
-                """Fiyatın geçerli olup olmadığını kontrol et"""
-                if not text or len(text.strip()) < 3:
-                    return False
-                
-                # Sadece sayı, nokta, virgül ve TL/₺ içermeli
-                cleaned = re.sub(r'[^\d.,]', '', text)
-                if not cleaned or len(cleaned) < 3:
-                    return False
-                
-                # Sadece virgül veya nokta içeriyorsa geçersiz
-                if cleaned.replace(',', '').replace('.', '') == '':
-                    return False
-                
-                # En az bir rakam olmalı
-                if not any(char.isdigit() for char in cleaned):
-                    return False
-                
-                # Virgülle veya noktayla başlıyorsa geçersiz
-                if cleaned.startswith(',') or cleaned.startswith('.'):
-                    return False
-                
-                return True
-            
-            for selector in specific_price_selectors:
-                try:
-                    price_elements = soup.select(selector)
-                    for price_element in price_elements:
-                        if not price_element:
-                            continue
-                        
-                        price_text = price_element.get_text(strip=True)
-                        if not is_valid_price(price_text):
-                            continue
-                        
-                        # Fiyat temizleme ve parse etme
-                        price_cleaned = price_text.replace('TL', '').replace('₺', '').strip()
-                        
-                        # Türk formatı: 1.234,56 veya 1234,56 veya 12.499 TL
-                        if '.' in price_cleaned and ',' in price_cleaned:
-                            # Format: 12.499,25 -> 12499.25
-                            price_cleaned = price_cleaned.replace('.', '').replace(',', '.')
-                        elif ',' in price_cleaned:
-                            # Format: 12499,25 -> 12499.25
-                            price_cleaned = price_cleaned.replace(',', '.')
-                        
-                        # Sadece rakam ve nokta bırak
-                        price_cleaned = re.sub(r'[^\d.]', '', price_cleaned)
-                        
-                        try:
-                            price_val = float(price_cleaned)
-                            if 1 <= price_val <= 1000000:
-                                logger.debug(f"Hepsiburada: HTML'den fiyat bulundu (data-test-id): {price_val} (selector: {selector})")
-                                return {
-                                    'price': price_val,
-                                    'currency': 'TRY',
-                                    'success': True,
-                                    'error': None
-                                }
-                        except (ValueError, AttributeError):
-                            continue
-                except Exception as e:
-                    logger.debug(f"Selector hatası ({selector}): {e}")
-                    continue
-            
-            # Eğer spesifik selector'lardan bulunamadıysa, genel selector'ları dene
-            general_price_selectors = [
-                "span[class*='price'][class*='current']",
-                "div[class*='price'][class*='current']",
-                "span[class*='current-price']",
-                "div[class*='current-price']",
-                {'id': 'offering-price'},
-                {'class': 'product-price'},
-                {'class': 'price'},
-                {'class': 'price-value'},
-                {'class': 'priceNew'},
-                {'class': re.compile(r'.*price.*', re.I)},
-                {'data-test': re.compile(r'.*price.*', re.I)},
-                {'id': re.compile(r'.*price.*', re.I)},
-            ]
-            
-            for selector in general_price_selectors:
-                try:
-                    if isinstance(selector, str):
-                        price_elements = soup.select(selector)
-                    else:
-                        price_elements = soup.find_all(**selector)
-                    
-                    for price_element in price_elements:
-                        if not price_element:
-                            continue
-                        
-                        price_text = price_element.get_text(strip=True)
-                        if not price_text or len(price_text) < 3:
-                            continue
-                        
-                        # TL veya ₺ içermeli ve uzunluğu makul olmalı
-                        if ('tl' not in price_text.lower() and '₺' not in price_text) or len(price_text) > 50:
-                            continue
-                        
-                        if not is_valid_price(price_text):
-                            continue
-                        
-                        # Fiyat temizleme
-                        price_cleaned = price_text.replace('TL', '').replace('₺', '').strip()
-                        
-                        # Türk formatı dönüşümü
-                        if '.' in price_cleaned and ',' in price_cleaned:
-                            price_cleaned = price_cleaned.replace('.', '').replace(',', '.')
-                        elif ',' in price_cleaned:
-                            price_cleaned = price_cleaned.replace(',', '.')
-                        
-                        price_cleaned = re.sub(r'[^\d.]', '', price_cleaned)
-                        
-                        try:
-                            price_val = float(price_cleaned)
-                            if 1 <= price_val <= 1000000:
-                                logger.debug(f"Hepsiburada: HTML'den fiyat bulundu (genel): {price_val}")
-                                return {
-                                    'price': price_val,
-                                    'currency': 'TRY',
-                                    'success': True,
-                                    'error': None
-                                }
-                        except (ValueError, AttributeError):
-                            continue
-                except Exception as e:
-                    logger.debug(f"Selector hatası: {e}")
+        json_ld = None
+        html = read_html_cache(url)
+        if html is None:
+            client = get_http_client()
+            # Sayfa stream edilir: JSON-LD fiyatı gövdenin başında bulunursa kalanı indirilmez
+            async with get_scrape_semaphore('hepsiburada'):
+                html, json_ld = await _stream_html_until_json_ld(client, url, headers, timeout_duration)
+            if json_ld is None:
+                # Sadece tam indirilen sayfalar cache'lenir
+                write_html_cache(url, html)
+        
+        # Yöntem 0: JSON-LD (schema.org offers) en güvenilir ve en küçük kaynak; sayfa parse
+        # edilmeden ve script'ler taranmadan önce ham HTML üzerinde kontrol edilir
+        if json_ld is None:
+            json_ld = _price_from_json_ld(html)
+        if json_ld:
+            price, currency, title = json_ld
+            logger.debug(f"Hepsiburada: JSON-LD'den fiyat bulundu: {price}")
+            return {
+                'price': price,
+                'currency': currency,
+                'title': title,
+                'success': True,
+                'error': None
+            }
+        
+        # Yöntem 1: Tüm script tag'lerinde JavaScript global değişkenlerinde ara (Trendyol gibi)
+        # Script gövdeleri ham HTML'den alınır; tırnaklı anahtarlar öncelik sırasıyla, gevşek
+        # "...price:" pattern'i son çare olarak kullanılır. Ondalıklı değerler sayfa parse
+        # edilmeden hemen döner, tam sayı değerler Yöntem 3 için saklanır
+        price, js_fallback_price = _scan_ranked_js_prices(_raw_price_scripts(html), _HB_JS_PRICE_KEYS)
+        if price is not None:
+            logger.debug(f"Hepsiburada: JavaScript'ten fiyat bulundu: {price}")
+            return {
+                'price': price,
+                'currency': 'TRY',
+                'success': True,
+                'error': None
+            }
+        
+        soup = BeautifulSoup(html, HTML_PARSER)
+        currency = 'TRY'
+        
+        # Yöntem 2: HTML selector'ları (Selenium kodundan gelen selector'lar - öncelikli)
+        # Önce spesifik data-test-id selector'larını dene (Hepsiburada'nın kullandığı)
+        try:
+            price_elements = soup.select(_HB_SPECIFIC_PRICE_SELECTOR)
+            # 'price-current-price' eşleşmeleri önce (sıralama stabil, sayfa sırası korunur)
+            price_elements.sort(key=lambda el: el.get('data-test-id') != 'price-current-price')
+            for price_element in price_elements:
+                price_text = price_element.get_text(strip=True)
+                if not _is_valid_price_text(price_text):
                     continue
-            
-            # Son çare: Sayfa metninden regex ile fiyat çıkar (Selenium kodundan)
-            try:
-                page_text = soup.get_text(" ")
-                # Fiyat desenini ara (örn: 1.234,56 TL veya 1234 TL veya 1.234,56₺)
-                price_patterns = [
-                    r'(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)\s*(?:TL|₺|tl)',
-                    r'(?:TL|₺|tl)\s*(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)',
-                    r'(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)\s*₺',
-                ]
                 
-                valid_prices = []
-                for pattern in price_patterns:
-                    matches = re.findall(pattern, page_text)
-                    for m in matches:
-                        digits_only = m.replace('.', '').replace(',', '')
-                        # En az 3 rakam içermeli ve virgül/noktayla başlamamalı
-                        if len(digits_only) >= 3 and not m.startswith(',') and not m.startswith('.'):
-                            try:
-                                # En büyük sayıyı al (genelde fiyat en büyük sayıdır)
-                                numeric_val = float(m.replace('.', '').replace(',', '.'))
-                                if 1 <= numeric_val <= 1000000:
-                                    valid_prices.append((numeric_val, m))
-                            except (ValueError, AttributeError):
-                                continue
-                
-                if valid_prices:
-                    # En büyük sayıyı al (fiyat genelde en büyük sayıdır)
-                    valid_prices.sort(key=lambda x: x[0], reverse=True)
-                    best_price = valid_prices[0][0]
-                    logger.debug(f"Hepsiburada: Regex ile fiyat bulundu: {best_price}")
+                price_val = extract_price(price_text)
+                if price_val is not None:
+                    logger.debug(f"Hepsiburada: HTML'den fiyat bulundu (data-test-id): {price_val} (data-test-id: {price_element.get('data-test-id')})")
                     return {
-                        'price': best_price,
+                        'price': price_val,
                         'currency': 'TRY',
                         'success': True,
                         'error': None
                     }
+        except Exception as e:
+            logger.debug(f"Selector hatası ({_HB_SPECIFIC_PRICE_SELECTOR}): {e}")
+        
+        # Eğer spesifik selector'lardan bulunamadıysa, genel selector'ları dene
+        for selector in _HB_GENERAL_PRICE_SELECTORS:
+            try:
+                if isinstance(selector, str):
+                    price_elements = soup.select(selector)
+                else:
+                    price_elements = soup.find_all(**selector)
+                
+                for price_element in price_elements:
+                    if not price_element:
+                        continue
+                    
+                    price_text = price_element.get_text(strip=True)
+                    if not price_text or len(price_text) < 3:
+                        continue
+                    
+                    # TL veya ₺ içermeli ve uzunluğu makul olmalı
+                    if len(price_text) > 50 or not _CURRENCY_MARK_RE.search(price_text):
+                        continue
+                    
+                    if not _is_valid_price_text(price_text):
+                        continue
+                    
+                    price_val = extract_price(price_text)
+                    if price_val is not None:
+                        logger.debug(f"Hepsiburada: HTML'den fiyat bulundu (genel): {price_val}")
+                        return {
+                            'price': price_val,
+                            'currency': 'TRY',
+                            'success': True,
+                            'error': None
+                        }
             except Exception as e:
-                logger.debug(f"Regex fiyat arama hatası: {e}")
-            
-            # Yöntem 3: JavaScript içinde daha detaylı fiyat ara (tekrar, ama daha kapsamlı)
-            for script in all_scripts:
-                if not script.string:
-                    continue
-                script_text = script.string
-                
-                # Daha spesifik pattern'ler
-                patterns = [
-                    r'"price"\s*:\s*"?(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)"?,',  # "price":"12.499,25",
-                    r'"finalPrice"\s*:\s*"?(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)"?,',
-                    r'"salePrice"\s*:\s*"?(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)"?,',
-                    r'"currentPrice"\s*:\s*"?(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)"?,',
-                    r'"offeringPrice"\s*:\s*"?(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)"?,',
-                    r'price["\']?\s*:\s*["\']?(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)["\']?',
-                    r'finalPrice["\']?\s*:\s*["\']?(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)["\']?',
-                    r'offeringPrice["\']?\s*:\s*["\']?(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)["\']?',
-                ]
-                for pattern in patterns:
-                    matches = re.finditer(pattern, script_text, re.IGNORECASE)
-                    for match in matches:
+                logger.debug(f"Selector hatası: {e}")
+                continue
+        
+        # Son çare: Sayfa metninden regex ile fiyat çıkar (Selenium kodundan)
+        try:
+            # Navigasyon/footer gürültüsünü atlamak için önce <main>, yoksa <body> metni;
+            # fiyat sayfanın üst kısmında olduğu için metin PAGE_TEXT_LIMIT ile sınırlanır
+            container = soup.find('main') or soup.body or soup
+            page_text = container.get_text(" ")[:PAGE_TEXT_LIMIT]
+            # Fiyat desenini ara (örn: 1.234,56 TL veya 1234 TL veya 1.234,56₺)
+            valid_prices = []
+            for pattern in _TL_PRICE_PATTERNS:
+                matches = pattern.findall(page_text)
+                for m in matches:
+                    digits_only = m.translate(_DROP_SEPARATORS_TRANS)
+                    # En az 3 rakam içermeli ve virgül/noktayla başlamamalı
+                    if len(digits_only) >= 3 and not m.startswith(',') and not m.startswith('.'):
                         try:
-                            price_str = match.group(1).replace('.', '').replace(',', '.')
-                            price_val = float(price_str)
-                            if 1 <= price_val <= 1000000:
-                                logger.debug(f"Hepsiburada: JS pattern'den fiyat bulundu: {price_val}")
-                                return {
-                                    'price': price_val,
-                                    'currency': 'TRY',
-                                    'success': True,
-                                    'error': None
-                                }
-                        except (ValueError, IndexError):
+                            # En büyük sayıyı al (genelde fiyat en büyük sayıdır)
+                            numeric_val = float(m.translate(_TR_DECIMAL_TRANS))
+                            if 1 <= numeric_val <= 1000000:
+                                valid_prices.append((numeric_val, m))
+                        except (ValueError, AttributeError):
                             continue
             
-            # Fiyat bulunamadıysa hemen geç (retry yok)
-            if price is None:
-                logger.warning(f"Hepsiburada: Fiyat bulunamadı, geçiliyor...")
+            if valid_prices:
+                # En büyük sayıyı al (fiyat genelde en büyük sayıdır)
+                best_price = max(valid_prices, key=lambda x: x[0])[0]
+                logger.debug(f"Hepsiburada: Regex ile fiyat bulundu: {best_price}")
                 return {
-                    'price': None,
-                    'currency': None,
-                    'success': False,
-                    'error': 'Price not found on page'
+                    'price': best_price,
+                    'currency': 'TRY',
+                    'success': True,
+                    'error': None
                 }
+        except Exception as e:
+            logger.debug(f"Regex fiyat arama hatası: {e}")
+        
+        # Yöntem 3: Yöntem 0 taramasında bulunan tam sayı JavaScript fiyatı (örn: "price":12499)
+        if js_fallback_price is not None:
+            logger.debug(f"Hepsiburada: JS pattern'den fiyat bulundu: {js_fallback_price}")
+            return {
+                'price': js_fallback_price,
+                'currency': 'TRY',
+                'success': True,
+                'error': None
+            }
+        
+        # Fiyat bulunamadıysa hemen geç (retry yok)
+        if price is None:
+            logger.warning(f"Hepsiburada: Fiyat bulunamadı, geçiliyor...")
+            return {
+                'price': None,
+                'currency': None,
+                'success': False,
+                'error': 'Price not found on page'
+            }
     
     except httpx.TimeoutException:
         logger.warning(f"Hepsiburada: Timeout, geçiliyor...")
@@ -1202,29 +1858,28 @@ async def extract_price_from_hepsiburada(url: str, max_retries: int = 0) -> Dict
         }
 
 
+@functools.lru_cache(maxsize=4096)
 def extract_price(price_text: str):
     """
     Fiyat metnini temizleyip float'a çevirir.
     Türk formatı: 12.499,25 TL -> 12499.25
+    Saf fonksiyon olduğu için sonuçlar metne göre cache'lenir (aynı fiyat metni sayfalarda tekrar eder).
     """
     if not price_text:
         return None
     
-    # Para birimi işaretlerini kaldır
-    price_text = price_text.replace('TL', '').replace('₺', '').replace('TRY', '').strip()
+    # Tek geçişte rakam, nokta ve virgül dışındaki her şeyi (TL, ₺, TRY, boşluk) at
+    price_text = _NON_PRICE_CHARS_RE.sub('', price_text)
     
     # Türk formatı: 12.499,25 -> 12499.25
     # Önce noktaları kaldır (binlik ayırıcı), sonra virgülü noktaya çevir
     if '.' in price_text and ',' in price_text:
         # Format: 12.499,25
-        price_text = price_text.replace('.', '').replace(',', '.')
+        price_text = price_text.translate(_TR_DECIMAL_TRANS)
     elif ',' in price_text:
         # Format: 12499,25
         price_text = price_text.replace(',', '.')
     
-    # Sadece rakam ve nokta bırak
-    price_text = re.sub(r'[^\d.]', '', price_text)
-    
     try:
         price = float(price_text)
         # Geçerli fiyat aralığı kontrolü
@@ -1236,6 +1891,7 @@ def extract_price(price_text: str):
     return None
 
 
+@ttl_cache()
 async def extract_price_from_teknosa(url: str, max_retries: int = 3, proxy: Optional[str] = None) -> Dict[str, any]:
     """
     Teknosa URL'inden fiyat bilgisini çeker. Retry mekanizması ile.
@@ -1296,23 +1952,9 @@ async def extract_price_from_teknosa(url: str, max_retries: int = 3, proxy: Opti
                     # curl_cffi ile browser fingerprint simülasyonu
                     # ÖNEMLİ: Manuel headers kullanmıyoruz, curl_cffi hallediyor
                     try:
-                        # Proxy desteği için altyapı hazırla
-                        request_kwargs = {
-                            'url': url,
-                            'timeout': int(timeout_duration),
-                            'impersonate': 'chrome110'  # Güncel bir browser taklidi
-                        }
-                        
-                        # Proxy varsa ekle
-                        if proxy:
-                            request_kwargs['proxies'] = {
-                                'http': proxy,
-                                'https': proxy
-                            }
-                        
                         response = await loop.run_in_executor(
                             None,
-                            lambda: curl_requests.get(**request_kwargs)
+                            lambda: _get_bot_session(proxy).get(url, timeout=int(timeout_duration))
                         )
                     except Exception as e:
                         logger.warning(f"curl_cffi hatası: {str(e)[:50]}")
@@ -1328,20 +1970,9 @@ async def extract_price_from_teknosa(url: str, max_retries: int = 3, proxy: Opti
                 elif USE_CLOUDSCRAPER and cloudscraper is not None:
                     # cloudscraper ile Cloudflare bypass
                     try:
-                        scraper_kwargs = {
-                            'browser': {'browser': 'chrome', 'platform': 'darwin', 'desktop': True}
-                        }
-                        # Proxy desteği
-                        if proxy:
-                            scraper_kwargs['proxies'] = {
-                                'http': proxy,
-                                'https': proxy
-                            }
-                        
-                        scraper = cloudscraper.create_scraper(**scraper_kwargs)
                         response = await loop.run_in_executor(
                             None,
-                            lambda: scraper.get(url, headers=headers, timeout=int(timeout_duration))
+                            lambda: _get_bot_session(proxy).get(url, headers=headers, timeout=int(timeout_duration))
                         )
                     except Exception as e:
                         logger.warning(f"cloudscraper hatası: {str(e)[:50]}")
@@ -1399,121 +2030,63 @@ async def extract_price_from_teknosa(url: str, max_retries: int = 3, proxy: Opti
                             'success': False,
                             'error': 'No content in response'
                         }
-                
-                soup = BeautifulSoup(html_content, 'html.parser')
             else:
                 # Normal httpx (403 hatası alabilir)
-                async with httpx.AsyncClient(
-                    timeout=timeout_duration, 
-                    headers=headers, 
-                    follow_redirects=True, 
-                    limits=httpx.Limits(max_keepalive_connections=3, max_connections=5)
-                ) as client:
-                    # Asıl ürün sayfasına git (ana sayfayı atla - 403 veriyor)
-                    response = await client.get(url)
-                    
-                    # 403 hatası alırsak, hemen çık (zaman kaybetme)
-                    if response.status_code == 403:
-                        logger.warning(f"403 Forbidden - Bot koruması aktif, atlanıyor...")
-                        return {
-                            'price': None,
-                            'currency': None,
-                            'success': False,
-                            'error': '403 Forbidden - Bot protection (curl_cffi veya cloudscraper yükleyin)'
-                        }
-                    
-                    response.raise_for_status()
-                    html_content = response.text
-                    soup = BeautifulSoup(html_content, 'html.parser')
+                client = get_http_client()
+                # Asıl ürün sayfasına git (ana sayfayı atla - 403 veriyor)
+                response = await client.get(url, headers=headers, timeout=timeout_duration)
+                
+                # 403 hatası alırsak, hemen çık (zaman kaybetme)
+                if response.status_code == 403:
+                    logger.warning(f"403 Forbidden - Bot koruması aktif, atlanıyor...")
+                    return {
+                        'price': None,
+                        'currency': None,
+                        'success': False,
+                        'error': '403 Forbidden - Bot protection (curl_cffi veya cloudscraper yükleyin)'
+                    }
+                
+                response.raise_for_status()
+                html_content = response.text
             
             # Fiyat çekme işlemleri (her iki yöntem için ortak)
             price = None
             
             # Yöntem 0: Attribute'lardan direkt fiyat çek (en güvenilir - ÖNCE BUNU DENE)
-            # Teknosa data-product-price, data-price-with-discount kullanıyor
-            price_attrs = ['data-product-price', 'data-price-with-discount', 'data-price-without-discount']
-            for attr in price_attrs:
-                price_elem = soup.find(attrs={attr: True})
-                if price_elem:
-                    price_str = price_elem.get(attr, '')
-                    if price_str:
-                        try:
-                            price_val = float(price_str)
-                            if 1 <= price_val <= 1000000:
-                                price = price_val
-                                logger.debug(f"Teknosa: Attribute'dan fiyat bulundu: {price} ({attr})")
-                                return {
-                                    'price': price,
-                                    'currency': 'TRY',
-                                    'success': True,
-                                    'error': None
-                                }
-                        except (ValueError, TypeError):
-                            continue
+            # Teknosa data-product-price, data-price-with-discount kullanıyor.
+            # Önce ham HTML'de regex ile ara; bulunursa sayfa hiç parse edilmez
+            attr_price = _price_from_teknosa_attrs(html_content)
+            if attr_price:
+                price, attr = attr_price
+                logger.debug(f"Teknosa: Attribute'dan fiyat bulundu: {price} ({attr})")
+                return {
+                    'price': price,
+                    'currency': 'TRY',
+                    'success': True,
+                    'error': None
+                }
             
             # Yöntem 0b: Tüm script tag'lerinde JavaScript global değişkenlerinde ara (Trendyol gibi)
-            all_scripts = soup.find_all('script')
-            for script in all_scripts:
-                if not script.string:
-                    continue
-                script_text = script.string
-                
-                # Teknosa özel pattern'ler (Trendyol mantığı ile)
-                patterns_js = [
-                    r'"price"\s*:\s*"?(\d+[.,]\d+)"?',
-                    r'"finalPrice"\s*:\s*"?(\d+[.,]\d+)"?',
-                    r'"salePrice"\s*:\s*"?(\d+[.,]\d+)"?',
-                    r'"discountedPrice"\s*:\s*"?(\d+[.,]\d+)"?',
-                    r'"currentPrice"\s*:\s*"?(\d+[.,]\d+)"?',
-                    r'"productPrice"\s*:\s*"?(\d+[.,]\d+)"?',
-                    r'"sellingPrice"\s*:\s*"?(\d+[.,]\d+)"?',
-                    r'price["\']?\s*:\s*["\']?(\d+[.,]\d+)',
-                    r'finalPrice["\']?\s*:\s*["\']?(\d+[.,]\d+)',
-                    r'currentPrice["\']?\s*:\s*["\']?(\d+[.,]\d+)',
-                    r'productPrice["\']?\s*:\s*["\']?(\d+[.,]\d+)',
-                ]
-                for pattern in patterns_js:
-                    matches = re.finditer(pattern, script_text, re.IGNORECASE)
-                    for match in matches:
-                        try:
-                            price_str = match.group(1)
-                            # Binlik ayırıcıları kaldır
-                            if '.' in price_str and ',' in price_str:
-                                # Format: 12.499,25 -> 12499.25
-                                price_str = price_str.replace('.', '').replace(',', '.')
-                            elif ',' in price_str:
-                                # Format: 12499,25 -> 12499.25
-                                price_str = price_str.replace(',', '.')
-                            price_val = float(price_str)
-                            if 1 <= price_val <= 1000000:
-                                price = price_val
-                                logger.debug(f"Teknosa: JavaScript'ten fiyat bulundu: {price}")
-                                return {
-                                    'price': price,
-                                    'currency': 'TRY',
-                                    'success': True,
-                                    'error': None
-                                }
-                        except (ValueError, IndexError):
-                            continue
+            # Script gövdeleri ham HTML'den alınır; tırnaklı anahtarlar öncelik sırasıyla, gevşek
+            # "...price:" pattern'i son çare olarak kullanılır. Ondalıklı değerler sayfa parse
+            # edilmeden hemen döner, tam sayı değerler 2b adımı için saklanır
+            price, js_fallback_price = _scan_ranked_js_prices(_raw_price_scripts(html_content), _TK_JS_PRICE_KEYS)
+            if price is not None:
+                logger.debug(f"Teknosa: JavaScript'ten fiyat bulundu: {price}")
+                return {
+                    'price': price,
+                    'currency': 'TRY',
+                    'success': True,
+                    'error': None
+                }
             
-            # 1) HTML üstünden dene (CSS selector'lar)
-            candidate_selectors = [
-                '[data-testid*="price"]',
-                '.price',
-                '.product-price',
-                '.prc',
-                '.current-price',
-                '.sale-price',
-                'span[class*="price"]',
-                'div[class*="price"]',
-                '[class*="product-price"]',
-                '[class*="price-current"]',
-            ]
+            # Hızlı yollar sonuç vermediyse sayfa parse edilir
+            soup = BeautifulSoup(html_content, HTML_PARSER, parse_only=_TK_SOUP_STRAINER)
             
-            for sel in candidate_selectors:
+            # 1) HTML üstünden dene (CSS selector'lar)
+            for sel, elements in _match_selectors(soup, _TK_PRICE_SELECTORS, _TK_PRICE_SELECTOR_GROUP):
                 try:
-                    el = soup.select_one(sel)
+                    el = elements[0]
                     if el:
                         txt = el.get_text(" ", strip=True)
                         price = extract_price(txt)
@@ -1534,8 +2107,10 @@ async def extract_price_from_teknosa(url: str, max_retries: int = 3, proxy: Opti
             scripts = soup.find_all('script', type='application/ld+json')
             for script in scripts:
                 try:
-                    if script.string:
-                        data = json.loads(script.string)
+                    # offers içermeyen JSON-LD blokları (breadcrumb, organization vb.) parse edilmez
+                    if script.string and '"offers"' in script.string:
+                        # orjson str alt sınıflarını (bs4 NavigableString) kabul etmez
+                        data = orjson.loads(str(script.string))
                         if isinstance(data, dict):
                             # Schema.org Product formatı
                             if 'offers' in data:
@@ -1548,7 +2123,7 @@ async def extract_price_from_teknosa(url: str, max_retries: int = 3, proxy: Opti
                                         return {
                                             'price': price,
                                             'currency': currency,
-                                            'title': title,
+                                            'title': data.get('name'),
                                             'success': True,
                                             'error': None
                                         }
@@ -1560,47 +2135,22 @@ async def extract_price_from_teknosa(url: str, max_retries: int = 3, proxy: Opti
                                         return {
                                             'price': price,
                                             'currency': currency,
-                                            'title': title,
+                                            'title': data.get('name'),
                                             'success': True,
                                             'error': None
                                         }
-                except (json.JSONDecodeError, ValueError, KeyError):
+                except (orjson.JSONDecodeError, ValueError, KeyError):
                     continue
             
-            # 2b) Büyük script blob içinde daha kapsamlı fiyat araması (Trendyol gibi)
-            for script in all_scripts:
-                if not script.string:
-                    continue
-                script_text = script.string
-                
-                # Daha spesifik pattern'ler (Trendyol gibi)
-                patterns = [
-                    r'"price"\s*:\s*"?(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)"?,',  # "price":"12.499,25",
-                    r'"finalPrice"\s*:\s*"?(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)"?,',
-                    r'"salePrice"\s*:\s*"?(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)"?,',
-                    r'"currentPrice"\s*:\s*"?(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)"?,',
-                    r'"productPrice"\s*:\s*"?(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)"?,',
-                    r'"discountedPrice"\s*:\s*"?(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)"?,',
-                    r'price["\']?\s*:\s*["\']?(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)["\']?',
-                    r'finalPrice["\']?\s*:\s*["\']?(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)["\']?',
-                    r'productPrice["\']?\s*:\s*["\']?(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)["\']?',
-                ]
-                for pattern in patterns:
-                    matches = re.finditer(pattern, script_text, re.IGNORECASE)
-                    for match in matches:
-                        try:
-                            price_str = match.group(1).replace('.', '').replace(',', '.')
-                            price_val = float(price_str)
-                            if 1 <= price_val <= 1000000:
-                                logger.debug(f"Teknosa: JS pattern'den fiyat bulundu: {price_val}")
-                                return {
-                                    'price': price_val,
-                                    'currency': 'TRY',
-                                    'success': True,
-                                    'error': None
-                                }
-                        except (ValueError, IndexError):
-                            continue
+            # 2b) Yöntem 0b taramasında bulunan tam sayı JavaScript fiyatı (örn: "price":12499)
+            if js_fallback_price is not None:
+                logger.debug(f"Teknosa: JS pattern'den fiyat bulundu: {js_fallback_price}")
+                return {
+                    'price': js_fallback_price,
+                    'currency': 'TRY',
+                    'success': True,
+                    'error': None
+                }
             
             # Fiyat bulunamadıysa retry yap
             if price is None:
@@ -1672,6 +2222,7 @@ async def extract_price_from_teknosa(url: str, max_retries: int = 3, proxy: Opti
     }
 
 
+@ttl_cache()
 async def extract_price_from_amazon(url: str, max_retries: int = 2) -> Dict[str, any]:
     """
     Amazon URL'inden fiyat bilgisini çeker. Retry mekanizması ile.
@@ -1707,181 +2258,111 @@ async def extract_price_from_amazon(url: str, max_retries: int = 2) -> Dict[str,
             
             timeout_duration = 25.0 if attempt == max_retries else 15.0
             
-            async with httpx.AsyncClient(
-                timeout=timeout_duration, 
-                headers=headers, 
-                follow_redirects=True, 
-                limits=httpx.Limits(max_keepalive_connections=3, max_connections=5)
-            ) as client:
-                response = await client.get(url)
-                logger.info(f"📥 Amazon HTTP yanıtı alındı - Status: {response.status_code}, URL: {response.url}")
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.text, 'html.parser')
-                logger.debug(f"📄 Amazon HTML parse edildi - Sayfa başlığı: {soup.title.string if soup.title else 'N/A'}")
-                price = None
-                currency = 'TRY'
-                product_title = None
-                
-                # Ürün başlığını çıkar
-                title_selectors = [
-                    '#productTitle',
-                    'h1.a-size-large',
-                    'h1#title',
-                    'span#productTitle',
-                    'h1 span',
-                ]
-                for selector in title_selectors:
-                    try:
-                        title_elem = soup.select_one(selector)
-                        if title_elem:
-                            product_title = title_elem.get_text(strip=True)
-                            if product_title:
-                                logger.debug(f"📦 Amazon ürün başlığı bulundu: {product_title[:80]}...")
-                                break
-                    except:
-                        continue
-                
-                # Yöntem 0: JavaScript global değişkenlerinden fiyat çek (Trendyol mantığı)
-                all_scripts = soup.find_all('script')
-                for script in all_scripts:
-                    if not script.string:
-                        continue
-                    script_text = script.string
-                    
-                    # Amazon özel pattern'ler
-                    patterns_js = [
-                        r'"price"\s*:\s*"?(\d+[.,]\d+)"?',
-                        r'"priceAmount"\s*:\s*"?(\d+[.,]\d+)"?',
-                        r'"displayPrice"\s*:\s*"?(\d+[.,]\d+)"?',
-                        r'"finalPrice"\s*:\s*"?(\d+[.,]\d+)"?',
-                        r'"salePrice"\s*:\s*"?(\d+[.,]\d+)"?',
-                        r'"currentPrice"\s*:\s*"?(\d+[.,]\d+)"?',
-                        r'"amount"\s*:\s*"?(\d+[.,]\d+)"?',
-                        r'data-asin-price=["\'](\d+[.,]\d+)["\']',
-                        r'price["\']?\s*:\s*["\']?(\d+[.,]\d+)',
-                        r'priceAmount["\']?\s*:\s*["\']?(\d+[.,]\d+)',
-                    ]
-                    for pattern in patterns_js:
-                        matches = re.finditer(pattern, script_text, re.IGNORECASE)
-                        for match in matches:
-                            try:
-                                price_str = match.group(1)
-                                # Binlik ayırıcıları kaldır
-                                if '.' in price_str and ',' in price_str:
-                                    price_str = price_str.replace('.', '').replace(',', '.')
-                                elif ',' in price_str:
-                                    price_str = price_str.replace(',', '.')
-                                price_val = float(price_str)
-                                if 1 <= price_val <= 1000000:
-                                    price = price_val
-                                    logger.info(f"✅ Amazon: JavaScript'ten fiyat bulundu: {price} TRY - URL: {url}")
-                                    return {
-                                        'price': price,
-                                        'currency': 'TRY',
-                                        'title': product_title,
-                                        'success': True,
-                                        'error': None
-                                    }
-                            except (ValueError, IndexError):
-                                continue
-                
-                # Yöntem 1: JSON-LD formatından fiyat çek
-                scripts = soup.find_all('script', type='application/ld+json')
-                for script in scripts:
-                    try:
-                        if script.string:
-                            data = json.loads(script.string)
-                            if isinstance(data, dict):
-                                # Schema.org Product formatı
-                                if 'offers' in data:
-                                    offers = data['offers']
-                                    if isinstance(offers, dict):
-                                        if 'price' in offers:
-                                            price = float(offers['price'])
-                                            currency = offers.get('priceCurrency', 'TRY')
-                                            logger.debug(f"Amazon: JSON-LD'den fiyat bulundu: {price}")
-                                            return {
-                                                'price': price,
-                                                'currency': currency,
-                                                'title': product_title,
-                                                'success': True,
-                                                'error': None
-                                            }
-                                    elif isinstance(offers, list) and len(offers) > 0:
-                                        if 'price' in offers[0]:
-                                            price = float(offers[0]['price'])
-                                            currency = offers[0].get('priceCurrency', 'TRY')
-                                            logger.debug(f"Amazon: JSON-LD listesinden fiyat bulundu: {price}")
-                                            return {
-                                                'price': price,
-                                                'currency': currency,
-                                                'title': product_title,
-                                                'success': True,
-                                                'error': None
-                                            }
-                    except (json.JSONDecodeError, ValueError, KeyError):
-                        continue
-                
-                # Yöntem 2: HTML selector'larından fiyat çek (Amazon'un özel selector'ları)
-                # Amazon fiyat selector'ları (öncelik sırasına göre)
-                amazon_price_selectors = [
-                    '#priceblock_ourprice',  # Normal fiyat
-                    '#priceblock_dealprice',  # İndirimli fiyat
-                    '#priceblock_saleprice',  # Satış fiyatı
-                    'span.a-price-whole',  # Tam fiyat kısmı (örn: "1.234")
-                    'span.a-price[data-a-color="base"] span.a-offscreen',  # Gizli fiyat
-                    '.a-price .a-offscreen',  # Genel gizli fiyat
-                    'span[data-asin-price]',  # Data attribute
-                ]
-                
-                # Önce spesifik selector'ları dene
-                for selector in amazon_price_selectors:
-                    try:
-                        price_elements = soup.select(selector)
-                        for price_element in price_elements:
-                            if not price_element:
-                                continue
-                            
-                            # Data attribute varsa onu al
-                            if 'data-asin-price' in price_element.attrs:
-                                try:
-                                    price_val = float(price_element['data-asin-price'])
-                                    if 1 <= price_val <= 1000000:
-                                        logger.debug(f"Amazon: Data attribute'dan fiyat bulundu: {price_val} (selector: {selector})")
+            client = get_http_client()
+            response = await client.get(url, headers=headers, timeout=timeout_duration)
+            logger.info(f"📥 Amazon HTTP yanıtı alındı - Status: {response.status_code}, URL: {response.url}")
+            response.raise_for_status()
+            
+            soup = BeautifulSoup(response.text, HTML_PARSER)
+            logger.debug(f"📄 Amazon HTML parse edildi - Sayfa başlığı: {soup.title.string if soup.title else 'N/A'}")
+            price = None
+            currency = 'TRY'
+            product_title = None
+            
+            # Ürün başlığını çıkar
+            title_selectors = [
+                '#productTitle',
+                'h1.a-size-large',
+                'h1#title',
+                'span#productTitle',
+                'h1 span',
+            ]
+            for selector in title_selectors:
+                try:
+                    title_elem = soup.select_one(selector)
+                    if title_elem:
+                        product_title = title_elem.get_text(strip=True)
+                        if product_title:
+                            logger.debug(f"📦 Amazon ürün başlığı bulundu: {product_title[:80]}...")
+                            break
+                except:
+                    continue
+            
+            # Yöntem 0: JavaScript global değişkenlerinden fiyat çek (Trendyol mantığı)
+            # Amazon özel anahtarlar: tırnaklı anahtarlar öncelik sırasıyla, script başına tek geçiş
+            all_scripts, jsonld_scripts = _collect_scripts(soup)
+            price, _ = _scan_ranked_js_prices(
+                (
+                    script_text for script_text in (script.string for script in all_scripts)
+                    if script_text and _has_price_anchor(script_text, _AMAZON_PRICE_ANCHORS)
+                ),
+                _AMZ_JS_PRICE_KEYS,
+                _AMZ_JS_LOOSE_PRICE_RES,
+                _classify_js_decimal_price,
+            )
+            if price is not None:
+                logger.info(f"✅ Amazon: JavaScript'ten fiyat bulundu: {price} TRY - URL: {url}")
+                return {
+                    'price': price,
+                    'currency': 'TRY',
+                    'title': product_title,
+                    'success': True,
+                    'error': None
+                }
+            
+            # Yöntem 1: JSON-LD formatından fiyat çek
+            scripts = jsonld_scripts
+            for script in scripts:
+                try:
+                    # offers içermeyen JSON-LD blokları (breadcrumb, organization vb.) parse edilmez
+                    if script.string and '"offers"' in script.string:
+                        # orjson str alt sınıflarını (bs4 NavigableString) kabul etmez
+                        data = orjson.loads(str(script.string))
+                        if isinstance(data, dict):
+                            # Schema.org Product formatı
+                            if 'offers' in data:
+                                offers = data['offers']
+                                if isinstance(offers, dict):
+                                    if 'price' in offers:
+                                        price = float(offers['price'])
+                                        currency = offers.get('priceCurrency', 'TRY')
+                                        logger.debug(f"Amazon: JSON-LD'den fiyat bulundu: {price}")
                                         return {
-                                            'price': price_val,
-                                            'currency': 'TRY',
+                                            'price': price,
+                                            'currency': currency,
                                             'title': product_title,
                                             'success': True,
                                             'error': None
                                         }
-                                except (ValueError, KeyError):
-                                    pass
-                            
-                            # Text içeriğinden fiyat çıkar
-                            price_text = price_element.get_text(strip=True)
-                            if not price_text or len(price_text) < 3:
-                                continue
-                            
-                            # Fiyat temizleme (TL, ₺, TL sembolleri vb. kaldır)
-                            price_cleaned = price_text.replace('TL', '').replace('₺', '').replace('TRY', '').replace('$', '').strip()
-                            
-                            # Türk formatı: 1.234,56 veya 1234,56 veya 12.499 TL
-                            if '.' in price_cleaned and ',' in price_cleaned:
-                                # Format: 12.499,25 -> 12499.25
-                                price_cleaned = price_cleaned.replace('.', '').replace(',', '.')
-                            elif ',' in price_cleaned:
-                                # Format: 12499,25 -> 12499.25
-                                price_cleaned = price_cleaned.replace(',', '.')
-                            
-                            # Sadece rakam ve nokta bırak
-                            price_cleaned = re.sub(r'[^\d.]', '', price_cleaned)
-                            
+                                elif isinstance(offers, list) and len(offers) > 0:
+                                    if 'price' in offers[0]:
+                                        price = float(offers[0]['price'])
+                                        currency = offers[0].get('priceCurrency', 'TRY')
+                                        logger.debug(f"Amazon: JSON-LD listesinden fiyat bulundu: {price}")
+                                        return {
+                                            'price': price,
+                                            'currency': currency,
+                                            'title': product_title,
+                                            'success': True,
+                                            'error': None
+                                        }
+                except (orjson.JSONDecodeError, ValueError, KeyError):
+                    continue
+            
+            # Yöntem 2: HTML selector'larından fiyat çek (Amazon'un özel selector'ları)
+            # Önce spesifik selector'ları dene
+            for selector, price_elements in _match_selectors(soup, _AMZ_PRICE_SELECTORS, _AMZ_PRICE_SELECTOR_GROUP):
+                try:
+                    for price_element in price_elements:
+                        if not price_element:
+                            continue
+                        
+                        # Data attribute varsa onu al
+                        if 'data-asin-price' in price_element.attrs:
                             try:
-                                price_val = float(price_cleaned)
+                                price_val = float(price_element['data-asin-price'])
                                 if 1 <= price_val <= 1000000:
-                                    logger.debug(f"Amazon: HTML'den fiyat bulundu: {price_val} (selector: {selector})")
+                                    logger.debug(f"Amazon: Data attribute'dan fiyat bulundu: {price_val} (selector: {selector})")
                                     return {
                                         'price': price_val,
                                         'currency': 'TRY',
@@ -1889,239 +2370,249 @@ async def extract_price_from_amazon(url: str, max_retries: int = 2) -> Dict[str,
                                         'success': True,
                                         'error': None
                                     }
-                            except (ValueError, AttributeError):
-                                continue
-                    except Exception as e:
-                        logger.debug(f"Selector hatası ({selector}): {e}")
-                        continue
-                
-                # Yöntem 3: .a-price-whole ve .a-price-fraction kombinasyonu (Amazon özel)
-                try:
-                    price_whole_elem = soup.select_one('span.a-price-whole')
-                    price_fraction_elem = soup.select_one('span.a-price-fraction')
-                    
-                    if price_whole_elem and price_fraction_elem:
-                        whole_text = price_whole_elem.get_text(strip=True).replace('.', '').replace(',', '')
-                        fraction_text = price_fraction_elem.get_text(strip=True)
+                            except (ValueError, KeyError):
+                                pass
                         
-                        try:
-                            whole_val = float(whole_text) if whole_text else 0
-                            fraction_val = float(fraction_text) / (10 ** len(fraction_text)) if fraction_text else 0
-                            price_val = whole_val + fraction_val
-                            
-                            if 1 <= price_val <= 1000000:
-                                logger.debug(f"Amazon: Whole+Fraction'dan fiyat bulundu: {price_val}")
-                                return {
-                                    'price': price_val,
-                                    'currency': 'TRY',
-                                    'title': product_title,
-                                    'success': True,
-                                    'error': None
-                                }
-                        except (ValueError, AttributeError):
-                            pass
+                        # Text içeriğinden fiyat çıkar
+                        price_text = price_element.get_text(strip=True)
+                        if not price_text or len(price_text) < 3:
+                            continue
+                        
+                        price_val = extract_price(price_text)
+                        if price_val is not None:
+                            logger.debug(f"Amazon: HTML'den fiyat bulundu: {price_val} (selector: {selector})")
+                            return {
+                                'price': price_val,
+                                'currency': 'TRY',
+                                'title': product_title,
+                                'success': True,
+                                'error': None
+                            }
                 except Exception as e:
-                    logger.debug(f"Whole+Fraction hatası: {e}")
-                
-                # Yöntem 4: Genel fiyat selector'ları
-                general_selectors = [
-                    '.a-price',
-                    '.a-color-price',
-                    '[class*="price"]',
-                    '[id*="price"]',
-                ]
-                
-                for selector in general_selectors:
-                    try:
-                        price_elements = soup.select(selector)
-                        for price_element in price_elements:
-                            price_text = price_element.get_text(strip=True)
-                            if not price_text or len(price_text) < 3:
-                                continue
-                            
-                            # TL veya ₺ içermeli
-                            if 'tl' not in price_text.lower() and '₺' not in price_text and '$' not in price_text:
-                                continue
-                            
-                            # Fiyat temizleme
-                            price_cleaned = extract_price(price_text)
-                            if price_cleaned:
-                                logger.debug(f"Amazon: Genel selector'dan fiyat bulundu: {price_cleaned} (selector: {selector})")
-                                return {
-                                    'price': price_cleaned,
-                                    'currency': 'TRY',
-                                    'title': product_title,
-                                    'success': True,
-                                    'error': None
-                                }
-                    except Exception as e:
-                        logger.debug(f"Genel selector hatası ({selector}): {e}")
-                        continue
+                    logger.debug(f"Selector hatası ({selector}): {e}")
+                    continue
+            
+            # Yöntem 3: .a-price-whole ve .a-price-fraction kombinasyonu (Amazon özel)
+            try:
+                price_whole_elem = soup.select_one('span.a-price-whole')
+                price_fraction_elem = soup.select_one('span.a-price-fraction')
                 
-                # HTTP ile fiyat bulunamadıysa, Selenium ile deneyelim
-                if attempt == max_retries and USE_SELENIUM:
-                    logger.info("Amazon: HTTP ile fiyat bulunamadı, Selenium ile deneniyor...")
+                if price_whole_elem and price_fraction_elem:
+                    whole_text = price_whole_elem.get_text(strip=True).translate(_DROP_SEPARATORS_TRANS)
+                    fraction_text = price_fraction_elem.get_text(strip=True)
+                    
                     try:
-                        loop = asyncio.get_event_loop()
+                        whole_val = float(whole_text) if whole_text else 0
+                        fraction_val = float(fraction_text) / (10 ** len(fraction_text)) if fraction_text else 0
+                        price_val = whole_val + fraction_val
+                        
+                        if 1 <= price_val <= 1000000:
+                            logger.debug(f"Amazon: Whole+Fraction'dan fiyat bulundu: {price_val}")
+                            return {
+                                'price': price_val,
+                                'currency': 'TRY',
+                                'title': product_title,
+                                'success': True,
+                                'error': None
+                            }
+                    except (ValueError, AttributeError):
+                        pass
+            except Exception as e:
+                logger.debug(f"Whole+Fraction hatası: {e}")
+            
+            # Yöntem 4: Genel fiyat selector'ları
+            for selector, price_elements in _match_selectors(soup, _AMZ_GENERAL_PRICE_SELECTORS, _AMZ_GENERAL_PRICE_SELECTOR_GROUP):
+                try:
+                    for price_element in price_elements:
+                        price_text = price_element.get_text(strip=True)
+                        if not price_text or len(price_text) < 3:
+                            continue
                         
-                        def selenium_extract_amazon():
-                            """Selenium ile Amazon fiyat çeken sync fonksiyon"""
-                            driver = get_selenium_driver()
-                            if not driver:
-                                return None, None, "Selenium driver oluşturulamadı"
+                        # TL veya ₺ içermeli
+                        if not _AMZ_CURRENCY_MARK_RE.search(price_text):
+                            continue
+                        
+                        # Fiyat temizleme
+                        price_cleaned = extract_price(price_text)
+                        if price_cleaned:
+                            logger.debug(f"Amazon: Genel selector'dan fiyat bulundu: {price_cleaned} (selector: {selector})")
+                            return {
+                                'price': price_cleaned,
+                                'currency': 'TRY',
+                                'title': product_title,
+                                'success': True,
+                                'error': None
+                            }
+                except Exception as e:
+                    logger.debug(f"Genel selector hatası ({selector}): {e}")
+                    continue
+            
+            # HTTP ile fiyat bulunamadıysa, Selenium ile deneyelim
+            if attempt == max_retries and USE_SELENIUM:
+                logger.info("Amazon: HTTP ile fiyat bulunamadı, Selenium ile deneniyor...")
+                try:
+                    loop = asyncio.get_event_loop()
+                    
+                    def selenium_extract_amazon():
+                        """Selenium ile Amazon fiyat çeken sync fonksiyon"""
+                        driver = acquire_selenium_driver()
+                        if not driver:
+                            return None, None, "Selenium driver oluşturulamadı"
+                        
+                        selenium_title = None
+                        try:
+                            import time
+                            import random
                             
-                            selenium_title = None
+                            wait = WebDriverWait(driver, 20)
+                            
+                            # Sayfaya git
+                            driver.get(url)
+                            
+                            # Sayfanın yüklenmesini bekle
+                            wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+                            time.sleep(3 + random.uniform(1, 2))
+                            
+                            # Popup'ları kapat
                             try:
-                                import time
-                                import random
-                                
-                                wait = WebDriverWait(driver, 20)
-                                
-                                # Sayfaya git
-                                driver.get(url)
-                                
-                                # Sayfanın yüklenmesini bekle
-                                wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-                                time.sleep(3 + random.uniform(1, 2))
-                                
-                                # Popup'ları kapat
-                                try:
-                                    cookie_selectors = [
-                                        "button[id*='cookie']",
-                                        "button[class*='cookie']",
-                                        "#sp-cc-accept",
-                                        "#accept",
-                                    ]
-                                    for selector in cookie_selectors:
-                                        try:
-                                            cookie_btn = driver.find_elements(By.CSS_SELECTOR, selector)
-                                            if cookie_btn and cookie_btn[0].is_displayed():
-                                                driver.execute_script("arguments[0].click();", cookie_btn[0])
-                                                time.sleep(1)
-                                                break
-                                        except:
-                                            continue
-                                except:
-                                    pass
-                                
-                                time.sleep(1)
-                                driver.execute_script("window.scrollTo(0, 300);")
-                                time.sleep(1)
-                                
-                                # Amazon fiyat selector'larını dene
-                                selenium_selectors = [
-                                    "#priceblock_ourprice",
-                                    "#priceblock_dealprice",
-                                    "#priceblock_saleprice",
-                                    "span.a-price-whole",
-                                    "span[data-asin-price]",
-                                    ".a-price .a-offscreen",
+                                cookie_selectors = [
+                                    "button[id*='cookie']",
+                                    "button[class*='cookie']",
+                                    "#sp-cc-accept",
+                                    "#accept",
                                 ]
-                                
-                                for selector in selenium_selectors:
+                                for selector in cookie_selectors:
                                     try:
-                                        elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                                        for elem in elements:
-                                            # Data attribute varsa onu al
-                                            try:
-                                                if 'data-asin-price' in elem.get_attribute('outerHTML'):
-                                                    price_attr = elem.get_attribute('data-asin-price')
-                                                    if price_attr:
-                                                        try:
-                                                            price_val = float(price_attr.replace(',', '.'))
-                                                            if 1 <= price_val <= 1000000:
-                                                                # Başlık çıkar
-                                                                try:
-                                                                    selenium_title = driver.find_element(By.CSS_SELECTOR, "#productTitle, h1#title, span#productTitle").text.strip()
-                                                                except:
-                                                                    pass
-                                                                return price_val, selenium_title, None
-                                                        except:
-                                                            pass
-                                            except:
-                                                pass
-                                            
-                                            # Text içeriğinden fiyat çıkar
-                                            text = elem.text.strip()
-                                            if text:
-                                                price_cleaned = extract_price(text)
-                                                if price_cleaned:
-                                                    # Başlık çıkar
-                                                    try:
-                                                        selenium_title = driver.find_element(By.CSS_SELECTOR, "#productTitle, h1#title, span#productTitle").text.strip()
-                                                    except:
-                                                        pass
-                                                    return price_cleaned, selenium_title, None
+                                        cookie_btn = driver.find_elements(By.CSS_SELECTOR, selector)
+                                        if cookie_btn and cookie_btn[0].is_displayed():
+                                            driver.execute_script("arguments[0].click();", cookie_btn[0])
+                                            time.sleep(1)
+                                            break
                                     except:
                                         continue
-                                
-                                # Whole + Fraction kombinasyonu
+                            except:
+                                pass
+                            
+                            time.sleep(1)
+                            driver.execute_script("window.scrollTo(0, 300);")
+                            time.sleep(1)
+                            
+                            # Amazon fiyat selector'larını dene
+                            selenium_selectors = [
+                                "#priceblock_ourprice",
+                                "#priceblock_dealprice",
+                                "#priceblock_saleprice",
+                                "span.a-price-whole",
+                                "span[data-asin-price]",
+                                ".a-price .a-offscreen",
+                            ]
+                            
+                            for selector in selenium_selectors:
                                 try:
-                                    whole_elem = driver.find_element(By.CSS_SELECTOR, "span.a-price-whole")
-                                    fraction_elem = driver.find_element(By.CSS_SELECTOR, "span.a-price-fraction")
-                                    if whole_elem and fraction_elem:
-                                        whole_text = whole_elem.text.strip().replace('.', '').replace(',', '')
-                                        fraction_text = fraction_elem.text.strip()
+                                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
+                                    for elem in elements:
+                                        # Data attribute varsa onu al
                                         try:
-                                            whole_val = float(whole_text) if whole_text else 0
-                                            fraction_val = float(fraction_text) / (10 ** len(fraction_text)) if fraction_text else 0
-                                            price_val = whole_val + fraction_val
-                                            if 1 <= price_val <= 1000000:
+                                            if 'data-asin-price' in elem.get_attribute('outerHTML'):
+                                                price_attr = elem.get_attribute('data-asin-price')
+                                                if price_attr:
+                                                    try:
+                                                        price_val = float(price_attr.replace(',', '.'))
+                                                        if 1 <= price_val <= 1000000:
+                                                            # Başlık çıkar
+                                                            try:
+                                                                selenium_title = driver.find_element(By.CSS_SELECTOR, "#productTitle, h1#title, span#productTitle").text.strip()
+                                                            except:
+                                                                pass
+                                                            return price_val, selenium_title, None
+                                                    except:
+                                                        pass
+                                        except:
+                                            pass
+                                        
+                                        # Text içeriğinden fiyat çıkar
+                                        text = elem.text.strip()
+                                        if text:
+                                            price_cleaned = extract_price(text)
+                                            if price_cleaned:
                                                 # Başlık çıkar
                                                 try:
                                                     selenium_title = driver.find_element(By.CSS_SELECTOR, "#productTitle, h1#title, span#productTitle").text.strip()
                                                 except:
                                                     pass
-                                                return price_val, selenium_title, None
-                                        except:
-                                            pass
-                                except:
-                                    pass
-                                
-                                # Başlık çıkar (fiyat bulunamasa bile)
-                                try:
-                                    selenium_title = driver.find_element(By.CSS_SELECTOR, "#productTitle, h1#title, span#productTitle").text.strip()
+                                                return price_cleaned, selenium_title, None
                                 except:
-                                    pass
-                                return None, selenium_title, "Selenium ile fiyat bulunamadı"
-                                
-                            except Exception as e:
-                                return None, None, f"Selenium hatası: {str(e)[:50]}"
-                        
-                        # Selenium'u async executor'da çalıştır
-                        selenium_price, selenium_title, selenium_error = await loop.run_in_executor(None, selenium_extract_amazon)
-                        
-                        if selenium_price:
-                            logger.info(f"Amazon: Selenium ile fiyat bulundu: {selenium_price}")
-                            if selenium_title:
-                                product_title = selenium_title
-                            return {
-                                'price': selenium_price,
-                                'currency': 'TRY',
-                                'title': product_title,
-                                'success': True,
-                                'error': None
-                            }
-                        else:
-                            logger.warning(f"Amazon: Selenium ile de fiyat bulunamadı: {selenium_error}")
-                    except Exception as e:
-                        logger.warning(f"Amazon: Selenium denemesi başarısız: {str(e)[:50]}")
-                
-                # Fiyat bulunamadıysa retry yap
-                if price is None:
-                    if attempt < max_retries:
-                        logger.warning(f"⚠️ Fiyat bulunamadı (Amazon, deneme {attempt + 1}/{max_retries + 1}), tekrar denenecek... - URL: {url}")
-                        continue
-                    else:
-                        logger.warning(f"❌ Amazon: Tüm yöntemler denendi, fiyat bulunamadı - URL: {url}")
-                        logger.warning(f"❌ Amazon: Sayfa başlığı: {soup.title.string if soup.title else 'N/A'}")
+                                    continue
+                            
+                            # Whole + Fraction kombinasyonu
+                            try:
+                                whole_elem = driver.find_element(By.CSS_SELECTOR, "span.a-price-whole")
+                                fraction_elem = driver.find_element(By.CSS_SELECTOR, "span.a-price-fraction")
+                                if whole_elem and fraction_elem:
+                                    whole_text = whole_elem.text.strip().translate(_DROP_SEPARATORS_TRANS)
+                                    fraction_text = fraction_elem.text.strip()
+                                    try:
+                                        whole_val = float(whole_text) if whole_text else 0
+                                        fraction_val = float(fraction_text) / (10 ** len(fraction_text)) if fraction_text else 0
+                                        price_val = whole_val + fraction_val
+                                        if 1 <= price_val <= 1000000:
+                                            # Başlık çıkar
+                                            try:
+                                                selenium_title = driver.find_element(By.CSS_SELECTOR, "#productTitle, h1#title, span#productTitle").text.strip()
+                                            except:
+                                                pass
+                                            return price_val, selenium_title, None
+                                    except:
+                                        pass
+                            except:
+                                pass
+                            
+                            # Başlık çıkar (fiyat bulunamasa bile)
+                            try:
+                                selenium_title = driver.find_element(By.CSS_SELECTOR, "#productTitle, h1#title, span#productTitle").text.strip()
+                            except:
+                                pass
+                            return None, selenium_title, "Selenium ile fiyat bulunamadı"
+                            
+                        except Exception as e:
+                            return None, None, f"Selenium hatası: {str(e)[:50]}"
+                        finally:
+                            release_selenium_driver(driver)
+                    
+                    # Selenium'u async executor'da çalıştır
+                    selenium_price, selenium_title, selenium_error = await loop.run_in_executor(_selenium_executor, selenium_extract_amazon)
+                    
+                    if selenium_price:
+                        logger.info(f"Amazon: Selenium ile fiyat bulundu: {selenium_price}")
+                        if selenium_title:
+                            product_title = selenium_title
                         return {
-                            'price': None,
-                            'currency': None,
-                            'success': False,
-                            'error': 'Price not found on page'
+                            'price': selenium_price,
+                            'currency': 'TRY',
+                            'title': product_title,
+                            'success': True,
+                            'error': None
                         }
-                
+                    else:
+                        logger.warning(f"Amazon: Selenium ile de fiyat bulunamadı: {selenium_error}")
+                except Exception as e:
+                    logger.warning(f"Amazon: Selenium denemesi başarısız: {str(e)[:50]}")
+            
+            # Fiyat bulunamadıysa retry yap
+            if price is None:
+                if attempt < max_retries:
+                    logger.warning(f"⚠️ Fiyat bulunamadı (Amazon, deneme {attempt + 1}/{max_retries + 1}), tekrar denenecek... - URL: {url}")
+                    continue
+                else:
+                    logger.warning(f"❌ Amazon: Tüm yöntemler denendi, fiyat bulunamadı - URL: {url}")
+                    logger.warning(f"❌ Amazon: Sayfa başlığı: {soup.title.string if soup.title else 'N/A'}")
+                    return {
+                        'price': None,
+                        'currency': None,
+                        'success': False,
+                        'error': 'Price not found on page'
+                    }
+            
         except httpx.TimeoutException:
             if attempt < max_retries:
                 logger.warning(f"⏱️ Timeout (Amazon, deneme {attempt + 1}/{max_retries + 1}), tekrar denenecek... - URL: {url}")
@@ -2158,6 +2649,21 @@ async def extract_price_from_amazon(url: str, max_retries: int = 2) -> Dict[str,
     }
 
 
+# Ürün adı benzerliğinde kullanılan regex'ler
+_WHITESPACE_RE = re.compile(r'\s+')
+# Model numarası: NX.J23EY.001, AL16-52P-55S2, B07V3NBJC3, G7X Mark III
+_MODEL_NUMBER_RE = re.compile(r'\b([A-Z0-9]+[.-][A-Z0-9]+[.-]?[A-Z0-9]*|[A-Z][0-9]+[A-Z]+[0-9]*|[A-Z]{2,}[0-9]+[A-Z0-9-]*)\b', re.IGNORECASE)
+_NON_MODEL_CHARS_RE = re.compile(r'[^A-Z0-9]')
+
+
+def _text_ratio(a: str, b: str) -> float:
+    """İki metnin benzerlik oranı (0-1): rapidfuzz varsa onunla, yoksa difflib ile"""
+    if _rapidfuzz_ratio is not None:
+        return _rapidfuzz_ratio(a, b) / 100
+    return SequenceMatcher(None, a, b).ratio()
+
+
+@functools.lru_cache(maxsize=4096)
 def calculate_similarity(text1: str, text2: str) -> float:
     """
     Calculate similarity between two product names focusing on:
@@ -2179,8 +2685,8 @@ def calculate_similarity(text1: str, text2: str) -> float:
         return 0.0
     
     # Normalize texts: lowercase, remove extra spaces
-    text1_norm = re.sub(r'\s+', ' ', text1.lower().strip())
-    text2_norm = re.sub(r'\s+', ' ', text2.lower().strip())
+    text1_norm = _WHITESPACE_RE.sub(' ', text1.lower().strip())
+    text2_norm = _WHITESPACE_RE.sub(' ', text2.lower().strip())
     
     # Gereksiz kelimeleri filtrele (teknik detaylar, açıklamalar)
     # Bu kelimeler benzerlik hesaplamasına dahil edilmeyecek
@@ -2213,18 +2719,17 @@ def calculate_similarity(text1: str, text2: str) -> float:
     brand_match = 1.0 if brand1 == brand2 else 0.0
     if not brand_match and brand1 and brand2:
         # Marka benzerliği kontrolü (ör: acer vs acer)
-        brand_similarity = SequenceMatcher(None, brand1, brand2).ratio()
+        brand_similarity = _text_ratio(brand1, brand2)
         brand_match = brand_similarity if brand_similarity > 0.8 else 0.0
     
     # 2. MODEL NUMARASI (Model Number) - Nokta, tire, harf-sayı kombinasyonları
     # Pattern: NX.J23EY.001, AL16-52P-55S2, B07V3NBJC3, G7X Mark III
-    model_pattern = r'\b([A-Z0-9]+[.-][A-Z0-9]+[.-]?[A-Z0-9]*|[A-Z][0-9]+[A-Z]+[0-9]*|[A-Z]{2,}[0-9]+[A-Z0-9-]*)\b'
-    models1_raw = re.findall(model_pattern, text1, re.IGNORECASE)
-    models2_raw = re.findall(model_pattern, text2, re.IGNORECASE)
+    models1_raw = _MODEL_NUMBER_RE.findall(text1)
+    models2_raw = _MODEL_NUMBER_RE.findall(text2)
     
     # Model numaralarını normalize et ve filtrele
-    models1 = {re.sub(r'[^A-Z0-9]', '', m.upper()) for m in models1_raw if len(m) >= 3}
-    models2 = {re.sub(r'[^A-Z0-9]', '', m.upper()) for m in models2_raw if len(m) >= 3}
+    models1 = {_NON_MODEL_CHARS_RE.sub('', m.upper()) for m in models1_raw if len(m) >= 3}
+    models2 = {_NON_MODEL_CHARS_RE.sub('', m.upper()) for m in models2_raw if len(m) >= 3}
     
     # Tam eşleşme
     common_models = models1.intersection(models2)
@@ -2275,7 +2780,7 @@ def calculate_similarity(text1: str, text2: str) -> float:
     # İlk 2-4 kelimeyi al (marka + seri/tip)
     series1 = ' '.join(words1_all[:min(4, len(words1_all))])
     series2 = ' '.join(words2_all[:min(4, len(words2_all))])
-    series_similarity = SequenceMatcher(None, series1, series2).ratio()
+    series_similarity = _text_ratio(series1, series2)
     
     # Önemli kelimelerin eşleşmesi (filtrelenmiş kelimelerden)
     common_important = words1_important.intersection(words2_important)
@@ -2343,113 +2848,113 @@ async def get_amazon_price_and_title_by_ean(ean: str, country: str = "tr") -> Tu
     }
     
     try:
-        async with httpx.AsyncClient(timeout=15.0, headers=headers, follow_redirects=True) as client:
-            response = await client.get(search_url)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Find the first product result
-            product_selectors = [
-                'div[data-component-type="s-search-result"]',
-                'div.s-result-item',
-                'div[data-asin]',
-            ]
-            
-            product_div = None
-            for selector in product_selectors:
-                products = soup.select(selector)
-                if products:
-                    product_div = products[0]
-                    break
-            
-            if not product_div:
-                # Try alternative approach
-                product_links = soup.select('h2 a.a-link-normal, h2 a.a-text-normal')
-                if product_links:
-                    product_title = product_links[0].get_text(strip=True)
-                    # Try to get price from product page
-                    product_link = product_links[0].get('href', '')
-                    if product_link and not product_link.startswith('http'):
-                        product_link = base_url + product_link
-                    
-                    # Get price from product page
-                    if product_link:
-                        try:
-                            product_response = await client.get(product_link)
-                            product_soup = BeautifulSoup(product_response.text, 'html.parser')
-                            
-                            # Try to get price
-                            price_elem = product_soup.select_one('#priceblock_dealprice, #priceblock_ourprice, .a-price .a-offscreen')
-                            if price_elem:
-                                price_text = price_elem.get_text(strip=True)
-                                price_text = re.sub(r'[^\d,.]', '', price_text)
-                                if price_text:
-                                    return price_text, product_title
-                        except:
-                            pass
-                    return None, product_title
-            
-            # Extract title
-            title_selectors = [
-                'h2 a.a-link-normal span',
-                'h2 a.a-text-normal span',
-                'h2 span',
-                'h2 a',
-            ]
-            
-            product_title = None
-            for selector in title_selectors:
-                title_elem = product_div.select_one(selector)
-                if title_elem:
-                    product_title = title_elem.get_text(strip=True)
-                    break
-            
-            # Extract price using extract_price helper function
-            price_selectors = [
-                'span.a-price-whole',
-                'span.a-price .a-offscreen',
-                'span.a-price span[aria-hidden="true"]',
-                '.a-price .a-offscreen',
-                'span[data-a-color="price"]',
-            ]
-            
-            product_price = None
-            for selector in price_selectors:
-                price_elem = product_div.select_one(selector)
-                if price_elem:
-                    price_text = price_elem.get_text(strip=True)
-                    # Use extract_price helper to properly parse Turkish format
-                    price_float = extract_price(price_text)
-                    if price_float:
-                        # Convert back to string format for return (Turkish format: 60.999,00)
-                        # But return as float for now, will be handled in search_amazon_direct
-                        product_price = str(price_float)
-                        break
-            
-            # If no price found, try product page
-            if product_title and not product_price:
-                link_elem = product_div.select_one('h2 a')
-                if link_elem:
-                    product_link = link_elem.get('href', '')
-                    if product_link and not product_link.startswith('http'):
-                        product_link = base_url + product_link
-                    
+        client = get_http_client()
+        response = await client.get(search_url, headers=headers, timeout=15.0)
+        response.raise_for_status()
+        
+        soup = BeautifulSoup(response.text, HTML_PARSER)
+        
+        # Find the first product result
+        product_selectors = [
+            'div[data-component-type="s-search-result"]',
+            'div.s-result-item',
+            'div[data-asin]',
+        ]
+        
+        product_div = None
+        for selector in product_selectors:
+            products = soup.select(selector)
+            if products:
+                product_div = products[0]
+                break
+        
+        if not product_div:
+            # Try alternative approach
+            product_links = soup.select('h2 a.a-link-normal, h2 a.a-text-normal')
+            if product_links:
+                product_title = product_links[0].get_text(strip=True)
+                # Try to get price from product page
+                product_link = product_links[0].get('href', '')
+                if product_link and not product_link.startswith('http'):
+                    product_link = base_url + product_link
+                
+                # Get price from product page
+                if product_link:
                     try:
-                        product_response = await client.get(product_link)
-                        product_soup = BeautifulSoup(product_response.text, 'html.parser')
+                        product_response = await client.get(product_link, headers=headers, timeout=15.0)
+                        product_soup = BeautifulSoup(product_response.text, HTML_PARSER)
                         
+                        # Try to get price
                         price_elem = product_soup.select_one('#priceblock_dealprice, #priceblock_ourprice, .a-price .a-offscreen')
                         if price_elem:
                             price_text = price_elem.get_text(strip=True)
-                            price_float = extract_price(price_text)
-                            if price_float:
-                                product_price = str(price_float)
+                            price_text = _NON_PRICE_CHARS_RE.sub('', price_text)
+                            if price_text:
+                                return price_text, product_title
                     except:
                         pass
-            
-            return product_price, product_title
-            
+                return None, product_title
+        
+        # Extract title
+        title_selectors = [
+            'h2 a.a-link-normal span',
+            'h2 a.a-text-normal span',
+            'h2 span',
+            'h2 a',
+        ]
+        
+        product_title = None
+        for selector in title_selectors:
+            title_elem = product_div.select_one(selector)
+            if title_elem:
+                product_title = title_elem.get_text(strip=True)
+                break
+        
+        # Extract price using extract_price helper function
+        price_selectors = [
+            'span.a-price-whole',
+            'span.a-price .a-offscreen',
+            'span.a-price span[aria-hidden="true"]',
+            '.a-price .a-offscreen',
+            'span[data-a-color="price"]',
+        ]
+        
+        product_price = None
+        for selector in price_selectors:
+            price_elem = product_div.select_one(selector)
+            if price_elem:
+                price_text = price_elem.get_text(strip=True)
+                # Use extract_price helper to properly parse Turkish format
+                price_float = extract_price(price_text)
+                if price_float:
+                    # Convert back to string format for return (Turkish format: 60.999,00)
+                    # But return as float for now, will be handled in search_amazon_direct
+                    product_price = str(price_float)
+                    break
+        
+        # If no price found, try product page
+        if product_title and not product_price:
+            link_elem = product_div.select_one('h2 a')
+            if link_elem:
+                product_link = link_elem.get('href', '')
+                if product_link and not product_link.startswith('http'):
+                    product_link = base_url + product_link
+                
+                try:
+                    product_response = await client.get(product_link, headers=headers, timeout=15.0)
+                    product_soup = BeautifulSoup(product_response.text, HTML_PARSER)
+                    
+                    price_elem = product_soup.select_one('#priceblock_dealprice, #priceblock_ourprice, .a-price .a-offscreen')
+                    if price_elem:
+                        price_text = price_elem.get_text(strip=True)
+                        price_float = extract_price(price_text)
+                        if price_float:
+                            product_price = str(price_float)
+                except:
+                    pass
+        
+        return product_price, product_title
+        
     except Exception as e:
         logger.debug(f"Error fetching data for EAN {ean}: {e}")
         return None, None
@@ -2498,92 +3003,91 @@ async def get_amazon_search_results_by_name(product_name: str, country: str = "t
     results = []
     
     try:
-        async with httpx.AsyncClient(timeout=15.0, headers=headers, follow_redirects=True) as client:
-            response = await client.get(search_url)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
+        client = get_http_client()
+        response = await client.get(search_url, headers=headers, timeout=15.0)
+        response.raise_for_status()
+        
+        soup = BeautifulSoup(response.text, HTML_PARSER)
+        
+        product_selectors = [
+            'div[data-component-type="s-search-result"]',
+            'div.s-result-item',
+            'div[data-asin]',
+        ]
+        
+        product_divs = []
+        for selector in product_selectors:
+            products = soup.select(selector)
+            if products:
+                product_divs = products[:max_results]
+                break
+        
+        for product_div in product_divs:
+            product_title = None
+            product_price = None
             
-            product_selectors = [
-                'div[data-component-type="s-search-result"]',
-                'div.s-result-item',
-                'div[data-asin]',
+            # Extract title
+            title_selectors = [
+                'h2 a.a-link-normal span',
+                'h2 a.a-text-normal span',
+                'h2 span',
+                'h2 a',
             ]
-            
-            product_divs = []
-            for selector in product_selectors:
-                products = soup.select(selector)
-                if products:
-                    product_divs = products[:max_results]
+            for selector in title_selectors:
+                title_elem = product_div.select_one(selector)
+                if title_elem:
+                    product_title = title_elem.get_text(strip=True)
                     break
             
-            for product_div in product_divs:
-                product_title = None
-                product_price = None
-                
-                # Extract title
-                title_selectors = [
-                    'h2 a.a-link-normal span',
-                    'h2 a.a-text-normal span',
-                    'h2 span',
-                    'h2 a',
-                ]
-                for selector in title_selectors:
-                    title_elem = product_div.select_one(selector)
-                    if title_elem:
-                        product_title = title_elem.get_text(strip=True)
+            # Extract price
+            price_selectors = [
+                'span.a-price-whole',
+                'span.a-price .a-offscreen',
+                'span.a-price span[aria-hidden="true"]',
+                '.a-price .a-offscreen',
+                'span[data-a-color="price"]',
+                '.a-price',
+            ]
+            
+            for selector in price_selectors:
+                price_elem = product_div.select_one(selector)
+                if price_elem:
+                    price_text = price_elem.get_text(strip=True)
+                    # Use extract_price helper to properly parse Turkish format (60.999,00 -> 60999.0)
+                    price_float = extract_price(price_text)
+                    if price_float:
+                        product_price = str(price_float)
                         break
-                
-                # Extract price
-                price_selectors = [
-                    'span.a-price-whole',
-                    'span.a-price .a-offscreen',
-                    'span.a-price span[aria-hidden="true"]',
-                    '.a-price .a-offscreen',
-                    'span[data-a-color="price"]',
-                    '.a-price',
-                ]
-                
-                for selector in price_selectors:
-                    price_elem = product_div.select_one(selector)
-                    if price_elem:
-                        price_text = price_elem.get_text(strip=True)
-                        # Use extract_price helper to properly parse Turkish format (60.999,00 -> 60999.0)
-                        price_float = extract_price(price_text)
+                    # Fallback: try regex pattern match for Turkish format
+                    price_match = _TR_NUMBER_RE.search(price_text)
+                    if price_match:
+                        match_text = price_match.group(1)
+                        price_float = extract_price(match_text)
                         if price_float:
                             product_price = str(price_float)
                             break
-                        # Fallback: try regex pattern match for Turkish format
-                        price_match = re.search(r'(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)', price_text)
-                        if price_match:
-                            match_text = price_match.group(1)
-                            price_float = extract_price(match_text)
-                            if price_float:
-                                product_price = str(price_float)
-                                break
-                
-                # If no price, try entire div
-                if not product_price:
-                    all_text = product_div.get_text()
-                    # First try with extract_price on all text
-                    price_float = extract_price(all_text)
-                    if price_float:
-                        product_price = str(price_float)
-                    else:
-                        # Fallback: try regex pattern match
-                        price_matches = re.findall(r'(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)', all_text)
-                        if price_matches:
-                            valid_prices = []
-                            for match in price_matches:
-                                price_float = extract_price(match)
-                                if price_float and price_float >= 100:
-                                    valid_prices.append((price_float, match))
-                            if valid_prices:
-                                valid_prices.sort(reverse=True, key=lambda x: x[0])
-                                product_price = str(valid_prices[0][0])
-                
-                if product_title:
-                    results.append((product_price, product_title))
+            
+            # If no price, try entire div
+            if not product_price:
+                all_text = product_div.get_text()
+                # First try with extract_price on all text
+                price_float = extract_price(all_text)
+                if price_float:
+                    product_price = str(price_float)
+                else:
+                    # Fallback: try regex pattern match
+                    price_matches = _TR_NUMBER_RE.findall(all_text)
+                    if price_matches:
+                        valid_prices = []
+                        for match in price_matches:
+                            price_float = extract_price(match)
+                            if price_float and price_float >= 100:
+                                valid_prices.append((price_float, match))
+                        if valid_prices:
+                            product_price = str(max(valid_prices, key=lambda x: x[0])[0])
+            
+            if product_title:
+                results.append((product_price, product_title))
         
         return results
         
@@ -2622,11 +3126,9 @@ async def find_best_match_by_name(product_name: str, country: str = "tr") -> Tup
         similarity_score = calculate_similarity(product_name, title)
         scored_candidates.append((similarity_score, price, title))
     
-    # Sort by score descending
-    scored_candidates.sort(reverse=True, key=lambda x: x[0])
-    
     if scored_candidates:
-        best_score, best_price, best_title = scored_candidates[0]
+        # Highest score wins (single pass instead of a full sort)
+        best_score, best_price, best_title = max(scored_candidates, key=lambda x: x[0])
         logger.debug(f"✅ En iyi eşleşme bulundu (similarity: {best_score:.2f}): {best_title[:60]}...")
         return (best_price, best_title)
     
@@ -2672,16 +3174,16 @@ async def search_amazon_direct(product_name: str, ean: str = None) -> Dict[str,
                     
                     # Basit bir URL bulma denemesi
                     try:
-                        async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
-                            response = await client.get(search_url)
-                            soup = BeautifulSoup(response.text, 'html.parser')
-                            link_elem = soup.select_one('h2 a.a-link-normal, h2 a.a-text-normal')
-                            if link_elem:
-                                product_url = link_elem.get('href', '')
-                                if product_url and not product_url.startswith('http'):
-                                    product_url = base_url + product_url
-                            else:
-                                product_url = None
+                        client = get_http_client()
+                        response = await client.get(search_url, timeout=10.0)
+                        soup = BeautifulSoup(response.text, HTML_PARSER)
+                        link_elem = soup.select_one('h2 a.a-link-normal, h2 a.a-text-normal')
+                        if link_elem:
+                            product_url = link_elem.get('href', '')
+                            if product_url and not product_url.startswith('http'):
+                                product_url = base_url + product_url
+                        else:
+                            product_url = None
                     except:
                         product_url = None
                     
@@ -2719,14 +3221,14 @@ async def search_amazon_direct(product_name: str, ean: str = None) -> Dict[str,
             
             product_url = None
             try:
-                async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
-                    response = await client.get(search_url)
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    link_elem = soup.select_one('h2 a.a-link-normal, h2 a.a-text-normal')
-                    if link_elem:
-                        product_url = link_elem.get('href', '')
-                        if product_url and not product_url.startswith('http'):
-                            product_url = base_url + product_url
+                client = get_http_client()
+                response = await client.get(search_url, timeout=10.0)
+                soup = BeautifulSoup(response.text, HTML_PARSER)
+                link_elem = soup.select_one('h2 a.a-link-normal, h2 a.a-text-normal')
+                if link_elem:
+                    product_url = link_elem.get('href', '')
+                    if product_url and not product_url.startswith('http'):
+                        product_url = base_url + product_url
             except:
                 pass
             
@@ -2804,6 +3306,8 @@ async def search_marketplace_direct(product_name: str, marketplace: str, ean: st
                 
                 def hepsiburada_sync_search():
                     """Selenium ile Hepsiburada'da arama yapan sync fonksiyon"""
+                    # Pool driver'ı kullanılmaz: CSS/görsel engeli ve eager yükleme harici modülün
+                    # sayfa etkileşimlerini bozabilir, bu yüzden kısıtlamasız kendi tarayıcısı açılır
                     driver = None
                     try:
                         driver = tarayiciyi_baslat()
@@ -2843,9 +3347,9 @@ async def search_marketplace_direct(product_name: str, marketplace: str, ean: st
                         
                         if fiyat:
                             # Fiyat string formatında, float'a çevir
-                            price_clean = re.sub(r'[^\d.,]', '', str(fiyat))
+                            price_clean = _NON_PRICE_CHARS_RE.sub('', str(fiyat))
                             if '.' in price_clean and ',' in price_clean:
-                                price_clean = price_clean.replace('.', '').replace(',', '.')
+                                price_clean = price_clean.translate(_TR_DECIMAL_TRANS)
                             elif ',' in price_clean:
                                 price_clean = price_clean.replace(',', '.')
                             try:
@@ -2864,7 +3368,7 @@ async def search_marketplace_direct(product_name: str, marketplace: str, ean: st
                                 pass
                 
                 # Async wrapper ile çalıştır
-                price, title = await asyncio.to_thread(hepsiburada_sync_search)
+                price, title = await asyncio.get_running_loop().run_in_executor(_selenium_executor, hepsiburada_sync_search)
                 
                 if price:
                     return {
@@ -2887,9 +3391,9 @@ async def search_marketplace_direct(product_name: str, marketplace: str, ean: st
                 price, title, link = find_best_match_by_name(product_name)
                 if price:
                     # Fiyat string formatında, float'a çevir
-                    price_clean = re.sub(r'[^\d.,]', '', str(price))
+                    price_clean = _NON_PRICE_CHARS_RE.sub('', str(price))
                     if '.' in price_clean and ',' in price_clean:
-                        price_clean = price_clean.replace('.', '').replace(',', '.')
+                        price_clean = price_clean.translate(_TR_DECIMAL_TRANS)
                     elif ',' in price_clean:
                         price_clean = price_clean.replace(',', '.')
                     try:
@@ -2937,319 +3441,300 @@ async def search_product(product_name: str, marketplace: str, mm_price: float =
     try:
         search_query = f"{product_name} {marketplace}"
         
-        logger.debug(f"Aranıyor: '{product_name}' -> {marketplace}")
+        logger.debug(f"Aranıyor: '{product_name}' -> {marketplace}")
+        
+        # Google Custom Search API - sadece en alakalı ilk 5 sonuç alınıyor
+        all_items = []
+        
+        client = get_http_client()
+        # İlk 5 sonuç
+        params1 = {
+            "key": config.settings.google_api_key,
+            "cx": config.settings.google_cse_id,
+            "q": search_query,
+            "num": 5,
+            "start": 1
+        }
+        
+        response1 = await client.get(GOOGLE_SEARCH_URL, params=params1, timeout=10.0)
+        response1.raise_for_status()
+        data1 = response1.json()
+        
+        if "items" in data1 and len(data1["items"]) > 0:
+            all_items.extend(data1["items"])
+            logger.info(f"📊 İlk 5 sonuç alındı: {len(data1['items'])} sonuç")
+        
+        # Tüm sonuçları birleştir
+        data = {"items": all_items}
+        
+        if "items" not in data or len(data["items"]) == 0:
+            # Google'da sonuç yoksa, Amazon için direkt arama yap
+            if marketplace.lower() == "amazon":
+                logger.debug("🔍 Google'da sonuç yok, Amazon direkt arama yapılıyor...")
+                direct_result = await search_amazon_direct(product_name)
+                if direct_result.get("success"):
+                    return {
+                        "product_name": product_name,
+                        "marketplace": marketplace,
+                        "url": direct_result.get("url"),
+                        "price": direct_result.get("price"),
+                        "currency": direct_result.get("currency", "TRY"),
+                        "success": True,
+                        "error": None
+                    }
+                else:
+                    return {
+                        "product_name": product_name,
+                        "marketplace": marketplace,
+                        "url": None,
+                        "price": None,
+                        "currency": None,
+                        "success": False,
+                        "error": "No search results found and Amazon direct search failed"
+                    }
+            
+            logger.warning(f"Sonuç bulunamadı: '{product_name}' -> {marketplace}")
+            return {
+                "product_name": product_name,
+                "marketplace": marketplace,
+                "url": None,
+                "price": None,
+                "currency": None,
+                "success": False,
+                "error": "No search results found"
+            }
+        
+        # Tüm sonuçlarda marketplace linklerini bul
+        marketplace_lower = marketplace.lower()
+        marketplace_urls = []
+        product_page_urls = []  # Ürün sayfaları için ayrı liste (Amazon ve Teknosa için)
+        category_page_urls = []  # Kategori sayfaları için ayrı liste (Amazon ve Teknosa için)
         
-        # Google Custom Search API - sadece en alakalı ilk 5 sonuç alınıyor
-        all_items = []
+        # Tüm sonuçları logla (INFO seviyesinde - kullanıcı görebilsin)
+        logger.info(f"🔍 Google'dan {len(data['items'])} sonuç alındı, {marketplace} linkleri aranıyor...")
+        logger.info(f"📋 Arama sorgusu: '{search_query}'")
         
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            # İlk 5 sonuç
-            params1 = {
-                "key": settings.google_api_key,
-                "cx": settings.google_cse_id,
-                "q": search_query,
-                "num": 5,
-                "start": 1
-            }
-            
-            response1 = await client.get(GOOGLE_SEARCH_URL, params=params1)
-            response1.raise_for_status()
-            data1 = response1.json()
-            
-            if "items" in data1 and len(data1["items"]) > 0:
-                all_items.extend(data1["items"])
-                logger.info(f"📊 İlk 5 sonuç alındı: {len(data1['items'])} sonuç")
+        for idx, item in enumerate(data["items"], 1):
+            original_link = item.get("link", "")
+            title = item.get("title", "")
+            snippet = item.get("snippet", "")[:100]
             
-            # Tüm sonuçları birleştir
-            data = {"items": all_items}
-            
-            if "items" not in data or len(data["items"]) == 0:
-                # Google'da sonuç yoksa, Amazon için direkt arama yap
-                if marketplace.lower() == "amazon":
-                    logger.debug("🔍 Google'da sonuç yok, Amazon direkt arama yapılıyor...")
-                    direct_result = await search_amazon_direct(product_name)
-                    if direct_result.get("success"):
-                        return {
-                            "product_name": product_name,
-                            "marketplace": marketplace,
-                            "url": direct_result.get("url"),
-                            "price": direct_result.get("price"),
-                            "currency": direct_result.get("currency", "TRY"),
-                            "success": True,
-                            "error": None
-                        }
-                    else:
-                        return {
-                            "product_name": product_name,
-                            "marketplace": marketplace,
-                            "url": None,
-                            "price": None,
-                            "currency": None,
-                            "success": False,
-                            "error": "No search results found and Amazon direct search failed"
-                        }
-                
-                logger.warning(f"Sonuç bulunamadı: '{product_name}' -> {marketplace}")
-                return {
-                    "product_name": product_name,
-                    "marketplace": marketplace,
-                    "url": None,
-                    "price": None,
-                    "currency": None,
-                    "success": False,
-                    "error": "No search results found"
-                }
+            # Redirect URL'den gerçek URL'i çıkar (önce URL'i parse et)
+            real_link = extract_real_url(original_link)
+            link_lower = real_link.lower()
             
-            # Tüm sonuçlarda marketplace linklerini bul
-            marketplace_lower = marketplace.lower()
-            marketplace_urls = []
-            product_page_urls = []  # Ürün sayfaları için ayrı liste (Amazon ve Teknosa için)
-            category_page_urls = []  # Kategori sayfaları için ayrı liste (Amazon ve Teknosa için)
+            # Sponsorlu/reklam linki kontrolü
+            is_sponsored = is_sponsored_link(item)
             
-            # Tüm sonuçları logla (INFO seviyesinde - kullanıcı görebilsin)
-            logger.info(f"🔍 Google'dan {len(data['items'])} sonuç alındı, {marketplace} linkleri aranıyor...")
-            logger.info(f"📋 Arama sorgusu: '{search_query}'")
+            # Tüm sonuçları INFO seviyesinde logla
+            sponsored_tag = " [SPONSORLU]" if is_sponsored else ""
+            logger.info(f"  📌 Sonuç {idx}{sponsored_tag}: {title[:80]}...")
+            logger.info(f"     Link: {real_link[:100]}...")
             
-            for idx, item in enumerate(data["items"], 1):
-                original_link = item.get("link", "")
-                title = item.get("title", "")
-                snippet = item.get("snippet", "")[:100]
-                
-                # Redirect URL'den gerçek URL'i çıkar (önce URL'i parse et)
-                real_link = extract_real_url(original_link)
-                link_lower = real_link.lower()
-                
-                # Sponsorlu/reklam linki kontrolü
-                is_sponsored = is_sponsored_link(item)
-                
-                # Tüm sonuçları INFO seviyesinde logla
-                sponsored_tag = " [SPONSORLU]" if is_sponsored else ""
-                logger.info(f"  📌 Sonuç {idx}{sponsored_tag}: {title[:80]}...")
-                logger.info(f"     Link: {real_link[:100]}...")
+            if marketplace_lower == "amazon":
+                # Daha kapsamlı Amazon kontrolü (gerçek URL'de)
+                is_amazon = any(domain in link_lower for domain in [
+                    "amazon.com", 
+                    "amazon.com.tr", 
+                    "amazon.co.uk", 
+                    "amazon.de", 
+                    "amazon.fr",
+                    "amazon.it",
+                    "amazon.es"
+                ])
                 
-                if marketplace_lower == "amazon":
-                    # Daha kapsamlı Amazon kontrolü (gerçek URL'de)
-                    is_amazon = any(domain in link_lower for domain in [
-                        "amazon.com", 
-                        "amazon.com.tr", 
-                        "amazon.co.uk", 
-                        "amazon.de", 
-                        "amazon.fr",
-                        "amazon.it",
-                        "amazon.es"
+                if is_amazon:
+                    # Amazon ürün sayfası mı kategori sayfası mı kontrol et
+                    # Ürün sayfaları: /dp/, /gp/product/, /product/
+                    # Kategori sayfaları: /s?, /s/, /gp/browse/, /b/, /s?k=, /s?rh=
+                    is_product_page = any(pattern in link_lower for pattern in [
+                        "/dp/",
+                        "/gp/product/",
+                        "/product/"
+                    ])
+                    is_category_page = any(pattern in link_lower for pattern in [
+                        "/s?",
+                        "/s/",
+                        "/gp/browse/",
+                        "/b/",
+                        "/s?k=",
+                        "/s?rh=",
+                        "/s?ie=",
+                        "/s?node="
                     ])
                     
-                    if is_amazon:
-                        # Amazon ürün sayfası mı kategori sayfası mı kontrol et
-                        # Ürün sayfaları: /dp/, /gp/product/, /product/
-                        # Kategori sayfaları: /s?, /s/, /gp/browse/, /b/, /s?k=, /s?rh=
-                        is_product_page = any(pattern in link_lower for pattern in [
-                            "/dp/",
-                            "/gp/product/",
-                            "/product/"
-                        ])
-                        is_category_page = any(pattern in link_lower for pattern in [
-                            "/s?",
-                            "/s/",
-                            "/gp/browse/",
-                            "/b/",
-                            "/s?k=",
-                            "/s?rh=",
-                            "/s?ie=",
-                            "/s?node="
-                        ])
-                        
-                        # Sponsorlu ama doğru marketplace + ürün sayfasıysa kabul et
-                        if is_sponsored and is_product_page:
-                            # Sponsorlu ama ürün sayfası - kabul et
-                            product_page_urls.append(real_link)
-                            logger.info(f"  ✅ Amazon ÜRÜN SAYFASI bulundu (sıra {idx}) [SPONSORLU ama kabul edildi]")
-                        elif is_sponsored and is_category_page:
-                            # Sponsorlu ve kategori sayfası - atla
-                            logger.info(f"  ⚠️ Amazon kategori sayfası (sıra {idx}, sponsorlu - atlanacak)")
-                            continue
-                        elif is_sponsored:
-                            # Sponsorlu ama ne ürün ne kategori - atla (güvenli tarafta kal)
-                            logger.info(f"  ⚠️ Amazon linki sponsorlu ama belirsiz format (sıra {idx}, atlanacak)")
-                            continue
-                        elif is_product_page:
-                            # Ürün sayfası - en yüksek öncelik
-                            product_page_urls.append(real_link)
-                            logger.info(f"  ✅ Amazon ÜRÜN SAYFASI bulundu (sıra {idx})")
-                        elif is_category_page:
-                            # Kategori sayfası - en düşük öncelik (atlanacak)
-                            category_page_urls.append(real_link)
-                            logger.info(f"  ⚠️ Amazon kategori sayfası (sıra {idx}, atlanacak)")
-                        else:
-                            # Ne ürün ne kategori sayfası - normal öncelik
-                            marketplace_urls.append(real_link)
-                            logger.info(f"  ✅ Amazon link bulundu (sıra {idx})")
-                    else:
-                        # Amazon linki değil - sponsorluysa atla
-                        if is_sponsored:
-                            logger.info(f"  ⚠️ Sonuç {idx} sponsorlu ve Amazon linki değil - atlanıyor")
-                            continue
-                        logger.info(f"  ❌ Sonuç {idx} Amazon linki değil")
-                elif marketplace_lower == "trendyol" and "trendyol.com" in link_lower:
-                    # Trendyol ürün sayfası kontrolü (genelde /p/ veya /brand/ içerir)
-                    is_product_page = "/p/" in link_lower or "/brand/" in link_lower
-                    is_category_page = "/sr" in link_lower or "/kategori" in link_lower or "/arama" in link_lower
-                    
-                    if is_sponsored and is_product_page:
-                        # Sponsorlu ama ürün sayfası - kabul et
-                        marketplace_urls.append(real_link)
-                        logger.info(f"  ✅ Trendyol link bulundu (sıra {idx}) [SPONSORLU ama kabul edildi]")
-                    elif is_sponsored and is_category_page:
-                        # Sponsorlu ve kategori sayfası - atla
-                        logger.info(f"  ⚠️ Trendyol kategori sayfası (sıra {idx}, sponsorlu - atlanacak)")
-                        continue
-                    elif is_sponsored:
-                        # Sponsorlu ama belirsiz - atla
-                        logger.info(f"  ⚠️ Trendyol linki sponsorlu ama belirsiz format (sıra {idx}, atlanacak)")
-                        continue
-                    elif is_category_page:
-                        # Kategori sayfası - atla
-                        logger.info(f"  ⚠️ Trendyol kategori sayfası (sıra {idx}, atlanacak)")
-                        continue
-                    else:
-                        # Ürün sayfası veya normal link
-                        marketplace_urls.append(real_link)
-                        logger.info(f"  ✅ Trendyol link bulundu (sıra {idx})")
-                elif marketplace_lower == "hepsiburada" and "hepsiburada.com" in link_lower:
-                    # Hepsiburada ürün sayfası kontrolü (genişletilmiş)
-                    # Ürün sayfaları: /p/, /urun/, -pm-, -p-, -HB ile biten, veya uzun slug formatı
-                    is_product_page = (
-                        "/p/" in link_lower or 
-                        "/urun/" in link_lower or
-                        "-pm-" in link_lower or  # product model (örn: -pm-HBC000005ELGI)
-                        "-p-" in link_lower or   # product
-                        "-HB" in link_lower.upper() or  # HBC000005ELGI gibi
-                        (link_lower.count("-") >= 5 and "?sayfa=" not in link_lower)  # Uzun slug formatı
-                    )
-                    
-                    # Kategori sayfaları: /liste, /kategori, /arama, -x-s, -xc-, /c-, ?sayfa=
-                    is_category_page = (
-                        "/liste" in link_lower or 
-                        "/kategori" in link_lower or 
-                        "/arama" in link_lower or
-                        "-x-s" in link_lower or  # search results (örn: -x-s57124)
-                        "-xc-" in link_lower or  # category
-                        "/c-" in link_lower or   # category
-                        "?sayfa=" in link_lower  # pagination
-                    )
-                    
-                    if is_sponsored and is_product_page:
-                        # Sponsorlu ama ürün sayfası - kabul et
-                        marketplace_urls.append(real_link)
-                        logger.info(f"  ✅ Hepsiburada link bulundu (sıra {idx}) [SPONSORLU ama kabul edildi]")
-                    elif is_sponsored and is_category_page:
-                        # Sponsorlu ve kategori sayfası - atla
-                        logger.info(f"  ⚠️ Hepsiburada kategori sayfası (sıra {idx}, sponsorlu - atlanacak)")
-                        continue
-                    elif is_sponsored:
-                        # Sponsorlu ama belirsiz - ürün sayfası gibi görünüyorsa kabul et
-                        if not is_category_page and (link_lower.count("-") >= 3):
-                            marketplace_urls.append(real_link)
-                            logger.info(f"  ✅ Hepsiburada link bulundu (sıra {idx}) [SPONSORLU ama ürün sayfası gibi görünüyor]")
-                        else:
-                            logger.info(f"  ⚠️ Hepsiburada linki sponsorlu ama belirsiz format (sıra {idx}, atlanacak)")
-                            continue
-                    elif is_category_page:
-                        # Kategori sayfası - atla
-                        logger.info(f"  ⚠️ Hepsiburada kategori sayfası (sıra {idx}, atlanacak)")
-                        continue
-                    else:
-                        # Ürün sayfası veya normal link
-                        marketplace_urls.append(real_link)
-                        logger.info(f"  ✅ Hepsiburada link bulundu (sıra {idx})")
-                elif marketplace_lower == "teknosa" and "teknosa.com" in link_lower:
-                    # Teknosa linkini ekle, ama ürün sayfası mı kategori sayfası mı kontrol et
-                    # Ürün sayfaları genellikle "-p-" içerir
-                    # Kategori sayfaları "-bc-" veya "/magaza/" içerir
-                    is_product_page = "-p-" in link_lower
-                    is_category_page = "-bc-" in link_lower or "/magaza/" in link_lower or "/kategori/" in link_lower
-                    
-                    # Ürün sayfalarını, kategori sayfalarını ve diğerlerini ayrı listelerde tut
+                    # Sponsorlu ama doğru marketplace + ürün sayfasıysa kabul et
                     if is_sponsored and is_product_page:
                         # Sponsorlu ama ürün sayfası - kabul et
                         product_page_urls.append(real_link)
-                        logger.info(f"  ✅ Teknosa ÜRÜN SAYFASI bulundu (sıra {idx}) [SPONSORLU ama kabul edildi]")
+                        logger.info(f"  ✅ Amazon ÜRÜN SAYFASI bulundu (sıra {idx}) [SPONSORLU ama kabul edildi]")
                     elif is_sponsored and is_category_page:
                         # Sponsorlu ve kategori sayfası - atla
-                        logger.info(f"  ⚠️ Teknosa kategori sayfası (sıra {idx}, sponsorlu - atlanacak)")
+                        logger.info(f"  ⚠️ Amazon kategori sayfası (sıra {idx}, sponsorlu - atlanacak)")
                         continue
                     elif is_sponsored:
-                        # Sponsorlu ama belirsiz - atla
-                        logger.info(f"  ⚠️ Teknosa linki sponsorlu ama belirsiz format (sıra {idx}, atlanacak)")
+                        # Sponsorlu ama ne ürün ne kategori - atla (güvenli tarafta kal)
+                        logger.info(f"  ⚠️ Amazon linki sponsorlu ama belirsiz format (sıra {idx}, atlanacak)")
                         continue
                     elif is_product_page:
                         # Ürün sayfası - en yüksek öncelik
                         product_page_urls.append(real_link)
-                        logger.info(f"  ✅ Teknosa ÜRÜN SAYFASI bulundu (sıra {idx})")
+                        logger.info(f"  ✅ Amazon ÜRÜN SAYFASI bulundu (sıra {idx})")
                     elif is_category_page:
-                        # Kategori sayfası - en düşük öncelik
+                        # Kategori sayfası - en düşük öncelik (atlanacak)
                         category_page_urls.append(real_link)
-                        logger.info(f"  ⚠️ Teknosa kategori sayfası (sıra {idx}, atlanacak)")
+                        logger.info(f"  ⚠️ Amazon kategori sayfası (sıra {idx}, atlanacak)")
                     else:
                         # Ne ürün ne kategori sayfası - normal öncelik
                         marketplace_urls.append(real_link)
-                        logger.info(f"  ✅ Teknosa link bulundu (sıra {idx})")
+                        logger.info(f"  ✅ Amazon link bulundu (sıra {idx})")
                 else:
-                    # Diğer marketplace'ler veya eşleşmeyen linkler
+                    # Amazon linki değil - sponsorluysa atla
                     if is_sponsored:
-                        logger.info(f"  ⚠️ Sonuç {idx} sponsorlu ve {marketplace} linki değil - atlanıyor")
+                        logger.info(f"  ⚠️ Sonuç {idx} sponsorlu ve Amazon linki değil - atlanıyor")
                         continue
-            
-            # Amazon ve Teknosa için: Önce ürün sayfaları, sonra diğer linkler, en son kategori sayfaları
-            if marketplace_lower == "amazon":
-                # Önce ürün sayfalarını ekle (öncelikli), kategori sayfalarını atla
-                marketplace_urls = product_page_urls + marketplace_urls
-                logger.info(f"✅ Amazon: {len(product_page_urls)} ürün sayfası, {len(marketplace_urls) - len(product_page_urls)} normal link bulundu, {len(category_page_urls)} kategori sayfası atlandı")
-                # Bulunan ürün sayfalarını listele
-                for i, url in enumerate(product_page_urls, 1):
-                    logger.info(f"   Ürün sayfası {i}: {url[:100]}...")
-            elif marketplace_lower == "teknosa":
-                # Önce ürün sayfalarını ekle (öncelikli)
-                marketplace_urls = product_page_urls + marketplace_urls + category_page_urls
-                logger.debug(f"✅ Teknosa: {len(product_page_urls)} ürün sayfası, {len(marketplace_urls) - len(product_page_urls) - len(category_page_urls)} normal link, {len(category_page_urls)} kategori sayfası bulundu")
-            
-            # Tüm linkleri kontrol et (10 limiti kaldırıldı - tüm sonuçları dene)
-            # marketplace_urls = marketplace_urls[:10]  # Limit kaldırıldı - tüm sonuçları kontrol et
-            
-            if marketplace_urls:
-                logger.info(f"✅ Toplam {len(marketplace_urls)} {marketplace} linki bulundu - sırayla kontrol ediliyor...")
-            else:
-                logger.warning(f"⚠️ Google sonuçlarında {marketplace} linki bulunamadı")
-            
-            if not marketplace_urls:
-                # Google sonuçlarında marketplace linki yok, direkt marketplace'de ara
-                logger.debug(f"🔍 Google sonuçlarında {marketplace} linki yok, direkt arama yapılıyor...")
-                direct_result = await search_marketplace_direct(product_name, marketplace, ean)
-                if direct_result.get("success"):
-                    price_value = direct_result.get("price")
-                    
-                    # MM Price kontrolü (%35 tolerans)
-                    if mm_price and not is_price_valid(price_value, mm_price):
-                        logger.warning(f"⚠️ Direkt aramada bulunan fiyat geçersiz (MM Price kontrolü): {price_value:.2f}")
-                        return {
-                            "product_name": product_name,
-                            "marketplace": marketplace,
-                            "url": None,
-                            "price": None,
-                            "currency": None,
-                            "success": False,
-                            "error": "Price validation failed (MM Price check)"
-                        }
-                    return {
-                        "product_name": product_name,
-                        "marketplace": marketplace,
-                        "url": direct_result.get("url"),
-                        "price": price_value,
-                        "currency": direct_result.get("currency", "TRY"),
-                        "success": True,
-                        "error": None
-                    }
+                    logger.info(f"  ❌ Sonuç {idx} Amazon linki değil")
+            elif marketplace_lower == "trendyol" and "trendyol.com" in link_lower:
+                # Trendyol ürün sayfası kontrolü (genelde /p/ veya /brand/ içerir)
+                is_product_page = "/p/" in link_lower or "/brand/" in link_lower
+                is_category_page = "/sr" in link_lower or "/kategori" in link_lower or "/arama" in link_lower
+                
+                if is_sponsored and is_product_page:
+                    # Sponsorlu ama ürün sayfası - kabul et
+                    marketplace_urls.append(real_link)
+                    logger.info(f"  ✅ Trendyol link bulundu (sıra {idx}) [SPONSORLU ama kabul edildi]")
+                elif is_sponsored and is_category_page:
+                    # Sponsorlu ve kategori sayfası - atla
+                    logger.info(f"  ⚠️ Trendyol kategori sayfası (sıra {idx}, sponsorlu - atlanacak)")
+                    continue
+                elif is_sponsored:
+                    # Sponsorlu ama belirsiz - atla
+                    logger.info(f"  ⚠️ Trendyol linki sponsorlu ama belirsiz format (sıra {idx}, atlanacak)")
+                    continue
+                elif is_category_page:
+                    # Kategori sayfası - atla
+                    logger.info(f"  ⚠️ Trendyol kategori sayfası (sıra {idx}, atlanacak)")
+                    continue
+                else:
+                    # Ürün sayfası veya normal link
+                    marketplace_urls.append(real_link)
+                    logger.info(f"  ✅ Trendyol link bulundu (sıra {idx})")
+            elif marketplace_lower == "hepsiburada" and "hepsiburada.com" in link_lower:
+                # Hepsiburada ürün sayfası kontrolü (genişletilmiş)
+                # Ürün sayfaları: /p/, /urun/, -pm-, -p-, -HB ile biten, veya uzun slug formatı
+                is_product_page = (
+                    "/p/" in link_lower or 
+                    "/urun/" in link_lower or
+                    "-pm-" in link_lower or  # product model (örn: -pm-HBC000005ELGI)
+                    "-p-" in link_lower or   # product
+                    "-HB" in link_lower.upper() or  # HBC000005ELGI gibi
+                    (link_lower.count("-") >= 5 and "?sayfa=" not in link_lower)  # Uzun slug formatı
+                )
+                
+                # Kategori sayfaları: /liste, /kategori, /arama, -x-s, -xc-, /c-, ?sayfa=
+                is_category_page = (
+                    "/liste" in link_lower or 
+                    "/kategori" in link_lower or 
+                    "/arama" in link_lower or
+                    "-x-s" in link_lower or  # search results (örn: -x-s57124)
+                    "-xc-" in link_lower or  # category
+                    "/c-" in link_lower or   # category
+                    "?sayfa=" in link_lower  # pagination
+                )
+                
+                if is_sponsored and is_product_page:
+                    # Sponsorlu ama ürün sayfası - kabul et
+                    marketplace_urls.append(real_link)
+                    logger.info(f"  ✅ Hepsiburada link bulundu (sıra {idx}) [SPONSORLU ama kabul edildi]")
+                elif is_sponsored and is_category_page:
+                    # Sponsorlu ve kategori sayfası - atla
+                    logger.info(f"  ⚠️ Hepsiburada kategori sayfası (sıra {idx}, sponsorlu - atlanacak)")
+                    continue
+                elif is_sponsored:
+                    # Sponsorlu ama belirsiz - ürün sayfası gibi görünüyorsa kabul et
+                    if not is_category_page and (link_lower.count("-") >= 3):
+                        marketplace_urls.append(real_link)
+                        logger.info(f"  ✅ Hepsiburada link bulundu (sıra {idx}) [SPONSORLU ama ürün sayfası gibi görünüyor]")
+                    else:
+                        logger.info(f"  ⚠️ Hepsiburada linki sponsorlu ama belirsiz format (sıra {idx}, atlanacak)")
+                        continue
+                elif is_category_page:
+                    # Kategori sayfası - atla
+                    logger.info(f"  ⚠️ Hepsiburada kategori sayfası (sıra {idx}, atlanacak)")
+                    continue
+                else:
+                    # Ürün sayfası veya normal link
+                    marketplace_urls.append(real_link)
+                    logger.info(f"  ✅ Hepsiburada link bulundu (sıra {idx})")
+            elif marketplace_lower == "teknosa" and "teknosa.com" in link_lower:
+                # Teknosa linkini ekle, ama ürün sayfası mı kategori sayfası mı kontrol et
+                # Ürün sayfaları genellikle "-p-" içerir
+                # Kategori sayfaları "-bc-" veya "/magaza/" içerir
+                is_product_page = "-p-" in link_lower
+                is_category_page = "-bc-" in link_lower or "/magaza/" in link_lower or "/kategori/" in link_lower
+                
+                # Ürün sayfalarını, kategori sayfalarını ve diğerlerini ayrı listelerde tut
+                if is_sponsored and is_product_page:
+                    # Sponsorlu ama ürün sayfası - kabul et
+                    product_page_urls.append(real_link)
+                    logger.info(f"  ✅ Teknosa ÜRÜN SAYFASI bulundu (sıra {idx}) [SPONSORLU ama kabul edildi]")
+                elif is_sponsored and is_category_page:
+                    # Sponsorlu ve kategori sayfası - atla
+                    logger.info(f"  ⚠️ Teknosa kategori sayfası (sıra {idx}, sponsorlu - atlanacak)")
+                    continue
+                elif is_sponsored:
+                    # Sponsorlu ama belirsiz - atla
+                    logger.info(f"  ⚠️ Teknosa linki sponsorlu ama belirsiz format (sıra {idx}, atlanacak)")
+                    continue
+                elif is_product_page:
+                    # Ürün sayfası - en yüksek öncelik
+                    product_page_urls.append(real_link)
+                    logger.info(f"  ✅ Teknosa ÜRÜN SAYFASI bulundu (sıra {idx})")
+                elif is_category_page:
+                    # Kategori sayfası - en düşük öncelik
+                    category_page_urls.append(real_link)
+                    logger.info(f"  ⚠️ Teknosa kategori sayfası (sıra {idx}, atlanacak)")
                 else:
+                    # Ne ürün ne kategori sayfası - normal öncelik
+                    marketplace_urls.append(real_link)
+                    logger.info(f"  ✅ Teknosa link bulundu (sıra {idx})")
+            else:
+                # Diğer marketplace'ler veya eşleşmeyen linkler
+                if is_sponsored:
+                    logger.info(f"  ⚠️ Sonuç {idx} sponsorlu ve {marketplace} linki değil - atlanıyor")
+                    continue
+        
+        # Amazon ve Teknosa için: Önce ürün sayfaları, sonra diğer linkler, en son kategori sayfaları
+        if marketplace_lower == "amazon":
+            # Önce ürün sayfalarını ekle (öncelikli), kategori sayfalarını atla
+            marketplace_urls = product_page_urls + marketplace_urls
+            logger.info(f"✅ Amazon: {len(product_page_urls)} ürün sayfası, {len(marketplace_urls) - len(product_page_urls)} normal link bulundu, {len(category_page_urls)} kategori sayfası atlandı")
+            # Bulunan ürün sayfalarını listele
+            for i, url in enumerate(product_page_urls, 1):
+                logger.info(f"   Ürün sayfası {i}: {url[:100]}...")
+        elif marketplace_lower == "teknosa":
+            # Önce ürün sayfalarını ekle (öncelikli)
+            marketplace_urls = product_page_urls + marketplace_urls + category_page_urls
+            logger.debug(f"✅ Teknosa: {len(product_page_urls)} ürün sayfası, {len(marketplace_urls) - len(product_page_urls) - len(category_page_urls)} normal link, {len(category_page_urls)} kategori sayfası bulundu")
+        
+        # Tüm linkleri kontrol et (10 limiti kaldırıldı - tüm sonuçları dene)
+        # marketplace_urls = marketplace_urls[:10]  # Limit kaldırıldı - tüm sonuçları kontrol et
+        
+        if marketplace_urls:
+            logger.info(f"✅ Toplam {len(marketplace_urls)} {marketplace} linki bulundu - sırayla kontrol ediliyor...")
+        else:
+            logger.warning(f"⚠️ Google sonuçlarında {marketplace} linki bulunamadı")
+        
+        if not marketplace_urls:
+            # Google sonuçlarında marketplace linki yok, direkt marketplace'de ara
+            logger.debug(f"🔍 Google sonuçlarında {marketplace} linki yok, direkt arama yapılıyor...")
+            direct_result = await search_marketplace_direct(product_name, marketplace, ean)
+            if direct_result.get("success"):
+                price_value = direct_result.get("price")
+                
+                # MM Price kontrolü (%35 tolerans)
+                if mm_price and not is_price_valid(price_value, mm_price):
+                    logger.warning(f"⚠️ Direkt aramada bulunan fiyat geçersiz (MM Price kontrolü): {price_value:.2f}")
                     return {
                         "product_name": product_name,
                         "marketplace": marketplace,
@@ -3257,90 +3742,127 @@ async def search_product(product_name: str, marketplace: str, mm_price: float =
                         "price": None,
                         "currency": None,
                         "success": False,
-                        "error": f"No {marketplace} links found in Google results and direct search failed"
+                        "error": "Price validation failed (MM Price check)"
                     }
+                return {
+                    "product_name": product_name,
+                    "marketplace": marketplace,
+                    "url": direct_result.get("url"),
+                    "price": price_value,
+                    "currency": direct_result.get("currency", "TRY"),
+                    "success": True,
+                    "error": None
+                }
+            else:
+                return {
+                    "product_name": product_name,
+                    "marketplace": marketplace,
+                    "url": None,
+                    "price": None,
+                    "currency": None,
+                    "success": False,
+                    "error": f"No {marketplace} links found in Google results and direct search failed"
+                }
+        
+        # Marketplace linkleri bulundu, sırayla fiyat çek ve MM Price kontrolü yap
+        price_value = None
+        currency_value = None
+        valid_url = None
+        
+        logger.info(f"🔍 {len(marketplace_urls)} link sırayla kontrol ediliyor...")
+        for url_idx, url in enumerate(marketplace_urls, 1):
+            # Teknosa için: Kategori sayfalarını atla (sadece ürün sayfalarını kullan)
+            if marketplace_lower == "teknosa":
+                url_lower = url.lower()
+                is_category_page = "-bc-" in url_lower or "/magaza/" in url_lower or "/kategori/" in url_lower
+                if is_category_page:
+                    logger.info(f"  ⏭️ Link {url_idx}/{len(marketplace_urls)}: Teknosa kategori sayfası atlanıyor")
+                    continue  # Kategori sayfasını atla
             
-            # Marketplace linkleri bulundu, sırayla fiyat çek ve MM Price kontrolü yap
-            price_value = None
-            currency_value = None
-            valid_url = None
+            logger.info(f"  🔍 Link {url_idx}/{len(marketplace_urls)} kontrol ediliyor: {url[:100]}...")
             
-            logger.info(f"🔍 {len(marketplace_urls)} link sırayla kontrol ediliyor...")
-            for url_idx, url in enumerate(marketplace_urls, 1):
-                # Teknosa için: Kategori sayfalarını atla (sadece ürün sayfalarını kullan)
-                if marketplace_lower == "teknosa":
-                    url_lower = url.lower()
-                    is_category_page = "-bc-" in url_lower or "/magaza/" in url_lower or "/kategori/" in url_lower
-                    if is_category_page:
-                        logger.info(f"  ⏭️ Link {url_idx}/{len(marketplace_urls)}: Teknosa kategori sayfası atlanıyor")
-                        continue  # Kategori sayfasını atla
+            # URL'den marketplace'i belirle ve fiyat çek
+            price_info = None
+            if "trendyol.com" in url.lower():
+                logger.info(f"    💰 Fiyat çekiliyor (Trendyol)...")
+                price_info = await extract_price_from_trendyol(url)
+            elif "hepsiburada.com" in url.lower():
+                logger.info(f"    💰 Fiyat çekiliyor (Hepsiburada)...")
+                price_info = await extract_price_from_hepsiburada(url)
+            elif "teknosa.com" in url.lower():
+                logger.info(f"    💰 Fiyat çekiliyor (Teknosa)...")
+                price_info = await extract_price_from_teknosa(url)
+            elif "amazon.com" in url.lower() or "amazon.com.tr" in url.lower():
+                logger.info(f"    💰 Fiyat çekiliyor (Amazon)...")
+                price_info = await extract_price_from_amazon(url)
+            
+            if price_info and price_info.get("success"):
+                found_price = price_info.get("price")
+                found_currency = price_info.get("currency")
+                found_title = price_info.get("title")  # Başlık bilgisi
                 
-                logger.info(f"  🔍 Link {url_idx}/{len(marketplace_urls)} kontrol ediliyor: {url[:100]}...")
+                logger.info(f"    ✅ Fiyat bulundu: {found_price:.2f} {found_currency}")
+                if found_title:
+                    logger.info(f"    📦 Ürün başlığı: {found_title[:80]}...")
                 
-                # URL'den marketplace'i belirle ve fiyat çek
-                price_info = None
-                if "trendyol.com" in url.lower():
-                    logger.info(f"    💰 Fiyat çekiliyor (Trendyol)...")
-                    price_info = await extract_price_from_trendyol(url)
-                elif "hepsiburada.com" in url.lower():
-                    logger.info(f"    💰 Fiyat çekiliyor (Hepsiburada)...")
-                    price_info = await extract_price_from_hepsiburada(url)
-                elif "teknosa.com" in url.lower():
-                    logger.info(f"    💰 Fiyat çekiliyor (Teknosa)...")
-                    price_info = await extract_price_from_teknosa(url)
-                elif "amazon.com" in url.lower() or "amazon.com.tr" in url.lower():
-                    logger.info(f"    💰 Fiyat çekiliyor (Amazon)...")
-                    price_info = await extract_price_from_amazon(url)
+                # MM Price kontrolü (%35 tolerans)
+                if mm_price and not is_price_valid(found_price, mm_price):
+                    logger.warning(f"    ⚠️ Fiyat geçersiz (MM Price kontrolü): {found_price:.2f} (MM Price: {mm_price:.2f})")
+                    continue  # Bir sonraki linke geç
                 
-                if price_info and price_info.get("success"):
-                    found_price = price_info.get("price")
-                    found_currency = price_info.get("currency")
-                    found_title = price_info.get("title")  # Başlık bilgisi
+                # Ürün başlığı benzerlik kontrolü (Amazon için özellikle önemli)
+                if found_title and marketplace_lower == "amazon":
+                    similarity = calculate_similarity(product_name, found_title)
+                    logger.info(f"    🔍 Ürün benzerlik skoru: {similarity:.2%}")
+                    logger.info(f"       Aranan: '{product_name[:70]}...'")
+                    logger.info(f"       Bulunan: '{found_title[:70]}...'")
                     
-                    logger.info(f"    ✅ Fiyat bulundu: {found_price:.2f} {found_currency}")
-                    if found_title:
-                        logger.info(f"    📦 Ürün başlığı: {found_title[:80]}...")
-                    
-                    # MM Price kontrolü (%35 tolerans)
-                    if mm_price and not is_price_valid(found_price, mm_price):
-                        logger.warning(f"    ⚠️ Fiyat geçersiz (MM Price kontrolü): {found_price:.2f} (MM Price: {mm_price:.2f})")
+                    # Benzerlik %40'ın altındaysa atla
+                    if similarity < 0.40:
+                        logger.warning(f"    ⚠️ Ürün benzerliği düşük ({similarity:.2%} < %40), bir sonraki linke geçiliyor...")
                         continue  # Bir sonraki linke geç
+                    elif similarity < 0.60:
+                        logger.warning(f"    ⚠️ Ürün benzerliği orta ({similarity:.2%}), dikkatli kontrol ediliyor...")
+                
+                # Tüm kontroller geçti, fiyatı kullan
+                price_value = found_price
+                currency_value = found_currency
+                valid_url = url
+                logger.warning(f"✅ {marketplace}: {product_name[:50]}... - {price_value:.2f} {currency_value}")
+                break
+            else:
+                error_msg = price_info.get("error", "Unknown error") if price_info else "Price extraction failed"
+                logger.debug(f"⚠️ Fiyat çekilemedi: {error_msg} (URL: {url})")
+        
+        # Hiçbir linkte geçerli fiyat bulunamadıysa, direkt marketplace'de ara
+        if price_value is None:
+            logger.debug(f"🔍 Google sonuçlarında geçerli fiyat bulunamadı, direkt arama yapılıyor...")
+            direct_result = await search_marketplace_direct(product_name, marketplace, ean)
+            if direct_result.get("success"):
+                price_value = direct_result.get("price")
+                found_title = direct_result.get("title")
+                
+                # MM Price kontrolü (%35 tolerans)
+                if mm_price and not is_price_valid(price_value, mm_price):
+                    logger.warning(f"⚠️ Direkt aramada bulunan fiyat geçersiz (MM Price kontrolü): {price_value:.2f}")
+                    return {
+                        "product_name": product_name,
+                        "marketplace": marketplace,
+                        "url": None,
+                        "price": None,
+                        "currency": None,
+                        "success": False,
+                        "error": "Price validation failed (MM Price check)"
+                    }
+                
+                # Ürün başlığı benzerlik kontrolü (Amazon için özellikle önemli)
+                if found_title and marketplace_lower == "amazon":
+                    similarity = calculate_similarity(product_name, found_title)
+                    logger.info(f"🔍 Direkt arama - Ürün benzerlik skoru: {similarity:.2%} - Aranan: '{product_name[:50]}...' vs Bulunan: '{found_title[:50]}...'")
                     
-                    # Ürün başlığı benzerlik kontrolü (Amazon için özellikle önemli)
-                    if found_title and marketplace_lower == "amazon":
-                        similarity = calculate_similarity(product_name, found_title)
-                        logger.info(f"    🔍 Ürün benzerlik skoru: {similarity:.2%}")
-                        logger.info(f"       Aranan: '{product_name[:70]}...'")
-                        logger.info(f"       Bulunan: '{found_title[:70]}...'")
-                        
-                        # Benzerlik %40'ın altındaysa atla
-                        if similarity < 0.40:
-                            logger.warning(f"    ⚠️ Ürün benzerliği düşük ({similarity:.2%} < %40), bir sonraki linke geçiliyor...")
-                            continue  # Bir sonraki linke geç
-                        elif similarity < 0.60:
-                            logger.warning(f"    ⚠️ Ürün benzerliği orta ({similarity:.2%}), dikkatli kontrol ediliyor...")
-                    
-                    # Tüm kontroller geçti, fiyatı kullan
-                    price_value = found_price
-                    currency_value = found_currency
-                    valid_url = url
-                    logger.warning(f"✅ {marketplace}: {product_name[:50]}... - {price_value:.2f} {currency_value}")
-                    break
-                else:
-                    error_msg = price_info.get("error", "Unknown error") if price_info else "Price extraction failed"
-                    logger.debug(f"⚠️ Fiyat çekilemedi: {error_msg} (URL: {url})")
-            
-            # Hiçbir linkte geçerli fiyat bulunamadıysa, direkt marketplace'de ara
-            if price_value is None:
-                logger.debug(f"🔍 Google sonuçlarında geçerli fiyat bulunamadı, direkt arama yapılıyor...")
-                direct_result = await search_marketplace_direct(product_name, marketplace, ean)
-                if direct_result.get("success"):
-                    price_value = direct_result.get("price")
-                    found_title = direct_result.get("title")
-                    
-                    # MM Price kontrolü (%35 tolerans)
-                    if mm_price and not is_price_valid(price_value, mm_price):
-                        logger.warning(f"⚠️ Direkt aramada bulunan fiyat geçersiz (MM Price kontrolü): {price_value:.2f}")
+                    # Benzerlik %40'ın altındaysa reddet
+                    if similarity < 0.40:
+                        logger.warning(f"⚠️ Direkt aramada ürün benzerliği düşük ({similarity:.2%} < %40), fiyat yazılmayacak")
                         return {
                             "product_name": product_name,
                             "marketplace": marketplace,
@@ -3348,59 +3870,41 @@ async def search_product(product_name: str, marketplace: str, mm_price: float =
                             "price": None,
                             "currency": None,
                             "success": False,
-                            "error": "Price validation failed (MM Price check)"
+                            "error": f"Product similarity too low ({similarity:.2%} < 40%)"
                         }
-                    
-                    # Ürün başlığı benzerlik kontrolü (Amazon için özellikle önemli)
-                    if found_title and marketplace_lower == "amazon":
-                        similarity = calculate_similarity(product_name, found_title)
-                        logger.info(f"🔍 Direkt arama - Ürün benzerlik skoru: {similarity:.2%} - Aranan: '{product_name[:50]}...' vs Bulunan: '{found_title[:50]}...'")
-                        
-                        # Benzerlik %40'ın altındaysa reddet
-                        if similarity < 0.40:
-                            logger.warning(f"⚠️ Direkt aramada ürün benzerliği düşük ({similarity:.2%} < %40), fiyat yazılmayacak")
-                            return {
-                                "product_name": product_name,
-                                "marketplace": marketplace,
-                                "url": None,
-                                "price": None,
-                                "currency": None,
-                                "success": False,
-                                "error": f"Product similarity too low ({similarity:.2%} < 40%)"
-                            }
-                        elif similarity < 0.60:
-                            logger.warning(f"⚠️ Direkt aramada ürün benzerliği orta ({similarity:.2%}), dikkatli kontrol ediliyor...")
-                    
-                    return {
-                        "product_name": product_name,
-                        "marketplace": marketplace,
-                        "url": direct_result.get("url"),
-                        "price": price_value,
-                        "currency": direct_result.get("currency", "TRY"),
-                        "success": True,
-                        "error": None
-                    }
-                else:
-                    return {
-                        "product_name": product_name,
-                        "marketplace": marketplace,
-                        "url": None,
-                        "price": None,
-                        "currency": None,
-                        "success": False,
-                        "error": "No valid price found in Google results and direct search failed"
-                    }
-            
-            return {
-                "product_name": product_name,
-                "marketplace": marketplace,
-                "url": valid_url,
-                "price": price_value,
-                "currency": currency_value,
-                "success": True,
-                "error": None
-            }
-            
+                    elif similarity < 0.60:
+                        logger.warning(f"⚠️ Direkt aramada ürün benzerliği orta ({similarity:.2%}), dikkatli kontrol ediliyor...")
+                
+                return {
+                    "product_name": product_name,
+                    "marketplace": marketplace,
+                    "url": direct_result.get("url"),
+                    "price": price_value,
+                    "currency": direct_result.get("currency", "TRY"),
+                    "success": True,
+                    "error": None
+                }
+            else:
+                return {
+                    "product_name": product_name,
+                    "marketplace": marketplace,
+                    "url": None,
+                    "price": None,
+                    "currency": None,
+                    "success": False,
+                    "error": "No valid price found in Google results and direct search failed"
+                }
+        
+        return {
+            "product_name": product_name,
+            "marketplace": marketplace,
+            "url": valid_url,
+            "price": price_value,
+            "currency": currency_value,
+            "success": True,
+            "error": None
+        }
+        
     except httpx.HTTPStatusError as e:
         detail = ""
         try:
@@ -3484,56 +3988,39 @@ def read_excel_products(excel_file: str) -> List[Dict]:
         else:
             logger.warning("EAN/SKU sütunu bulunamadı, sadece ürün adı ile arama yapılacak")
         
+        # Sütunlar satır satır değil, pandas ile toplu (vektörel) işlenir
         # Boş olmayan değerleri al ve string'e çevir
-        products = []
-        for idx, value in enumerate(first_column):
-            if pd.notna(value):  # NaN değilse
-                product_name = str(value).strip()
-                if product_name:  # Boş string değilse
-                    # MM Price'ı al
-                    mm_price = None
-                    if mm_price_column and mm_price_column in df.columns:
-                        mm_price_val = df.iloc[idx][mm_price_column]
-                        if pd.notna(mm_price_val):
-                            try:
-                                # Fiyatı sayıya çevir
-                                if isinstance(mm_price_val, (int, float)):
-                                    mm_price = float(mm_price_val)
-                                else:
-                                    # String ise temizle ve çevir
-                                    mm_price_str = str(mm_price_val).strip()
-                                    # TL, ₺, virgül, nokta gibi karakterleri temizle
-                                    mm_price_str = re.sub(r'[^\d.,]', '', mm_price_str)
-                                    # Türk formatı: 1.234,56 -> 1234.56
-                                    if '.' in mm_price_str and ',' in mm_price_str:
-                                        mm_price_str = mm_price_str.replace('.', '').replace(',', '.')
-                                    elif ',' in mm_price_str:
-                                        mm_price_str = mm_price_str.replace(',', '.')
-                                    mm_price = float(mm_price_str)
-                            except (ValueError, TypeError):
-                                mm_price = None
-                    
-                    # EAN'ı al
-                    ean = None
-                    if ean_column and ean_column in df.columns:
-                        ean_val = df.iloc[idx][ean_column]
-                        if pd.notna(ean_val):
-                            try:
-                                # EAN'ı string'e çevir ve temizle
-                                ean_str = str(ean_val).strip()
-                                # Float'tan gelen .0'ı temizle
-                                if '.' in ean_str:
-                                    ean_str = ean_str.split('.')[0]
-                                if ean_str and ean_str.lower() not in ['nan', 'none', '']:
-                                    ean = ean_str
-                            except:
-                                pass
-                    
-                    products.append({
-                        'product_name': product_name,
-                        'mm_price': mm_price,
-                        'ean': ean
-                    })
+        names = first_column.astype(str).str.strip()
+        valid = first_column.notna() & names.ne('')
+        
+        # MM Price'ı al: sayısal hücreler doğrudan, string'ler temizlenip çevrilir
+        if mm_price_column and mm_price_column in df.columns:
+            mm_values = df[mm_price_column]
+            numeric_mask = mm_values.map(lambda v: isinstance(v, (int, float)))
+            # TL, ₺, virgül, nokta gibi karakterleri temizle
+            mm_str = mm_values.astype(str).str.strip().str.replace(r'[^\d.,]', '', regex=True)
+            # Türk formatı: 1.234,56 -> 1234.56
+            turkish = mm_str.str.contains('.', regex=False) & mm_str.str.contains(',', regex=False)
+            mm_str = mm_str.where(~turkish, mm_str.str.replace('.', '', regex=False))
+            mm_str = mm_str.str.replace(',', '.', regex=False)
+            mm_prices = pd.to_numeric(mm_values.where(numeric_mask), errors='coerce')
+            mm_prices = mm_prices.where(numeric_mask, pd.to_numeric(mm_str, errors='coerce'))
+            mm_prices = mm_prices.astype(float).astype(object).where(mm_values.notna() & mm_prices.notna(), None)
+        else:
+            mm_prices = pd.Series([None] * len(df), index=df.index, dtype=object)
+        
+        # EAN'ı al (string'e çevir, float'tan gelen .0'ı temizle)
+        if ean_column and ean_column in df.columns:
+            ean_values = df[ean_column]
+            eans = ean_values.astype(str).str.strip().str.split('.', n=1).str[0]
+            eans = eans.where(ean_values.notna() & ~eans.str.lower().isin(['nan', 'none', '']), None)
+        else:
+            eans = pd.Series([None] * len(df), index=df.index, dtype=object)
+        
+        products = [
+            {'product_name': name, 'mm_price': mm_price, 'ean': ean}
+            for name, mm_price, ean in zip(names[valid].tolist(), mm_prices[valid].tolist(), eans[valid].tolist())
+        ]
         
         logger.info(f"Excel dosyasından {len(products)} ürün okundu")
         if mm_price_column:
@@ -3744,12 +4231,22 @@ async def process_excel_file(excel_file: str, selected_marketplace: str = None,
     # Eşzamanlı istek sayısını sınırla (semaphore kullanarak)
     semaphore = asyncio.Semaphore(1)  # Aynı anda maksimum 1 fiyat çekme işlemi (bot koruması için)
     
+    # Excel'de tekrar eden ürünler için başarılı sonuçlar: her benzersiz ürün/marketplace tek kez bulunur
+    # (başarısız aramalar saklanmaz; tekrar eden satır timeout/403 sonrası yeniden denenir)
+    search_results = {}
+    
     async def search_product_with_semaphore(product_name: str, marketplace: str, mm_price: float = None, ean: str = None):
         """Semaphore ile sınırlandırılmış arama"""
+        key = (product_name.lower(), marketplace, mm_price, ean)
+        if key in search_results:
+            return search_results[key]
         async with semaphore:
             # Rate limiting için bekleme
             await asyncio.sleep(0.3)
-            return await search_product(product_name, marketplace, mm_price, ean)
+            result = await search_product(product_name, marketplace, mm_price, ean)
+        if result.get('success'):
+            search_results[key] = result
+        return result
     
     # Sonuçları topla (yatay format için)
     all_results = []
@@ -4068,34 +4565,34 @@ async def extract_prices_from_excel_urls(excel_file: str) -> None:
             logger.warning("İşlenecek URL bulunamadı!")
             return
         
-        # Semaphore ile eşzamanlı istek sayısını sınırla (Hepsiburada için 1'e düşürüldü)
-        semaphore = asyncio.Semaphore(1)
+        # Eşzamanlı istekleri site bazında sınırla: aynı siteye aynı anda 1 istek
+        # (bot koruması için), farklı siteler paylaşılan HTTP client üzerinden paralel çalışır
+        site_extractors = [
+            (("trendyol.com",), "Trendyol", extract_price_from_trendyol),
+            (("hepsiburada.com",), "Hepsiburada", extract_price_from_hepsiburada),
+            (("teknosa.com",), "Teknosa", extract_price_from_teknosa),
+            (("amazon.com", "amazon.com.tr"), "Amazon", extract_price_from_amazon),
+        ]
+        site_semaphores = {}
         
         async def extract_price_for_url(row_idx: int, url: str) -> tuple:
             """Tek bir URL için fiyat çeker"""
+            # URL'den marketplace'i belirle
+            url_lower = url.lower()
+            for domains, site_name, extractor in site_extractors:
+                if any(domain in url_lower for domain in domains):
+                    break
+            else:
+                logger.warning(f"[{row_idx+1}] Desteklenmeyen marketplace: {url[:60]}...")
+                return (row_idx, None, "Unsupported marketplace")
+            
+            semaphore = site_semaphores.setdefault(site_name, asyncio.Semaphore(1))
             async with semaphore:
-                # Hepsiburada için daha uzun bekleme
+                # Aynı siteye ardışık istekler arasında bekleme
                 await asyncio.sleep(1.0)
                 
-                # URL'den marketplace'i belirle
-                url_lower = url.lower()
-                price_info = None
-                
-                if "trendyol.com" in url_lower:
-                    logger.info(f"[{row_idx+1}] Trendyol fiyat çekiliyor: {url[:60]}...")
-                    price_info = await extract_price_from_trendyol(url)
-                elif "hepsiburada.com" in url_lower:
-                    logger.info(f"[{row_idx+1}] Hepsiburada fiyat çekiliyor: {url[:60]}...")
-                    price_info = await extract_price_from_hepsiburada(url)
-                elif "teknosa.com" in url_lower:
-                    logger.info(f"[{row_idx+1}] Teknosa fiyat çekiliyor: {url[:60]}...")
-                    price_info = await extract_price_from_teknosa(url)
-                elif "amazon.com" in url_lower or "amazon.com.tr" in url_lower:
-                    logger.info(f"[{row_idx+1}] Amazon fiyat çekiliyor: {url[:60]}...")
-                    price_info = await extract_price_from_amazon(url)
-                else:
-                    logger.warning(f"[{row_idx+1}] Desteklenmeyen marketplace: {url[:60]}...")
-                    return (row_idx, None, "Unsupported marketplace")
+                logger.info(f"[{row_idx+1}] {site_name} fiyat çekiliyor: {url[:60]}...")
+                price_info = await extractor(url)
                 
                 if price_info and price_info.get("success"):
                     price = price_info.get("price")
@@ -4152,6 +4649,16 @@ async def extract_prices_from_excel_urls(excel_file: str) -> None:
         raise
 
 
+async def close_shared_resources():
+    """Paylaşılan HTTP client'ı, Playwright tarayıcısını ve Selenium driver'ı kapatır (eğer kullanıldıysa)"""
+    await close_http_client()
+    await close_playwright_browser()
+    try:
+        close_selenium_driver()
+    except:
+        pass
+
+
 async def main():
     """Ana fonksiyon"""
     import sys
@@ -4163,7 +4670,10 @@ async def main():
             logger.error(f"Excel dosyası bulunamadı: {excel_file}")
             return
         logger.info(f"Excel dosyasından URL'ler okunuyor: {excel_file}")
-        await extract_prices_from_excel_urls(excel_file)
+        try:
+            await extract_prices_from_excel_urls(excel_file)
+        finally:
+            await close_shared_resources()
         return
     
     # Marketplace seçimi (komut satırı argümanı)
@@ -4238,11 +4748,8 @@ async def main():
                 print(f"{i}. ❌ {product_name[:50]}... - Fiyat bulunamadı")
         print("="*80)
     
-    # Selenium driver'ı kapat (eğer kullanıldıysa)
-    try:
-        close_selenium_driver()
-    except:
-        pass
+    # Paylaşılan HTTP client'ı, Playwright tarayıcısını ve Selenium driver'ı kapat (eğer kullanıldıysa)
+    await close_shared_resources()
 
 
 if __name__ == "__main__":
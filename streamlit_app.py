@@ -9,13 +9,7 @@ import tempfile
 from pathlib import Path
 import pandas as pd
 
-import config
-from config import Settings
-import streamlit as st
-import config, streamlit as st
-
 import shutil
-import streamlit as st
 
 # ⚡ KRİTİK: UI'ı hemen render et (health check için)
 st.set_page_config(
@@ -87,7 +81,7 @@ if uploaded_file is not None:
         if st.button("🚀 İşlemi Başlat", type="primary", use_container_width=True):
             # ⚡ LAZY IMPORT: Sadece butona tıklandığında yükle
             try:
-                from process_excel import process_excel_file, save_results_to_excel
+                from process_excel import process_excel_file, save_results_to_excel, close_http_client, close_playwright_browser
                 from config import settings
                 import asyncio
                 
@@ -250,6 +244,8 @@ if uploaded_file is not None:
                 st.error(f"❌ Hata: {str(e)}")
                 st.exception(e)
             finally:
+                loop.run_until_complete(close_http_client())
+                loop.run_until_complete(close_playwright_browser())
                 loop.close()
     
     except Exception as e: